@@ -0,0 +1,547 @@
+"""
+AI İş Zamanlayıcısı - Rapor İsteklerinin Ortak Kuyruğu
+Arayüz ve toplu üretim isteklerini tek bir sınırlı worker havuzunda çalıştırır
+
+- Sınırlı havuz: aynı anda en fazla config.AI_MAX_CONCURRENT istek
+- Sağlayıcı başına hız sınırı (token bucket, dakikadaki istek)
+- Geçici hatalarda (kota, zaman aşımı) üstel geri çekilme + rastgele
+  sapma (full jitter) ile yeniden deneme - yanıt akmaya başladıysa
+  yeniden denenmez (arayüzde tekrar eden metin olmasın)
+- Aynı anda bekleyen/çalışan özdeş prompt'lar tek istekte birleşir; sonra
+  katılan abone o ana kadar gelen chunk'ları baştan alır
+- İptal bekleyen işi kuyruktan çıkarır, çalışan işin akışını (gRPC
+  çağrısı dahil) keser; birleşmiş işte son abone iptal edince istek durur
+- Öncelik: arayüz istekleri önce alınır, ama bekleyen toplu iş her
+  config.AI_BATCH_EVERY seçimde bir alınır ve toplu işler bir worker'ı
+  arayüz için boş bırakır; iki sınıf da birbirini aç bırakmaz
+
+Tamamlanan yanıtlar disk önbelleğine yazılır (model, üretim ayarları,
+prompt özeti); önbellekte olan prompt API'ye gitmeden yeniden oynatılır.
+"""
+
+import itertools
+import random
+import threading
+import time
+from collections import deque
+
+import config
+from analysis_cache import DiskCache, make_key
+from llm_backend import BackendError, CancelToken, get_backend, is_transient_error
+
+
+PRIORITY_INTERACTIVE = "interactive"
+PRIORITY_BATCH = "batch"
+
+# Yanıt bu uzunluktan kısaysa safety filter'a takılmış olabilir (önbelleğe alınmaz)
+MIN_RESPONSE_CHARS = 500
+
+_response_cache = None
+
+
+def get_response_cache():
+    """Paylaşılan AI yanıt önbelleğini döndürür (ilk çağrıda oluşturulur)"""
+    global _response_cache
+    if _response_cache is None:
+        _response_cache = DiskCache(
+            config.AI_RESPONSE_CACHE_DIR,
+            config.AI_RESPONSE_CACHE_MAX_MB * 1024 * 1024
+        )
+    return _response_cache
+
+
+def response_cache_key(model_name, generation_config, prompt_text):
+    """(model, üretim ayarları, prompt özeti) önbellek anahtarı"""
+    return make_key(
+        'gemini_response', model_name,
+        sorted(generation_config.items()),
+        make_key(prompt_text)
+    )
+
+
+def get_cached_response(key, ttl_s=None):
+    """
+    Önbellekteki yanıt parçalarını döndürür (yoksa ya da süresi dolduysa None)
+
+    Returns:
+        list: Yanıt chunk'ları
+    """
+    ttl_s = config.AI_RESPONSE_CACHE_TTL_S if ttl_s is None else ttl_s
+    entry = get_response_cache().get(key)
+    if not entry or time.time() - entry.get('created_at', 0) > ttl_s:
+        return None
+    return entry.get('chunks')
+
+
+def store_cached_response(key, model_name, chunks):
+    """Tamamlanan yanıtı önbelleğe yaz (hata akışı bozmaz)"""
+    try:
+        get_response_cache().set(key, {
+            'model': model_name,
+            'created_at': time.time(),
+            'chunks': chunks,
+        })
+    except (OSError, TypeError, ValueError) as e:
+        print(f"AI yanıt önbelleği yazma hatası: {e}")
+
+
+class TokenBucket:
+    """Dakikadaki istek sınırı - kısa patlamalara burst kadar izin verir"""
+
+    def __init__(self, per_minute, burst=None):
+        self.rate = per_minute / 60.0
+        self.capacity = float(burst or max(1, per_minute // 6))
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self, cancel):
+        """
+        Bir istek hakkı al - gerekirse bekler.
+
+        Returns:
+            bool: Hak alındı (False: beklerken iptal edildi)
+        """
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return True
+                wait = (1 - self.tokens) / self.rate
+            if cancel.wait(wait):
+                return False
+
+
+class AIJob:
+    """
+    Zamanlayıcıya gönderilen tek bir istek (abone tarafı).
+
+    Geri çağrılar worker thread'inden çağrılır; Qt arayüzü için
+    gemini_api_handler.GeminiWorker bunları sinyallere çevirir.
+    """
+
+    _ids = itertools.count(1)
+
+    def __init__(self, prompt_text, priority, on_status=None, on_chunk=None,
+                 on_complete=None, on_error=None, on_cancel=None):
+        self.id = next(self._ids)
+        self.prompt_text = prompt_text
+        self.priority = priority
+        self.on_status = on_status
+        self.on_chunk = on_chunk
+        self.on_complete = on_complete
+        self.on_error = on_error
+        self.on_cancel = on_cancel
+
+        self.backend = None  # submit() atar
+        self.state = "queued"  # queued, running, completed, error, cancelled
+        self._parts = []  # Gelen chunk'lar - metin tek seferde birleştirilir
+        self.chunk_count = 0
+        self.error = None
+        self.from_cache = False
+        self.deduplicated = False  # Özdeş bir işe abone oldu
+        self._done = threading.Event()
+        self._execution = None
+        self._scheduler = None
+
+        # Gecikme ölçümü (perf_counter) - kuyrukta bekleme dahil, kullanıcının gördüğü süre
+        self.submitted_at = time.perf_counter()
+        self.first_chunk_at = None
+        self.finished_at = None
+
+    @property
+    def done(self):
+        return self._done.is_set()
+
+    @property
+    def text(self):
+        """O ana kadar gelen yanıt metni"""
+        return "".join(self._parts)
+
+    @property
+    def timings(self):
+        """{'ttft_ms', 'total_ms', 'chunk_count'} - ttft_ms chunk gelmediyse None"""
+        def elapsed_ms(moment):
+            return None if moment is None else round((moment - self.submitted_at) * 1000, 1)
+        return {
+            'ttft_ms': elapsed_ms(self.first_chunk_at),
+            'total_ms': elapsed_ms(self.finished_at),
+            'chunk_count': self.chunk_count,
+        }
+
+    def wait(self, timeout=None):
+        """İş bitene kadar bekle; bittiyse True"""
+        return self._done.wait(timeout)
+
+    def cancel(self):
+        """İşi iptal et (bekliyorsa kuyruktan çıkar, çalışıyorsa akışı kes)"""
+        if self._scheduler is not None:
+            self._scheduler.cancel(self)
+
+    # --- Zamanlayıcı tarafından çağrılır ---
+
+    def _notify(self, callback, *args):
+        if callback is not None:
+            try:
+                callback(*args)
+            except Exception as e:
+                print(f"AI iş geri çağrısı hatası: {e}")
+
+    def _receive(self, chunk):
+        if self.first_chunk_at is None:
+            self.first_chunk_at = time.perf_counter()
+        self._parts.append(chunk)
+        self.chunk_count += 1
+        self._notify(self.on_chunk, chunk)
+
+    def _finish(self, state, callback, *args):
+        if self._done.is_set():
+            return
+        self.finished_at = time.perf_counter()
+        self.state = state
+        self._done.set()
+        self._notify(callback, *args)
+
+
+class _Execution:
+    """Bir prompt'un tek çalıştırılışı - özdeş işler aynı çalıştırmaya abone olur"""
+
+    def __init__(self, key, prompt_text, priority, backend, use_cache):
+        self.key = key
+        self.prompt_text = prompt_text
+        self.priority = priority
+        self.backend = backend
+        self.use_cache = use_cache
+        self.jobs = []
+        self.chunks = []
+        self.status = None
+        self.started = False
+        self.counted_batch = False  # Çalışan toplu iş sayacına dahil
+        self.cancel = CancelToken()
+        self.lock = threading.RLock()
+
+    def attach(self, job):
+        """Aboneyi ekle - o ana kadarki chunk'lar baştan gönderilir"""
+        with self.lock:
+            job._execution = self
+            if self.status:
+                job._notify(job.on_status, self.status)
+            for chunk in self.chunks:
+                job._receive(chunk)
+            self.jobs.append(job)
+
+    def detach(self, job):
+        """Aboneyi çıkar; başka abone kalmadıysa True"""
+        with self.lock:
+            if job in self.jobs:
+                self.jobs.remove(job)
+            return not self.jobs
+
+    def subscribers(self):
+        with self.lock:
+            return list(self.jobs)
+
+    def emit_status(self, text):
+        with self.lock:
+            self.status = text
+            for job in self.jobs:
+                job._notify(job.on_status, text)
+
+    def emit_chunk(self, chunk):
+        with self.lock:
+            self.chunks.append(chunk)
+            for job in self.jobs:
+                job._receive(chunk)
+
+
+class AIScheduler:
+    """Sınırlı havuzlu, hız sınırlı, yeniden denemeli AI iş kuyruğu"""
+
+    def __init__(self, max_workers=None, rate_limits=None, max_retries=None,
+                 backoff_base_s=None, backoff_max_s=None, batch_every=None,
+                 reserve_interactive=True):
+        """
+        Args:
+            reserve_interactive (bool): Toplu işler bir worker'ı arayüz için
+                boş bırakır (sadece toplu iş çalıştıran komut satırı aracı kapatır)
+        """
+        self.max_workers = max_workers or config.AI_MAX_CONCURRENT
+        self.rate_limits = config.AI_RATE_LIMITS if rate_limits is None else rate_limits
+        self.max_retries = config.AI_MAX_RETRIES if max_retries is None else max_retries
+        self.backoff_base_s = backoff_base_s or config.AI_BACKOFF_BASE_S
+        self.backoff_max_s = backoff_max_s or config.AI_BACKOFF_MAX_S
+        self.batch_every = batch_every or config.AI_BATCH_EVERY
+        self.reserve_interactive = reserve_interactive
+
+        self._cond = threading.Condition()
+        self._queues = {PRIORITY_INTERACTIVE: deque(), PRIORITY_BATCH: deque()}
+        self._inflight = {}  # Anahtar -> _Execution (bekleyen ya da çalışan)
+        self._running_batch = 0
+        self._interactive_streak = 0
+        self._buckets = {}
+        self._workers = []  # İlk istekte başlatılır
+        self._stopping = False
+
+    # --- Genel arayüz ---
+
+    def submit(self, prompt_text, priority=PRIORITY_INTERACTIVE, backend=None,
+               use_cache=True, **callbacks):
+        """
+        İsteği kuyruğa ekle.
+
+        Args:
+            prompt_text (str): Prompt
+            priority (str): PRIORITY_INTERACTIVE veya PRIORITY_BATCH
+            backend (LLMBackend): Arka uç (varsayılan llm_backend.get_backend())
+            use_cache (bool): Yanıt önbelleği kullanılsın mı
+            **callbacks: on_status(metin), on_chunk(metin), on_complete(iş),
+                on_error(mesaj), on_cancel()
+
+        Returns:
+            AIJob: İptal edilebilir, beklenebilir iş
+        """
+        backend = backend or get_backend()
+        key = make_key(backend.name, response_cache_key(
+            backend.model_name, backend.generation_config, prompt_text
+        ))
+        job = AIJob(prompt_text, priority, **callbacks)
+        job.backend = backend
+        job._scheduler = self
+
+        with self._cond:
+            if self._stopping:
+                raise RuntimeError("AI zamanlayıcısı kapatıldı")
+
+            execution = self._inflight.get(key)
+            if execution is not None and not execution.cancel.cancelled:
+                job.deduplicated = True
+                # Arayüz isteği bekleyen toplu işe katıldıysa öne alınır
+                if priority == PRIORITY_INTERACTIVE and execution.priority == PRIORITY_BATCH:
+                    queue = self._queues[PRIORITY_BATCH]
+                    if execution in queue:
+                        queue.remove(execution)
+                        execution.priority = PRIORITY_INTERACTIVE
+                        self._queues[PRIORITY_INTERACTIVE].append(execution)
+            else:
+                execution = _Execution(key, prompt_text, priority, backend,
+                                       use_cache and config.AI_RESPONSE_CACHE_ENABLED)
+                self._inflight[key] = execution
+                self._queues[priority].append(execution)
+                self._start_workers()
+            execution.attach(job)
+            if execution.started:
+                job.state = "running"
+            self._cond.notify()
+        return job
+
+    def cancel(self, job):
+        """İşi iptal et - birleşmiş işte sadece bu abone ayrılır"""
+        execution = job._execution
+        if execution is None or job.done:
+            return
+
+        with self._cond:
+            last = execution.detach(job)
+            if last:
+                # Bekliyorsa kuyruktan çıkar; çalışıyorsa akışı kes
+                for queue in self._queues.values():
+                    if execution in queue:
+                        queue.remove(execution)
+                if self._inflight.get(execution.key) is execution:
+                    del self._inflight[execution.key]
+        if last:
+            execution.cancel.cancel()
+        job._finish("cancelled", job.on_cancel)
+
+    def pending_count(self):
+        """Kuyrukta bekleyen (başlamamış) istek sayısı"""
+        with self._cond:
+            return sum(len(queue) for queue in self._queues.values())
+
+    def shutdown(self, wait=True, timeout=5):
+        """Tüm işleri iptal et ve worker'ları durdur"""
+        with self._cond:
+            self._stopping = True
+            executions = list(self._inflight.values())
+            self._cond.notify_all()
+        for execution in executions:
+            for job in execution.subscribers():
+                self.cancel(job)
+        if wait:
+            for worker in self._workers:
+                worker.join(timeout)
+
+    # --- Worker havuzu ---
+
+    def _start_workers(self):
+        """Havuzu ilk istekte başlat (boştaki worker koşul değişkeninde bekler)"""
+        while len(self._workers) < self.max_workers:
+            worker = threading.Thread(
+                target=self._worker_loop, name=f"ai_worker_{len(self._workers) + 1}", daemon=True
+            )
+            self._workers.append(worker)
+            worker.start()
+
+    def _next_execution(self):
+        """
+        Sıradaki iş (kilit altında çağrılır). Arayüz önce gelir; ama her
+        batch_every seçimde bir bekleyen toplu iş alınır. Toplu işler tüm
+        worker'ları dolduramaz - biri arayüz için boş kalır.
+        """
+        interactive = self._queues[PRIORITY_INTERACTIVE]
+        batch = self._queues[PRIORITY_BATCH]
+        batch_allowed = batch and (
+            not self.reserve_interactive or self.max_workers == 1
+            or self._running_batch < self.max_workers - 1
+        )
+
+        if interactive and (not batch_allowed or self._interactive_streak < self.batch_every - 1):
+            self._interactive_streak += 1
+            return interactive.popleft()
+        if batch_allowed:
+            self._interactive_streak = 0
+            self._running_batch += 1
+            execution = batch.popleft()
+            execution.counted_batch = True
+            return execution
+        return None
+
+    def _worker_loop(self):
+        while True:
+            with self._cond:
+                execution = None
+                while not self._stopping:
+                    execution = self._next_execution()
+                    if execution is not None:
+                        break
+                    self._cond.wait()
+                if execution is None:
+                    return
+                execution.started = True
+
+            try:
+                self._run(execution)
+            except Exception as e:
+                self._fail(execution, f"Hata oluştu: {str(e)}")
+            finally:
+                with self._cond:
+                    if execution.counted_batch:
+                        self._running_batch -= 1
+                    if self._inflight.get(execution.key) is execution:
+                        del self._inflight[execution.key]
+                    self._cond.notify_all()
+
+    def _bucket(self, backend):
+        limit = self.rate_limits.get(backend.name)
+        if not limit:
+            return None
+        with self._cond:
+            bucket = self._buckets.get(backend.name)
+            if bucket is None:
+                bucket = self._buckets[backend.name] = TokenBucket(limit)
+            return bucket
+
+    # --- Bir isteğin çalıştırılması ---
+
+    def _run(self, execution):
+        for job in execution.subscribers():
+            job.state = "running"
+        backend = execution.backend
+        cache_key = response_cache_key(backend.model_name, backend.generation_config,
+                                       execution.prompt_text)
+
+        # Aynı prompt daha önce yanıtlandıysa API'ye gitmeden yeniden oynat
+        if execution.use_cache:
+            chunks = get_cached_response(cache_key)
+            if chunks is not None:
+                execution.emit_status("Önbellekteki yanıt yükleniyor...")
+                for chunk in chunks:
+                    if execution.cancel.cancelled:
+                        return
+                    execution.emit_chunk(chunk)
+                total = sum(len(chunk) for chunk in chunks)
+                print(f"♻️ AI yanıtı önbellekten alındı: {len(chunks)} chunk, {total} karakter")
+                execution.emit_status(f"Tamamlandı (önbellekten)! {len(chunks)} chunk, {total} karakter")
+                self._complete(execution, from_cache=True)
+                return
+
+        attempt = 0
+        while True:
+            bucket = self._bucket(backend)
+            if bucket is not None:
+                execution.emit_status("Hız sınırı için sıra bekleniyor...")
+                if not bucket.acquire(execution.cancel):
+                    return
+
+            try:
+                # İstemci ilk istekte bir kez kurulur, sonrakiler yeniden kullanır
+                execution.emit_status("Model hazırlanıyor...")
+                backend.prepare()
+                execution.emit_status("Yanıt bekleniyor...")
+                for chunk in backend.stream(execution.prompt_text, execution.cancel):
+                    if execution.cancel.cancelled:
+                        return
+                    execution.emit_chunk(chunk)
+                break
+
+            except Exception as e:
+                if execution.cancel.cancelled:
+                    return
+                # Akış başladıysa yeniden deneme metni tekrarlar - hata olarak bildir
+                if execution.chunks or not is_transient_error(e) or attempt >= self.max_retries:
+                    message = str(e) if isinstance(e, BackendError) else f"Hata oluştu: {str(e)}"
+                    self._fail(execution, message)
+                    return
+
+                # Üstel geri çekilme, full jitter
+                delay = random.uniform(0, min(self.backoff_max_s, self.backoff_base_s * 2 ** attempt))
+                attempt += 1
+                print(f"AI geçici hata ({e}) - {delay:.1f} sn sonra yeniden denenecek "
+                      f"({attempt}/{self.max_retries})")
+                execution.emit_status(
+                    f"Geçici hata, {delay:.1f} sn sonra yeniden deneniyor ({attempt}/{self.max_retries})"
+                )
+                if execution.cancel.wait(delay):
+                    return
+
+        if execution.cancel.cancelled:
+            return
+
+        full_response = "".join(execution.chunks)
+        execution.emit_status(f"Tamamlandı! {len(execution.chunks)} chunk, {len(full_response)} karakter")
+        if execution.use_cache and len(full_response) >= MIN_RESPONSE_CHARS:
+            store_cached_response(cache_key, backend.model_name, execution.chunks)
+        self._complete(execution)
+
+        # Yanıt çok kısaysa uyarı
+        if len(full_response) < MIN_RESPONSE_CHARS:
+            for job in execution.subscribers():
+                job._notify(job.on_error,
+                            "⚠️ UYARI: Yanıt beklenenden çok kısa! "
+                            "Prompt safety filter'a takılmış olabilir.")
+
+    def _complete(self, execution, from_cache=False):
+        for job in execution.subscribers():
+            job.from_cache = from_cache
+            job._finish("completed", job.on_complete, job)
+
+    def _fail(self, execution, message):
+        for job in execution.subscribers():
+            job.error = message
+            job._finish("error", job.on_error, message)
+
+
+_scheduler = None
+_scheduler_lock = threading.Lock()
+
+
+def get_scheduler():
+    """Paylaşılan AI zamanlayıcısını döndürür (ilk çağrıda oluşturulur)"""
+    global _scheduler
+    with _scheduler_lock:
+        if _scheduler is None:
+            _scheduler = AIScheduler()
+        return _scheduler
@@ -0,0 +1,169 @@
+"""
+Analiz Sonuçları Önbelleği - İçerik Adresli
+Aynı girdi verisi ve aynı algoritma sürümü için analizi tekrar çalıştırmaz
+
+Anahtar = SHA-256(analiz adı + algoritma sürümü + girdi dosyalarının içerik özeti).
+Sonuçlar diskte JSON olarak tutulur; toplam boyut sınırı aşılınca en az
+kullanılan kayıtlar (LRU) silinir. Algoritma sürümü değişince anahtar da
+değiştiğinden eski kayıtlar kendiliğinden geçersiz olur.
+"""
+
+import functools
+import hashlib
+import json
+import os
+import threading
+
+import config
+
+
+def file_digest(path, chunk_size=1 << 16):
+    """Dosya içeriğinin SHA-256 özetini döndürür"""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(chunk_size), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def make_key(*parts):
+    """Parçalardan kararlı bir önbellek anahtarı üretir"""
+    digest = hashlib.sha256()
+    for part in parts:
+        digest.update(str(part).encode('utf-8'))
+        digest.update(b'\x00')
+    return digest.hexdigest()
+
+
+class DiskCache:
+    """Boyutu sınırlı, LRU tahliyeli JSON disk önbelleği"""
+
+    def __init__(self, cache_dir, max_bytes):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+
+        # Klasör oluştur
+        if not os.path.exists(cache_dir):
+            os.makedirs(cache_dir)
+
+    def _path(self, key):
+        return os.path.join(self.cache_dir, f"{key}.json")
+
+    def get(self, key):
+        """Kayıt varsa değeri döndürür ve LRU sırasını tazeler, yoksa None"""
+        path = self._path(key)
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                value = json.load(f)
+        except (FileNotFoundError, ValueError):
+            return None
+
+        # Son kullanım zamanı = mtime
+        try:
+            os.utime(path, None)
+        except OSError:
+            pass
+        return value
+
+    def set(self, key, value):
+        """Değeri atomik olarak yazar, gerekirse eski kayıtları tahliye eder"""
+        path = self._path(key)
+        # Aynı anahtara eşzamanlı yazan thread'ler ayrı geçici dosya kullanır
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(value, f, ensure_ascii=False)
+        os.replace(tmp_path, path)
+        self._evict()
+
+    def _evict(self):
+        """Toplam boyut sınırın altına inene kadar en eski kayıtları sil"""
+        entries = []
+        total = 0
+        with os.scandir(self.cache_dir) as it:
+            for entry in it:
+                if not entry.name.endswith('.json'):
+                    continue
+                stat = entry.stat()
+                entries.append((stat.st_mtime, stat.st_size, entry.path))
+                total += stat.st_size
+
+        if total <= self.max_bytes:
+            return
+
+        entries.sort()
+        for _, size, path in entries:
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+                total -= size
+            except OSError:
+                pass
+
+    def clear(self):
+        """Tüm kayıtları sil"""
+        with os.scandir(self.cache_dir) as it:
+            for entry in it:
+                if entry.name.endswith('.json'):
+                    os.remove(entry.path)
+
+
+_analysis_cache = None
+
+
+def get_analysis_cache():
+    """Paylaşılan analiz önbelleğini döndürür (ilk çağrıda oluşturulur)"""
+    global _analysis_cache
+    if _analysis_cache is None:
+        _analysis_cache = DiskCache(
+            config.ANALYSIS_CACHE_DIR,
+            config.ANALYSIS_CACHE_MAX_MB * 1024 * 1024
+        )
+    return _analysis_cache
+
+
+def memoize_analysis(name, version):
+    """
+    CSV yolu alan analiz fonksiyonlarını içerik adresli önbelleğe bağlar.
+
+    Sarılan fonksiyon use_cache=False ile çağrılırsa önbellek atlanır.
+    Diğer anahtar kelime argümanları sonucu değiştirmemelidir; anahtara
+    dahil edilmeden fonksiyona aktarılır.
+    Girdi dosyalarından biri okunamazsa (ör. bulunamadı) fonksiyon doğrudan
+    çalışır ve sonuç önbelleğe yazılmaz. Sadece başarılı sonuçlar ('status':
+    'success') saklanır; geçici hatalar (kilitli/yarım yazılmış CSV) bir
+    sonraki çağrıda yeniden denenir.
+
+    Args:
+        name (str): Analiz adı (anahtarın parçası)
+        version (str): Algoritma sürümü (anahtarın parçası)
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*csv_paths, use_cache=True, **kwargs):
+            if not (use_cache and config.ANALYSIS_CACHE_ENABLED):
+                return func(*csv_paths, **kwargs)
+
+            try:
+                digests = [file_digest(path) for path in csv_paths]
+            except OSError:
+                return func(*csv_paths, **kwargs)
+
+            cache = get_analysis_cache()
+            key = make_key(name, version, *digests)
+
+            cached = cache.get(key)
+            if cached is not None:
+                return cached
+
+            result = func(*csv_paths, **kwargs)
+            if not (isinstance(result, dict) and result.get('status') == 'success'):
+                return result
+            try:
+                cache.set(key, result)
+            except (OSError, TypeError, ValueError) as e:
+                print(f"Analiz önbelleği yazma hatası: {e}")
+            return result
+
+        return wrapper
+    return decorator
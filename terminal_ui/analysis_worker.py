@@ -0,0 +1,104 @@
+"""
+Seans Sonu Analiz Worker'ı
+Sinyal işleme, JSON kaydı ve AI prompt hazırlığını arka planda yapar
+
+Tüm modüller tamamlandığında çalışan zincir (CSV okuma, FFT, regresyon,
+JSON yazımı, prompt oluşturma) UI thread'ini dondurmasın diye bu thread'de
+yürütülür. Her aşamanın süresi ölçülür ve sonuçla birlikte döndürülür.
+"""
+
+import time
+
+from PyQt6.QtCore import QThread, pyqtSignal
+
+
+class AnalysisWorker(QThread):
+    """Seans sonu analiz zincirini arka planda çalıştıran worker thread"""
+
+    # Signaller
+    progress = pyqtSignal(int, str)  # Yüzde, aşama açıklaması
+    completed = pyqtSignal(dict, str, str, dict)  # Sonuçlar, JSON yolu, AI prompt, aşama süreleri (ms)
+    cancelled = pyqtSignal()  # Kullanıcı iptal etti
+    error_occurred = pyqtSignal(str)  # Hata oluştu
+
+    def __init__(self, files, output_dir="analysis_results", patient_id=""):
+        """
+        Args:
+            files (dict): {'A': csv, 'B': csv, 'C': csv} - DataLogger.get_files()
+            output_dir (str): Sonuç JSON klasörü
+            patient_id (str): Sonuca eklenecek hasta kimliği
+        """
+        super().__init__()
+        self.files = files
+        self.output_dir = output_dir
+        self.patient_id = patient_id
+        self.should_stop = False
+        self.timings = {}
+
+    def _stage(self, name, func, *args, **kwargs):
+        """Bir aşamayı çalıştır ve süresini (ms) kaydet"""
+        start = time.perf_counter()
+        result = func(*args, **kwargs)
+        self.timings[name] = round((time.perf_counter() - start) * 1000, 1)
+        return result
+
+    def _import_processing(self):
+        """Ağır kütüphaneleri (pandas, scipy, sklearn) ilk kullanımda yükle"""
+        import signal_processor
+        return signal_processor
+
+    def run(self):
+        """Thread ana fonksiyonu"""
+        total_start = time.perf_counter()
+        try:
+            self.progress.emit(5, "Analiz kütüphaneleri yükleniyor...")
+            processor = self._stage('import', self._import_processing)
+            if self.should_stop:
+                self.cancelled.emit()
+                return
+
+            self.progress.emit(20, "Modüller analiz ediliyor...")
+            results = self._stage(
+                'analysis', processor.process_all_modules,
+                self.files['A'], self.files['B'], self.files['C']
+            )
+            if self.should_stop:
+                self.cancelled.emit()
+                return
+
+            results['patient_id'] = self.patient_id
+            
+            self.progress.emit(70, "Sonuçlar kaydediliyor...")
+            # Kayıt dönüşü olmayan noktadır: JSON yazılıp seans indeksine ve
+            # trend deposuna eklendikten sonra iptal yok sayılır, iş tamamlanır
+            saved_file = self._stage(
+                'save', processor.save_results_to_file, results, self.output_dir
+            )
+
+            self.progress.emit(90, "AI prompt'u hazırlanıyor...")
+            prompt_text = self._stage('prompt', processor.create_prompt_from_results, results)
+
+            self.timings['total'] = round((time.perf_counter() - total_start) * 1000, 1)
+            self.progress.emit(100, "Analiz tamamlandı")
+            self.completed.emit(results, saved_file, prompt_text, dict(self.timings))
+
+        except Exception as e:
+            self.error_occurred.emit(f"Analiz hatası: {str(e)}")
+
+    def cancel(self):
+        """Worker'ı iptal et (kayıttan önceki aşama sınırında durur, sonrasında etkisiz)"""
+        self.should_stop = True
+
+
+def format_timings(timings):
+    """Aşama sürelerini tek satırlık özet metne dönüştürür"""
+    labels = {
+        'import': 'yükleme',
+        'analysis': 'analiz',
+        'save': 'kayıt',
+        'prompt': 'prompt',
+        'total': 'toplam',
+    }
+    return ", ".join(
+        f"{labels.get(name, name)} {value:.0f} ms" for name, value in timings.items()
+    )
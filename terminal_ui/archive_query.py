@@ -0,0 +1,262 @@
+"""
+Arşiv Aralık Sorguları - Kayıtlı Seansların Sunucu Tarafı Seyreltmesi
+Bir seansın modül sinyalinden zaman aralığı seçip LTTB ile istenen nokta
+sayısına indirir
+
+- Seans CSV'leri (test_data/module_X_<seans>.csv ya da sürekli izleme
+  parçaları continuous_data/module_X_<seans>/chunk_*.csv) ilk sorguda bir
+  kez ikili .npy dosyasına çevrilir; sonraki açılışlar memmap ile yapılır ve
+  sadece istenen aralığın sayfaları okunur
+- Aralık searchsorted ile bulunur, LTTB'nin maliyeti istenen nokta
+  sayısıyla sınırlıdır; 10 saniyelik ve 1 saatlik kayıtta gezinme aynı
+  hissettirir
+- Sonuçlar (seans, modül, aralık, çözünürlük) anahtarıyla bellekte LRU
+  olarak tutulur; kaynak dosya değişirse anahtar da değişir
+
+Canlı web paneli /api/range ve /api/sessions uç noktalarıyla bu modülü sunar.
+"""
+
+import glob
+import os
+import re
+import threading
+import warnings
+from collections import OrderedDict
+
+import numpy as np
+
+import config
+from analysis_cache import make_key
+from decimation import lttb
+
+
+_MODULES = ('A', 'B', 'C')
+_SESSION_PATTERN = re.compile(r"^module_([ABC])_(\d{8}_\d{6})(\.csv)?$")
+_SESSION_ID_PATTERN = re.compile(r"\d{8}_\d{6}")  # YYYYAAGG_SSDDss
+
+
+class _LRU:
+    """Thread-safe, boyutu sınırlı bellek önbelleği"""
+
+    def __init__(self, max_items):
+        self.max_items = max_items
+        self._items = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            if key not in self._items:
+                return None
+            self._items.move_to_end(key)
+            return self._items[key]
+
+    def set(self, key, value):
+        with self._lock:
+            self._items[key] = value
+            self._items.move_to_end(key)
+            while len(self._items) > self.max_items:
+                self._items.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._items.clear()
+
+
+_signal_cache = _LRU(config.ARCHIVE_SIGNAL_CACHE_SIZE)  # İmza -> (x, y) memmap
+_query_cache = _LRU(config.ARCHIVE_QUERY_CACHE_SIZE)  # Sorgu anahtarı -> sonuç
+
+
+def list_sessions(test_dir="test_data", continuous_dir=None):
+    """
+    Arşivdeki seansları listeler.
+
+    Returns:
+        list: [{'session_id', 'module', 'kind'}] - kind: 'test' ya da 'continuous',
+              en yeni seans önce
+    """
+    continuous_dir = continuous_dir or config.CONTINUOUS_SAVE_DIR
+    sessions = []
+    for directory, kind in ((test_dir, 'test'), (continuous_dir, 'continuous')):
+        if not os.path.isdir(directory):
+            continue
+        for entry in os.scandir(directory):
+            match = _SESSION_PATTERN.match(entry.name)
+            if not match:
+                continue
+            is_csv = match.group(3) is not None
+            if (kind == 'test') != (is_csv and entry.is_file()):
+                continue
+            sessions.append({
+                'session_id': match.group(2),
+                'module': match.group(1),
+                'kind': kind,
+            })
+    sessions.sort(key=lambda s: (s['session_id'], s['module']), reverse=True)
+    return sessions
+
+
+def is_valid_session_id(session_id):
+    """Seans kimliği tam olarak YYYYAAGG_SSDDss mi (yol ayırıcı, '..' vb. içeremez)"""
+    return isinstance(session_id, str) and _SESSION_ID_PATTERN.fullmatch(session_id) is not None
+
+
+def find_session_files(session_id, module, test_dir="test_data", continuous_dir=None):
+    """
+    Seansın modül CSV dosyaları (önce test kaydı, yoksa sürekli izleme parçaları).
+
+    Kimlik dosya yoluna girdiğinden geçersiz kimlik/modülde dosya sistemine
+    hiç bakılmaz.
+
+    Returns:
+        list: Zaman sıralı CSV yolları (bulunamazsa ya da kimlik geçersizse boş)
+    """
+    if not is_valid_session_id(session_id) or module not in _MODULES:
+        return []
+    continuous_dir = continuous_dir or config.CONTINUOUS_SAVE_DIR
+    path = os.path.join(test_dir, f"module_{module}_{session_id}.csv")
+    if os.path.isfile(path):
+        return [path]
+    session_dir = os.path.join(continuous_dir, f"module_{module}_{session_id}")
+    return sorted(glob.glob(os.path.join(session_dir, "chunk_*.csv")))
+
+
+def _signature(paths):
+    """Dosyaların (yol, mtime, boyut) imzası - içerik okunmadan değişiklik tespiti"""
+    parts = []
+    for path in paths:
+        stat = os.stat(path)
+        parts.append((os.path.abspath(path), stat.st_mtime_ns, stat.st_size))
+    return make_key('archive', *parts)
+
+
+def _read_csv(path):
+    """İki sütunlu CSV'yi (başlık satırı atlanır) (n, 2) diziye okur"""
+    with warnings.catch_warnings():
+        # Sadece başlık içeren (boş) dosyalar
+        warnings.simplefilter("ignore", UserWarning)
+        data = np.loadtxt(path, delimiter=',', skiprows=1, ndmin=2, encoding='utf-8')
+    return data.reshape(-1, 2) if data.size else np.empty((0, 2))
+
+
+def _evict_binary_cache(cache_dir, max_bytes):
+    """Toplam boyut sınırı aşılınca en eski .npy dosyalarını sil"""
+    entries = []
+    with os.scandir(cache_dir) as it:
+        for entry in it:
+            if entry.name.endswith('.npy'):
+                stat = entry.stat()
+                entries.append((stat.st_mtime, stat.st_size, entry.path))
+    total = sum(size for _, size, _ in entries)
+    for _, size, path in sorted(entries):
+        if total <= max_bytes:
+            break
+        try:
+            os.remove(path)
+            total -= size
+        except OSError:
+            pass
+
+
+def load_signal(paths):
+    """
+    Seans dosyalarının sinyalini döndürür (ikili önbellek üzerinden).
+
+    Args:
+        paths (list): find_session_files çıktısı
+
+    Returns:
+        tuple: (x, y, signature) - x artan sıralı zaman (Modül C'de deneme no)
+    """
+    signature = _signature(paths)
+    cached = _signal_cache.get(signature)
+    if cached is not None:
+        return cached[0], cached[1], signature
+
+    cache_dir = config.ARCHIVE_CACHE_DIR
+    binary_path = os.path.join(cache_dir, f"{signature}.npy")
+    try:
+        data = np.load(binary_path, mmap_mode='r')
+        os.utime(binary_path, None)
+    except (OSError, ValueError):
+        data = np.concatenate([_read_csv(path) for path in paths]) if paths else np.empty((0, 2))
+        # Parçalar sırayla yazılır; yine de aralık araması sıralı x ister
+        data = data[np.argsort(data[:, 0], kind='stable')]
+        try:
+            os.makedirs(cache_dir, exist_ok=True)
+            tmp_path = f"{binary_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+            with open(tmp_path, 'wb') as f:
+                np.save(f, np.ascontiguousarray(data.T))
+            os.replace(tmp_path, binary_path)
+            _evict_binary_cache(cache_dir, config.ARCHIVE_CACHE_MAX_MB * 1024 * 1024)
+        except OSError as e:
+            print(f"Arşiv önbelleği yazma hatası: {e}")
+        data = data.T
+
+    x, y = data[0], data[1]
+    _signal_cache.set(signature, (x, y))
+    return x, y, signature
+
+
+def query_range(session_id, module, start=None, end=None, points=None,
+                test_dir="test_data", continuous_dir=None):
+    """
+    Seansın modül sinyalinden [start, end] aralığını LTTB ile seyreltilmiş döndürür.
+
+    Args:
+        session_id (str): Seans kimliği (YYYYAAGG_SSDDss)
+        module (str): 'A', 'B' veya 'C'
+        start (float): Aralık başı (None = kaydın başı)
+        end (float): Aralık sonu (None = kaydın sonu)
+        points (int): İstenen en fazla nokta (varsayılan config.ARCHIVE_DEFAULT_POINTS)
+
+    Returns:
+        dict: {'status', 'session_id', 'module', 'time', 'values',
+               'total_points', 'range_points', 'record_start', 'record_end'} ya da
+              {'status': 'error', 'error_message'}
+    """
+    if module not in _MODULES:
+        return {'status': 'error', 'error_message': f"Bilinmeyen modül: {module}"}
+    if not is_valid_session_id(session_id):
+        return {'status': 'error', 'error_message': f"Geçersiz seans kimliği: {session_id!r}"}
+
+    points = int(points or config.ARCHIVE_DEFAULT_POINTS)
+    points = max(3, min(points, config.ARCHIVE_MAX_POINTS))
+
+    paths = find_session_files(session_id, module, test_dir, continuous_dir)
+    if not paths:
+        return {'status': 'error', 'error_message': f"Seans bulunamadı: {session_id} (Modül {module})"}
+
+    try:
+        x, y, signature = load_signal(paths)
+    except (OSError, ValueError) as e:
+        return {'status': 'error', 'error_message': f"Seans okunamadı: {str(e)}"}
+
+    key = (signature, start, end, points)
+    cached = _query_cache.get(key)
+    if cached is not None:
+        return cached
+
+    lo = 0 if start is None else int(np.searchsorted(x, start, side='left'))
+    hi = len(x) if end is None else int(np.searchsorted(x, end, side='right'))
+    hi = max(lo, hi)
+
+    xs, ys = lttb(x[lo:hi], y[lo:hi], points)
+    result = {
+        'status': 'success',
+        'session_id': session_id,
+        'module': module,
+        'time': [round(float(v), 3) for v in xs],
+        'values': [round(float(v), 3) for v in ys],
+        'total_points': int(len(x)),
+        'range_points': int(hi - lo),
+        'record_start': float(x[0]) if len(x) else None,
+        'record_end': float(x[-1]) if len(x) else None,
+    }
+    _query_cache.set(key, result)
+    return result
+
+
+def clear_caches():
+    """Bellek önbelleklerini boşalt (ikili dosyalar diskte kalır)"""
+    _signal_cache.clear()
+    _query_cache.clear()
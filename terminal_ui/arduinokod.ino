@@ -9,6 +9,8 @@
 // - System 1: Runs for 10 seconds (reads LDR, controls LED)
 // - System 2: Runs for 10 seconds (measures distance, capped at 300mm)
 // - System 3: Runs until 20 correct button presses (reaction time game)
+// - Continuous mode: '4' / '5' run System 1 / System 2 without a time
+//   limit until '0' is received (long-session monitoring)
 // - All systems: Non-blocking timing with millis()
 // - Returns to Listening Mode after completing task
 // - LCD Display: I2C 16x2 with countdown and system-specific displays
@@ -95,6 +97,7 @@ char incomingByte = 0;               // Stores incoming serial data
 boolean system1Initialized = false;  // Flag to track System 1 initialization
 boolean system2Initialized = false;  // Flag to track System 2 initialization
 boolean system3Initialized = false;  // Flag to track System 3 initialization
+boolean continuousMode = false;      // System 1/2 streams until '0' is received
 
 // =====================================================
 // FORWARD DECLARATIONS
@@ -104,6 +107,7 @@ void displayColor(int colorCode);
 void system1_Execute();
 void system2_Execute();
 void system3_Execute();
+void stopContinuousMode();
 
 // =====================================================
 // LCD & COUNTDOWN VARIABLES
@@ -180,6 +184,8 @@ void setup() {
   Serial.println("'1' - Activate System 1 (LDR-LED)");
   Serial.println("'2' - Activate System 2 (Distance)");
   Serial.println("'3' - Activate System 3 (Game)");
+  Serial.println("'4' - System 1 continuous ('0' stops)");
+  Serial.println("'5' - System 2 continuous ('0' stops)");
   Serial.println("====================================");
   
   // Display welcome on LCD
@@ -194,10 +200,17 @@ void loop() {
   if (Serial.available() > 0) {
     char command = Serial.read();    // Read incoming byte
 
+    // '0' stops a continuous-mode system at any time
+    if (command == '0' && continuousMode && (activeSystem == '1' || activeSystem == '2' || countdownActive)) {
+      stopContinuousMode();
+      return;
+    }
+
     // Process the command only if in Listening Mode
     if (activeSystem == '0') {
       switch (command) {
         case '1':
+          continuousMode = false;
           countdownSystem = '1';
           countdownActive = true;
           countdownStartTime = millis();
@@ -207,6 +220,7 @@ void loop() {
           break;
    
         case '2':
+          continuousMode = false;
           countdownSystem = '2';
           countdownActive = true;
           countdownStartTime = millis();
@@ -216,6 +230,7 @@ void loop() {
           break;
 
         case '3':
+          continuousMode = false;
           countdownSystem = '3';
           countdownActive = true;
           countdownStartTime = millis();
@@ -223,13 +238,35 @@ void loop() {
           activeSystem = '0';  // Stay in listening mode during countdown
           Serial.println("\n>>> Countdown Starting for System 3 <<<");
           break;
+
+        case '4':
+          // Continuous System 1 (LDR) - no time limit
+          continuousMode = true;
+          countdownSystem = '1';
+          countdownActive = true;
+          countdownStartTime = millis();
+          countdownValue = 3;
+          activeSystem = '0';
+          Serial.println("\n>>> Countdown Starting for System 1 (Continuous) <<<");
+          break;
+
+        case '5':
+          // Continuous System 2 (Distance) - no time limit
+          continuousMode = true;
+          countdownSystem = '2';
+          countdownActive = true;
+          countdownStartTime = millis();
+          countdownValue = 3;
+          activeSystem = '0';
+          Serial.println("\n>>> Countdown Starting for System 2 (Continuous) <<<");
+          break;
           
         default:
           // Invalid command
           if (command != '\n' && command != '\r') {
             Serial.print("Invalid command: '");
             Serial.print((char)command);
-            Serial.println("'. Use '1', '2', or '3'.");
+            Serial.println("'. Use '1'-'5' ('0' stops continuous mode).");
           }
           break;
       }
@@ -337,8 +374,8 @@ void system1_Execute() {
   unsigned long elapsedTime = currentTime - system1StartTime;
   unsigned long remainingTime = (elapsedTime >= SYSTEM_1_DURATION) ? 0 : (SYSTEM_1_DURATION - elapsedTime);
   
-  // CHECK IF SYSTEM 1 DURATION LIMIT REACHED (10 seconds)
-  if (elapsedTime >= SYSTEM_1_DURATION) {
+  // CHECK IF SYSTEM 1 DURATION LIMIT REACHED (10 seconds, not in continuous mode)
+  if (!continuousMode && elapsedTime >= SYSTEM_1_DURATION) {
     // System 1 has completed - return to Listening Mode
     analogWrite(LED_PIN, 0);  // Turn off LED
     Serial.println("--------------------------------------");
@@ -389,7 +426,7 @@ void system1_Execute() {
     lcd.print(currentLDRValue);
     lcd.setCursor(0, 1);
     lcd.print("Time:");
-    lcd.print(remainingTime / 1000);
+    lcd.print((continuousMode ? elapsedTime : remainingTime) / 1000);  // Continuous: elapsed
     lcd.print("s");
     
     // ===== STEP 5: Print Data to Serial Monitor =====
@@ -410,8 +447,8 @@ void system2_Execute() {
   unsigned long elapsedTime = currentTime - system2StartTime;
   unsigned long remainingTime = (elapsedTime >= SYSTEM_2_DURATION) ? 0 : (SYSTEM_2_DURATION - elapsedTime);
   
-  // CHECK IF SYSTEM 2 DURATION LIMIT REACHED (10 seconds)
-  if (elapsedTime >= SYSTEM_2_DURATION) {
+  // CHECK IF SYSTEM 2 DURATION LIMIT REACHED (10 seconds, not in continuous mode)
+  if (!continuousMode && elapsedTime >= SYSTEM_2_DURATION) {
     // System 2 has completed - return to Listening Mode
     Serial.println("------------------------------");
     Serial.println(">>> System 2 Finished (10 seconds elapsed) <<<");
@@ -477,7 +514,7 @@ void system2_Execute() {
     lcd.print("mm");
     lcd.setCursor(0, 1);
     lcd.print("Time:");
-    lcd.print(remainingTime / 1000);
+    lcd.print((continuousMode ? elapsedTime : remainingTime) / 1000);  // Continuous: elapsed
     lcd.print("s");
     
     // ===== STEP 6: Print Data to Serial Monitor =====
@@ -669,6 +706,29 @@ void displayColor(int colorCode) {
   }
 }
 
+// =====================================================
+// CONTINUOUS MODE STOP - Return System 1/2 to Listening Mode
+// =====================================================
+void stopContinuousMode() {
+  analogWrite(LED_PIN, 0);  // Turn off System 1 LED
+  Serial.println("--------------------------------------");
+  Serial.println(">>> Continuous Monitoring Stopped <<<");
+  Serial.println(">>> LISTENING MODE <<<");
+  Serial.println("Send '1'-'5' to activate a system");
+  Serial.println("====================================\n");
+
+  activeSystem = '0';
+  countdownActive = false;
+  countdownSystem = '0';
+  continuousMode = false;
+  system1Initialized = false;
+  system2Initialized = false;
+  lastReadTime = 0;
+  lastSystem2ReadTime = 0;
+  listeningModeDisplayed = false;
+  displayListeningMode();
+}
+
 // =====================================================
 // HELPER FUNCTION - Display Listening Mode on LCD
 // =====================================================
@@ -0,0 +1,78 @@
+"""
+Performans Ölçümleri - pytest-benchmark
+
+Bağımlılıklar: pip install -r requirements-dev.txt
+
+terminal_ui klasöründen çalıştırılır:
+
+    python -m pytest                                              # varsayılan boyutlar
+    python -m pytest benchmarks --bench-sizes 10,1000,1000000     # 10 örnekten milyonlara
+    python -m pytest benchmarks --benchmark-compare --benchmark-compare-fail=mean:15%
+
+(--bench-sizes bu conftest'te tanımlıdır; kullanılırken klasör adı verilmelidir.)
+
+Her çalıştırmanın sonuçları benchmarks/results altına JSON olarak kaydedilir
+(--benchmark-autosave, pytest.ini); --benchmark-compare son kayıtla
+karşılaştırır ve eşik aşılırsa çalıştırma başarısız olur. Ölçümler
+synthetic_data üretecinin bilinen parametreli seanslarıyla yapılır; analiz
+önbelleği kapatılır, her tur gerçek hesaplamayı ölçer.
+"""
+
+import os
+
+import pytest
+
+import config
+import synthetic_data
+
+
+DEFAULT_SIZES = "100,10000,100000"
+TREMOR_HZ = 4.0
+SEED = 1
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--bench-sizes", default=DEFAULT_SIZES,
+        help=f"Modül başına örnek sayıları, virgülle (varsayılan: {DEFAULT_SIZES})"
+    )
+
+
+def pytest_generate_tests(metafunc):
+    if "samples" in metafunc.fixturenames:
+        sizes = [int(size) for size in metafunc.config.getoption("--bench-sizes").split(",")]
+        metafunc.parametrize("samples", sizes, ids=[f"n={size}" for size in sizes])
+
+
+@pytest.fixture(scope="session", autouse=True)
+def bench_workdir(tmp_path_factory):
+    """Geçici çalışma klasörü, analiz önbelleği kapalı"""
+    previous_dir = os.getcwd()
+    previous_cache = config.ANALYSIS_CACHE_ENABLED
+    os.chdir(tmp_path_factory.mktemp("bench"))
+    config.ANALYSIS_CACHE_ENABLED = False
+    yield
+    config.ANALYSIS_CACHE_ENABLED = previous_cache
+    os.chdir(previous_dir)
+
+
+@pytest.fixture(scope="session")
+def _sessions(tmp_path_factory):
+    """Boyut -> seans dosyaları (her boyut bir kez yazılır)"""
+    root = tmp_path_factory.mktemp("sessions")
+    cache = {}
+
+    def get(samples):
+        if samples not in cache:
+            cache[samples] = synthetic_data.write_session(
+                str(root), samples=samples, trials=samples, tremor_hz=TREMOR_HZ,
+                seed=SEED, session_id=f"bench_{samples}"
+            )
+        return cache[samples]
+    return get
+
+
+@pytest.fixture
+def session_files(_sessions, samples):
+    """Bu boyuttaki sentetik seansın CSV yolları ({'A', 'B', 'C'})"""
+    return _sessions(samples)
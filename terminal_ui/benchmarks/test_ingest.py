@@ -0,0 +1,48 @@
+"""Veri alım yolu: seri satır ayrıştırıcı ve DataLogger yazma hızı"""
+
+import pytest
+
+import synthetic_data
+from conftest import SEED
+from data_logger import DataLogger
+from serial_protocol import EVENT_SAMPLE, parse_line
+
+
+LINES_PER_ROUND = 10000
+ROWS_PER_ROUND = 1000
+
+
+def _module_data(module, n):
+    if module == 'A':
+        return synthetic_data.tremor_signal(n, seed=SEED)
+    if module == 'B':
+        return synthetic_data.distance_signal(n, seed=SEED)
+    return synthetic_data.reaction_times(n, seed=SEED)
+
+
+@pytest.mark.benchmark(group="parse_line")
+@pytest.mark.parametrize("module", ["A", "B", "C"])
+def test_parse_line(benchmark, module):
+    lines = synthetic_data.serial_lines(module, *_module_data(module, LINES_PER_ROUND))
+    benchmark.extra_info['lines_per_round'] = len(lines)
+
+    events = benchmark(lambda: [parse_line(line) for line in lines])
+    assert all(event[0] == EVENT_SAMPLE and event[1] == module for event in events)
+
+
+@pytest.mark.benchmark(group="data_logger")
+@pytest.mark.parametrize("module", ["A", "B", "C"])
+def test_data_logger_throughput(benchmark, tmp_path, module):
+    logger = DataLogger(str(tmp_path))
+    log = {'A': logger.log_module_a, 'B': logger.log_module_b, 'C': logger.log_module_c}[module]
+    x, y = _module_data(module, ROWS_PER_ROUND)
+    rows = list(zip(x.tolist(), y.tolist()))
+    benchmark.extra_info['rows_per_round'] = len(rows)
+
+    def write_rows():
+        for row in rows:
+            log(*row)
+
+    benchmark(write_rows)
+    with open(logger.get_files()[module], encoding='utf-8') as f:
+        assert sum(1 for _ in f) > len(rows)
@@ -0,0 +1,52 @@
+"""signal_processor analizlerinin süreleri (CSV okuma dahil ve sadece hesaplama)"""
+
+import pytest
+
+import signal_processor
+import synthetic_data
+from conftest import SEED, TREMOR_HZ
+
+
+@pytest.mark.benchmark(group="analyze_tremor")
+def test_analyze_tremor(benchmark, session_files, samples):
+    result = benchmark(signal_processor.analyze_tremor, session_files['A'], use_cache=False)
+    assert result['status'] == 'success'
+    if samples >= 100:
+        assert result['dominant_frequency_hz'] == pytest.approx(TREMOR_HZ, abs=0.2)
+
+
+@pytest.mark.benchmark(group="compute_tremor_metrics")
+def test_compute_tremor_metrics(benchmark, samples):
+    time, ldr = synthetic_data.tremor_signal(samples, frequency_hz=TREMOR_HZ, seed=SEED)
+    result = benchmark(signal_processor.compute_tremor_metrics, time, ldr)
+    assert result['status'] == 'success'
+
+
+@pytest.mark.benchmark(group="analyze_bradykinesia")
+def test_analyze_bradykinesia(benchmark, session_files):
+    result = benchmark(signal_processor.analyze_bradykinesia, session_files['B'], use_cache=False)
+    assert result['status'] == 'success'
+
+
+@pytest.mark.benchmark(group="compute_bradykinesia_metrics")
+def test_compute_bradykinesia_metrics(benchmark, samples):
+    time, distance = synthetic_data.distance_signal(samples, seed=SEED)
+    result = benchmark(signal_processor.compute_bradykinesia_metrics, time, distance)
+    assert result['status'] == 'success'
+
+
+@pytest.mark.benchmark(group="analyze_coordination")
+def test_analyze_coordination(benchmark, session_files):
+    result = benchmark(signal_processor.analyze_coordination, session_files['C'], use_cache=False)
+    assert result['status'] == 'success'
+    assert result['fatigue_index'] > 1.0
+
+
+@pytest.mark.benchmark(group="process_all_modules")
+@pytest.mark.parametrize("executor", ["serial", "thread"])
+def test_process_all_modules(benchmark, session_files, executor):
+    result = benchmark(
+        signal_processor.process_all_modules,
+        session_files['A'], session_files['B'], session_files['C'], executor=executor
+    )
+    assert result['overall_status'] == 'success'
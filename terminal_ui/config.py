@@ -11,9 +11,101 @@ MODULE_A_DURATION = 10  # saniye
 MODULE_B_DURATION = 10  # saniye  
 MODULE_C_MAX_PRESSES = 20  # adet
 
+# Sürekli İzleme (uzun seans, Modül A/B)
+CONTINUOUS_WINDOW_S = 30  # Analiz penceresi (saniye)
+CONTINUOUS_MIN_WINDOW_SAMPLES = 10  # Bundan az örnekli pencere analiz edilmez
+CONTINUOUS_SAVE_DIR = "continuous_data"
+
 # Sampling
 SAMPLE_INTERVAL_MS = 100  # 10 Hz
 
+# Yeniden Örnekleme (FFT öncesi)
+RESAMPLE_RATE_HZ = 1000 / SAMPLE_INTERVAL_MS  # Düzgün ızgara hızı
+RESAMPLE_GAP_FACTOR = 2.5  # Nominal aralığın bu katından uzun boşluk = kopukluk
+
+# Açılış
+PREWARM_ENABLED = True  # İlk boyamadan sonra ağır modülleri arka planda yükle
+PREWARM_MODULES = ["signal_processor", "google.generativeai"]
+
+# Profil (main.py --profile[=sample] ya da TERMINAL_UI_PROFILE; kapalıyken hiçbir kanca kurulmaz)
+PROFILE_DIR = "profiles"  # Profil dosyaları ve sıcak nokta özetleri
+PROFILE_SAMPLE_INTERVAL_MS = 5  # Örnekleyici profil: tüm thread'lerin yığın örnekleme aralığı
+PROFILE_TRACEMALLOC_FRAMES = 1  # Bellek ayırma başına tutulan çağrı derinliği (fazlası yavaşlatır)
+PROFILE_TOP = 25  # Özette listelenecek fonksiyon / bellek satırı sayısı
+
+# Analiz Önbelleği
+ANALYSIS_CACHE_ENABLED = True
+ANALYSIS_CACHE_DIR = "cache/analysis"
+ANALYSIS_CACHE_MAX_MB = 50  # LRU tahliye sınırı
+
+# LLM Arka Ucu
+LLM_BACKEND = "gemini"  # "gemini" ya da "local" (çevrimdışı sahte yanıt); LLM_BACKEND çevre değişkeni öncelikli
+GEMINI_MODEL = "gemini-2.5-flash"
+LOCAL_LLM_TTFT_S = 0.8  # Yerel arka uç: ilk chunk'a kadar bekleme
+LOCAL_LLM_CHARS_PER_S = 600  # Yerel arka uç: akış hızı (karakter/s)
+LOCAL_LLM_CHUNK_CHARS = 40  # Yerel arka uç: chunk boyutu
+
+# AI İş Kuyruğu
+AI_MAX_CONCURRENT = 3  # Aynı anda çalışan en fazla AI isteği
+AI_RATE_LIMITS = {"gemini": 10}  # Sağlayıcı başına dakikadaki istek (listede olmayan sınırsız)
+AI_MAX_RETRIES = 4  # Geçici hatalarda (kota, zaman aşımı) yeniden deneme
+AI_BACKOFF_BASE_S = 1.0  # Üstel geri çekilme başlangıcı (rastgele sapmalı)
+AI_BACKOFF_MAX_S = 30.0  # Geri çekilme üst sınırı
+AI_BATCH_EVERY = 3  # İkisi de beklerken her N seçimde bir toplu iş alınır
+AI_BATCH_CONCURRENCY = 4  # Toplu rapor aracında (send_to_gemini.py) aynı anda üretilen rapor
+
+# AI Yanıt Önbelleği
+AI_RESPONSE_CACHE_ENABLED = True  # Aynı prompt tekrar gönderilmez, yanıt diskten oynatılır
+AI_RESPONSE_CACHE_DIR = "cache/ai_responses"
+AI_RESPONSE_CACHE_MAX_MB = 20  # LRU tahliye sınırı
+AI_RESPONSE_CACHE_TTL_S = 7 * 24 * 3600  # Bu süreden eski yanıtlar yeniden istenir
+
+# Geçmiş Analiz Prompt'u
+HISTORICAL_PROMPT_TOKEN_BUDGET = 6000  # Toplam prompt için yaklaşık token sınırı
+HISTORICAL_RECENT_SESSIONS = 5  # Olduğu gibi yazılan en yeni seans sayısı
+HISTORICAL_PERIOD = "week"  # Eski seansların özet dönemi: "week" veya "month"
+HISTORICAL_CHARS_PER_TOKEN = 3.5  # Token tahmini (Türkçe metin için kaba oran)
+HISTORY_CACHE_FILE = "cache/history_cache.sqlite"  # Seans bölümleri ve dönem özetleri
+
+# Modül Analizi Eşzamanlılığı
+ANALYSIS_EXECUTOR = "thread"  # "thread", "process" veya "serial" (sıralı)
+ANALYSIS_MAX_WORKERS = 3  # Modül A, B, C aynı anda
+
+# Seans Tarayıcısı
+SESSION_INDEX_FILE = "session_index.sqlite"  # Sonuç klasörü içinde
+SESSION_BROWSER_PAGE_SIZE = 200  # Tabloya kaydırdıkça eklenen satır sayısı
+TREND_ROLLING_WINDOW = 5  # Trend hareketli ortalama/std penceresi (seans)
+
+# AI Rapor Arşivi
+AI_REPORT_DB_FILE = "ai_reports.sqlite"  # Raporlar ve tam metin indeksi (sonuç klasörü içinde)
+AI_REPORT_SEARCH_LIMIT = 100  # Arama sonucunda listelenen en fazla rapor
+
+# Canlı Web Paneli (web_interface.html + SSE)
+LIVE_SERVER_ENABLED = False  # True ya da main.py --live-server ile açılır
+LIVE_SERVER_HOST = "127.0.0.1"  # Tabletlerden izlemek için "0.0.0.0"
+LIVE_SERVER_PORT = 8765
+LIVE_PUSH_HZ = 10  # İzleyicilere saniyedeki yayın sayısı (örnekleme hızından bağımsız)
+LIVE_MAX_POINTS_PER_PUSH = 200  # Yayın başına modül başına en fazla nokta
+LIVE_CLIENT_QUEUE = 50  # İzleyici başına bekleyen mesaj sınırı (dolunca en eski atılır)
+LIVE_HISTORY_POINTS = 2000  # Yeni izleyiciye gönderilen son örnekler (modül başına)
+LIVE_KEEPALIVE_S = 15  # Boşta bağlantı canlı tutma aralığı
+
+# Arşiv Aralık Sorguları (/api/range, LTTB seyreltme)
+ARCHIVE_CACHE_DIR = "cache/archive"  # CSV'lerin ikili (.npy) kopyaları
+ARCHIVE_CACHE_MAX_MB = 200  # LRU tahliye sınırı
+ARCHIVE_SIGNAL_CACHE_SIZE = 8  # Bellekte açık tutulan seans sinyali sayısı
+ARCHIVE_QUERY_CACHE_SIZE = 256  # Bellekte tutulan sorgu sonucu sayısı
+ARCHIVE_DEFAULT_POINTS = 1000  # İstek nokta sayısı belirtmezse
+ARCHIVE_MAX_POINTS = 10000  # Tek yanıttaki en fazla nokta
+
 # UI
+PLOT_BUFFER_CAPACITY = 100_000  # Modül başına grafikte tutulan en fazla örnek
+PLOT_BUFFER_INITIAL_CAPACITY = 1024  # Dolunca iki katına çıkar
+PLOT_FPS = 30  # Grafik yenileme hızı (örnekleme hızından bağımsız)
+PLOT_MIN_FPS = 5  # Yük altında düşülebilecek en düşük FPS
+PLOT_FRAME_BUDGET = 0.5  # Kare aralığının çizime ayrılabilecek oranı
+PLOT_MAX_POINTS = 4000  # Modül A/B grafiklerinde çizilecek en fazla nokta (min/max seyreltme)
+PLOT_DECIMATION_FACTOR = 4  # Seyreltme seviyeleri arası kova büyüme katsayısı
+AI_STREAM_FPS = 15  # AI yanıt akışında saniyedeki en fazla metin güncellemesi
 WINDOW_WIDTH = 1400
 WINDOW_HEIGHT = 900
@@ -0,0 +1,150 @@
+"""
+Sürekli İzleme Modu - Uzun Seans
+Firmware'in sonsuz akışını sabit pencerelere bölüp artımlı analiz eder
+
+Her pencere kapandığında:
+- Ham örnekler pencere başına ayrı bir CSV parçasına (chunk) yazılır
+- Pencere Modül A/B çekirdeğiyle analiz edilir (arka plan thread'inde)
+- Pencere metrikleri metrics.jsonl dosyasına eklenir
+
+Bellekte sadece açık pencerenin örnekleri tutulur; grafik tamponları
+RingBuffer kapasitesiyle sınırlı olduğundan saatlerce süren kayıtlarda da
+bellek kullanımı sabit kalır.
+"""
+
+import csv
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+
+from PyQt6.QtCore import QObject, pyqtSignal
+
+import config
+
+
+# Modül -> (CSV başlığı, değer formatı)
+_MODULE_COLUMNS = {
+    'A': (['Zaman (s)', 'LDR Değeri'], "{:.0f}"),
+    'B': (['Zaman (s)', 'Mesafe (mm)'], "{:.1f}"),
+}
+
+
+def analyze_window(module, time, values):
+    """
+    Tek bir pencereyi analiz eder.
+
+    Args:
+        module (str): 'A' (tremor) veya 'B' (bradikinezi)
+        time (list): Zaman damgaları (s)
+        values (list): Ölçüm değerleri
+
+    Returns:
+        dict: Modül çekirdeğinin metrikleri ya da hata bilgisi
+    """
+    # Ağır kütüphaneler (pandas, scipy, sklearn) ilk pencerede yüklenir
+    from signal_processor import compute_tremor_metrics, compute_bradykinesia_metrics
+
+    try:
+        if module == 'A':
+            return compute_tremor_metrics(time, values)
+        return compute_bradykinesia_metrics(time, values)
+    except Exception as e:
+        return {'status': 'error', 'error_message': str(e)}
+
+
+class ContinuousSession(QObject):
+    """Sürekli izleme oturumu - pencereli artımlı analiz ve kayıt"""
+
+    # Signals - pencere analizi bitince (arka plan thread'inden) UI'a
+    window_analyzed = pyqtSignal(str, dict)  # modül, pencere sonucu
+
+    def __init__(self, module, window_s=None, save_dir=None):
+        super().__init__()
+        if module not in _MODULE_COLUMNS:
+            raise ValueError(f"Sürekli mod sadece Modül A/B için geçerli: {module}")
+
+        self.module = module
+        self.window_s = window_s or config.CONTINUOUS_WINDOW_S
+        self.session_id = datetime.now().strftime("%Y%m%d_%H%M%S")
+        self.session_dir = os.path.join(
+            save_dir or config.CONTINUOUS_SAVE_DIR,
+            f"module_{module}_{self.session_id}"
+        )
+        self.metrics_path = os.path.join(self.session_dir, "metrics.jsonl")
+
+        # Klasör oluştur
+        os.makedirs(self.session_dir, exist_ok=True)
+
+        self.window_index = 0
+        self.window_start = None
+        self._time = []
+        self._values = []
+
+        # Pencere analizi ve diske yazma sırayla, UI thread'i dışında yapılır
+        self._executor = ThreadPoolExecutor(max_workers=1)
+
+    def add_sample(self, time_s, value):
+        """Örnek ekle; pencere sınırı aşıldıysa önceki pencereyi kapat"""
+        if self.window_start is None:
+            self.window_start = time_s
+
+        if time_s >= self.window_start + self.window_s:
+            self._close_window()
+            # Uzun kopukluklarda boş pencereleri atla
+            elapsed_windows = int((time_s - self.window_start) // self.window_s)
+            self.window_start += elapsed_windows * self.window_s
+
+        self._time.append(time_s)
+        self._values.append(value)
+
+    def finish(self, wait=True):
+        """Açık pencereyi kapat; wait=True ise bekleyen analizlerin bitmesini bekle"""
+        self._close_window()
+        self._executor.shutdown(wait=wait)
+
+    def _close_window(self):
+        """Açık pencereyi arka plana devret, bellekteki listeleri sıfırla"""
+        if not self._time:
+            return
+
+        time, values = self._time, self._values
+        self._time, self._values = [], []
+
+        index = self.window_index
+        self.window_index += 1
+        self._executor.submit(self._process_window, index, self.window_start, time, values)
+
+    def _process_window(self, index, window_start, time, values):
+        """Arka plan: ham parçayı yaz, analiz et, metrikleri kaydet"""
+        try:
+            chunk_path = os.path.join(self.session_dir, f"chunk_{index:05d}.csv")
+            header, value_format = _MODULE_COLUMNS[self.module]
+            with open(chunk_path, 'w', newline='', encoding='utf-8') as f:
+                writer = csv.writer(f)
+                writer.writerow(header)
+                writer.writerows(
+                    [f"{t:.3f}", value_format.format(v)] for t, v in zip(time, values)
+                )
+
+            if len(time) >= config.CONTINUOUS_MIN_WINDOW_SAMPLES:
+                metrics = analyze_window(self.module, time, values)
+            else:
+                metrics = {'status': 'error', 'error_message': 'Pencerede yeterli örnek yok'}
+
+            record = {
+                'window_index': index,
+                'window_start_s': round(window_start, 3),
+                'window_end_s': round(window_start + self.window_s, 3),
+                'sample_count': len(time),
+                'chunk_file': os.path.basename(chunk_path),
+                'analysis_datetime': datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+                **metrics
+            }
+            with open(self.metrics_path, 'a', encoding='utf-8') as f:
+                f.write(json.dumps(record, ensure_ascii=False) + "\n")
+
+            self.window_analyzed.emit(self.module, record)
+
+        except Exception as e:
+            print(f"Sürekli izleme pencere hatası: {e}")
@@ -0,0 +1,214 @@
+"""
+Min/Max Seyreltme (Decimation) - Uzun Süreli Grafikler
+Kayıt süresinden bağımsız olarak en fazla birkaç bin nokta çizer
+
+Ham veri tamponunun üzerinde çok çözünürlüklü bir zarf piramidi tutulur:
+her seviye sabit boyutlu kovaların (bucket) min ve max noktalarını saklar.
+Yeni örnekler geldikçe sadece tamamlanan kovalar hesaplanır (artımlı).
+Çizimde görünür aralığa göre en uygun seviye seçilir; her kovanın min ve
+max noktası çizildiği için ani sıçramalar (spike) kaybolmaz. Yakınlaştırınca
+görünür ham nokta sayısı sınırın altına inerse ham veri çizilir.
+"""
+
+import numpy as np
+
+import config
+from ring_buffer import RingBuffer
+
+
+# Seviye tamponu sütunları
+_X_START, _X_FIRST, _Y_FIRST, _X_SECOND, _Y_SECOND = range(5)
+
+
+class MinMaxDecimator:
+    """RingBuffer üzerinde artımlı min/max zarf piramidi"""
+
+    def __init__(self, source, max_points=None, factor=None):
+        """
+        Args:
+            source (RingBuffer): (zaman, değer) ham veri tamponu
+            max_points (int): Çizilecek en fazla nokta sayısı
+            factor (int): Seviyeler arası kova büyüme katsayısı
+        """
+        self.source = source
+        self.max_points = max_points or config.PLOT_MAX_POINTS
+        self.factor = factor or config.PLOT_DECIMATION_FACTOR
+
+        # Kapasitenin tamamı bile max_points'e sığacak kadar seviye oluştur
+        self.bucket_sizes = []
+        bucket = self.factor
+        while True:
+            self.bucket_sizes.append(bucket)
+            if 2 * source.max_capacity / bucket <= self.max_points:
+                break
+            bucket *= self.factor
+
+        self.levels = [
+            RingBuffer(source.max_capacity // size + 2, columns=5, initial_capacity=64)
+            for size in self.bucket_sizes
+        ]
+        self._next_index = [0] * len(self.levels)  # Seviye başına işlenmemiş ilk mutlak indeks
+        self._generation = source.generation
+
+    def reset(self):
+        """Piramidi boşalt"""
+        for level in self.levels:
+            level.clear()
+        self._next_index = [0] * len(self.levels)
+        self._generation = self.source.generation
+
+    def update(self):
+        """Kaynağa eklenen yeni örneklerden tamamlanan kovaları hesapla"""
+        if self.source.generation != self._generation:
+            # Kaynak temizlenmiş
+            self.reset()
+
+        total = self.source.total
+
+        size = len(self.source)
+        if size == 0:
+            return
+
+        x, y = self.source.columns()
+        oldest = total - size  # Tampondaki ilk örneğin mutlak indeksi
+
+        for level_index, bucket in enumerate(self.bucket_sizes):
+            start = self._next_index[level_index]
+            if start < oldest:
+                # Hiç işlenmeden tahliye edilmiş örnekler - hizalı indeksten devam et
+                start = -(-oldest // bucket) * bucket
+
+            n_buckets = (total - start) // bucket
+            if n_buckets <= 0:
+                self._next_index[level_index] = start
+                continue
+
+            lo = start - oldest
+            hi = lo + n_buckets * bucket
+            xs = x[lo:hi].reshape(n_buckets, bucket)
+            ys = y[lo:hi].reshape(n_buckets, bucket)
+
+            rows = np.arange(n_buckets)
+            i_min = ys.argmin(axis=1)
+            i_max = ys.argmax(axis=1)
+            first = np.minimum(i_min, i_max)
+            second = np.maximum(i_min, i_max)
+
+            self.levels[level_index].extend([
+                xs[:, 0],
+                xs[rows, first], ys[rows, first],
+                xs[rows, second], ys[rows, second],
+            ])
+            self._next_index[level_index] = start + n_buckets * bucket
+
+    def select(self, x_range=None):
+        """
+        Görünür aralık için çizilecek (x, y) dizilerini döndürür.
+
+        Args:
+            x_range (tuple): (x_min, x_max) görünür aralık, None ise tüm veri
+
+        Returns:
+            tuple: (x, y) - ham dilim ya da min/max zarfı
+        """
+        self.update()
+
+        x, y = self.source.columns()
+        if len(x) == 0:
+            return x, y
+
+        if x_range is None:
+            lo, hi = 0, len(x)
+        else:
+            # Kenarlarda birer nokta pay bırak (çizgi görünüm dışına uzansın)
+            lo = max(0, int(np.searchsorted(x, x_range[0], side='left')) - 1)
+            hi = min(len(x), int(np.searchsorted(x, x_range[1], side='right')) + 1)
+
+        visible = hi - lo
+        if visible <= self.max_points:
+            return x[lo:hi], y[lo:hi]
+
+        # En ince yeterli seviye
+        level_index = len(self.bucket_sizes) - 1
+        for index, bucket in enumerate(self.bucket_sizes):
+            if 2 * visible / bucket <= self.max_points:
+                level_index = index
+                break
+
+        columns = self.levels[level_index].view()
+        if columns.shape[1] == 0:
+            return x[lo:hi], y[lo:hi]
+
+        bucket_start = columns[_X_START]
+        b_lo = max(0, int(np.searchsorted(bucket_start, x[lo], side='right')) - 1)
+        # Ham tampondan tahliye edilmiş verinin kovalarını atla
+        b_lo = max(b_lo, int(np.searchsorted(bucket_start, x[0], side='left')))
+        b_hi = int(np.searchsorted(bucket_start, x[hi - 1], side='right'))
+        selected = columns[:, b_lo:b_hi]
+
+        env_x = np.empty(2 * selected.shape[1])
+        env_y = np.empty(2 * selected.shape[1])
+        env_x[0::2] = selected[_X_FIRST]
+        env_x[1::2] = selected[_X_SECOND]
+        env_y[0::2] = selected[_Y_FIRST]
+        env_y[1::2] = selected[_Y_SECOND]
+
+        # Henüz kovası tamamlanmamış en yeni örnekler ham olarak eklenir
+        tail_start = self._next_index[level_index] - (self.source.total - len(x))
+        tail_start = max(tail_start, lo)
+        if tail_start < hi:
+            env_x = np.concatenate([env_x, x[tail_start:hi]])
+            env_y = np.concatenate([env_y, y[tail_start:hi]])
+
+        return env_x, env_y
+
+
+def lttb(x, y, n_out):
+    """
+    Largest-Triangle-Three-Buckets seyreltmesi (arşiv/uzak görüntüleme için).
+
+    İlk ve son nokta korunur; aradaki her kovadan, bir önceki seçilen nokta
+    ve sonraki kovanın ortalamasıyla en büyük üçgeni oluşturan nokta seçilir.
+    Döngü kova sayısı kadar döner, kova içi hesap vektöreldir; bu yüzden
+    maliyet kayıt uzunluğundan çok istenen nokta sayısına bağlıdır.
+
+    Args:
+        x (np.ndarray): Artan sıralı x (zaman) değerleri
+        y (np.ndarray): y değerleri
+        n_out (int): İstenen nokta sayısı
+
+    Returns:
+        tuple: (x, y) seyreltilmiş diziler
+    """
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    n = len(x)
+    if n_out >= n or n <= 2:
+        return x, y
+    if n_out < 3:
+        return x[[0, -1]], y[[0, -1]]
+
+    every = (n - 2) / (n_out - 2)
+    indices = np.empty(n_out, dtype=np.int64)
+    indices[0] = 0
+    a = 0
+
+    for i in range(n_out - 2):
+        # Sonraki kovanın ortalaması (üçgenin üçüncü köşesi)
+        avg_start = int((i + 1) * every) + 1
+        avg_end = min(int((i + 2) * every) + 1, n)
+        avg_x = x[avg_start:avg_end].mean()
+        avg_y = y[avg_start:avg_end].mean()
+
+        # Bu kovada en büyük üçgeni oluşturan nokta
+        start = int(i * every) + 1
+        end = int((i + 1) * every) + 1
+        area = np.abs(
+            (x[a] - avg_x) * (y[start:end] - y[a])
+            - (x[a] - x[start:end]) * (avg_y - y[a])
+        )
+        a = start + int(area.argmax())
+        indices[i + 1] = a
+
+    indices[-1] = n - 1
+    return x[indices], y[indices]
@@ -1,13 +1,21 @@
 """
 Gemini API Handler
 En yeni prompt dosyasını bulup Gemini API'ye gönderen modül
+
+İstekler ai_scheduler kuyruğu üzerinden llm_backend arka ucuyla yapılır
+(Gemini ya da çevrimdışı yerel yanıtlayıcı). Kuyruk eşzamanlılık ve hız
+sınırını, geçici hatalarda yeniden denemeyi, özdeş istekleri birleştirmeyi
+ve yanıt önbelleğini yönetir; GeminiWorker sonuçları arayüze Qt sinyalleri
+olarak iletir ve tamamlanan raporu arşive (report_store) kaydeder.
 """
 
 import os
 import glob
 from datetime import datetime
-from PyQt6.QtCore import QThread, pyqtSignal
-import google.generativeai as genai
+from PyQt6.QtCore import QObject, pyqtSignal
+
+from ai_scheduler import MIN_RESPONSE_CHARS, PRIORITY_INTERACTIVE, get_scheduler
+from report_store import save_job_report
 
 
 def get_latest_analysis_json(directory="analysis_results"):
@@ -91,123 +99,93 @@ def get_all_analysis_json_files(directory="analysis_results"):
         return []
 
 
-class GeminiWorker(QThread):
+class GeminiWorker(QObject):
     """
-    Gemini API çağrısını arka planda yapan worker thread
+    Tek bir AI isteğinin arayüz tarafı - isteği paylaşılan zamanlayıcıya
+    gönderir, geri çağrıları (worker thread'inden) Qt sinyallerine çevirir
     """
     # Signaller
     status_update = pyqtSignal(str)  # Durum güncellemesi
     chunk_received = pyqtSignal(str)  # Yanıt chunk'ı geldi
     completed = pyqtSignal()  # İşlem tamamlandı
     error_occurred = pyqtSignal(str)  # Hata oluştu
+    cancelled = pyqtSignal()  # İstek iptal edildi
+    report_saved = pyqtSignal(int)  # Rapor arşive kaydedildi (rapor kimliği)
     
-    def __init__(self, prompt_text):
+    def __init__(self, prompt_text, use_cache=True, backend=None,
+                 priority=PRIORITY_INTERACTIVE, scheduler=None,
+                 source_id=None, kind="session", results_dir="analysis_results"):
+        """
+        Args:
+            prompt_text (str): Gönderilecek prompt
+            use_cache (bool): Yanıt önbelleği kullanılsın mı
+            backend (LLMBackend): Arka uç (varsayılan llm_backend.get_backend())
+            priority (str): Kuyruk önceliği (arayüz / toplu)
+            scheduler (AIScheduler): Varsayılan paylaşılan zamanlayıcı
+            source_id (str): Arşivde raporun bağlanacağı sonuç (ör. dosya adı)
+            kind (str): Rapor türü ('session' veya 'history')
+            results_dir (str): Rapor arşivinin bulunduğu sonuç klasörü
+        """
         super().__init__()
         self.prompt_text = prompt_text
-        self.should_stop = False
+        self.use_cache = use_cache
+        self.backend = backend
+        self.priority = priority
+        self.scheduler = scheduler
+        self.source_id = source_id
+        self.kind = kind
+        self.results_dir = results_dir
+        self.job = None
+        
+    def start(self):
+        """İsteği kuyruğa ekle"""
+        # Prompt'u terminale yazdır
+        print("-" * 80)
+        print("📤 GEMINI'YE GÖNDERİLEN PROMPT:")
+        print("-" * 80)
+        print(self.prompt_text)
+        print("-" * 80)
+        print("\n")
         
-    def run(self):
-        """Thread ana fonksiyonu"""
-        try:
-            # API Key kontrolü
-            api_key = os.getenv("GEMINI_API_KEY")
-            if not api_key:
-                self.error_occurred.emit(
-                    "HATA: GEMINI_API_KEY çevre değişkeni bulunamadı.\n"
-                    "Lütfen API anahtarınızı ayarlayın:\n"
-                    "$env:GEMINI_API_KEY='API_ANAHTARINIZ' (PowerShell)"
-                )
-                return
-            
-            # Gemini API konfigürasyonu
-            self.status_update.emit("API konfigürasyonu yapılıyor...")
-            genai.configure(api_key=api_key)
-            
-            # Model ayarları - Daha uzun ve detaylı yanıtlar için
-            generation_config = {
-                "temperature": 0.7,
-                "top_p": 0.95,
-                "top_k": 40,
-                "max_output_tokens": 8192,
-            }
-            
-            # Güvenlik ayarları - Tıbbi içerik için
-            safety_settings = [
-                {
-                    "category": "HARM_CATEGORY_HARASSMENT",
-                    "threshold": "BLOCK_NONE",
-                },
-                {
-                    "category": "HARM_CATEGORY_HATE_SPEECH",
-                    "threshold": "BLOCK_NONE",
-                },
-                {
-                    "category": "HARM_CATEGORY_SEXUALLY_EXPLICIT",
-                    "threshold": "BLOCK_NONE",
-                },
-                {
-                    "category": "HARM_CATEGORY_DANGEROUS_CONTENT",
-                    "threshold": "BLOCK_NONE",
-                },
-            ]
-            
-            # Model oluştur
-            self.status_update.emit("Model yükleniyor...")
-            model_name = "gemini-2.5-flash"
-            model = genai.GenerativeModel(
-                model_name=model_name,
-                generation_config=generation_config,
-                safety_settings=safety_settings
-            )
-            
-            # Prompt'u terminale yazdır
-            print("-" * 80)
-            print("📤 GEMINI'YE GÖNDERİLEN PROMPT:")
-            print("-" * 80)
-            print(self.prompt_text)
-            print("-" * 80)
-            print("\n")
-            
-            # Streaming ile yanıt al
-            self.status_update.emit("Gemini'den yanıt bekleniyor...")
-            print("📥 GEMINI'DEN GELEN YANIT:")
-            print("-" * 80)
-            response = model.generate_content(self.prompt_text, stream=True)
-            
-            full_response = ""
-            chunk_count = 0
-            
-            for chunk in response:
-                if self.should_stop:
-                    break
-                    
-                if chunk.text:
-                    # UI'a gönder
-                    self.chunk_received.emit(chunk.text)
-                    # Terminale yazdır
-                    print(chunk.text, end="", flush=True)
-                    full_response += chunk.text
-                    chunk_count += 1
-            
-            # Tamamlandı
-            print("\n" + "-" * 80)
-            if not self.should_stop:
-                print(f"✅ Tamamlandı! {chunk_count} chunk, {len(full_response)} karakter")
-                self.status_update.emit(
-                    f"Tamamlandı! {chunk_count} chunk, {len(full_response)} karakter"
-                )
-                self.completed.emit()
-            
-            # Yanıt çok kısaysa uyarı
-            if len(full_response) < 500:
-                self.error_occurred.emit(
-                    "⚠️ UYARI: Yanıt beklenenden çok kısa! "
-                    "Prompt safety filter'a takılmış olabilir."
-                )
-                
-        except Exception as e:
-            self.error_occurred.emit(f"Hata oluştu: {str(e)}")
+        scheduler = self.scheduler or get_scheduler()
+        self.job = scheduler.submit(
+            self.prompt_text,
+            priority=self.priority,
+            backend=self.backend,
+            use_cache=self.use_cache,
+            on_status=self.status_update.emit,
+            on_chunk=self.chunk_received.emit,
+            on_complete=self.on_job_complete,
+            on_error=self.error_occurred.emit,
+            on_cancel=self.cancelled.emit,
+        )
+        if self.job.deduplicated:
+            self.status_update.emit("Aynı istek zaten işleniyor - yanıtı paylaşılıyor")
+    
+    def on_job_complete(self, job):
+        """Worker thread'inden - yanıtı terminale yazdır ve arşive kaydet"""
+        text = job.text
+        print("📥 GEMINI'DEN GELEN YANIT:")
+        print("-" * 80)
+        print(text)
+        print("-" * 80)
+        source = " (önbellekten)" if job.from_cache else ""
+        timings = job.timings
+        print(f"✅ Tamamlandı{source}! {len(text)} karakter, "
+              f"ilk chunk {timings['ttft_ms']} ms, toplam {timings['total_ms']} ms")
+        
+        # Kısa yanıt safety filter'a takılmış olabilir - arşive alınmaz
+        if len(text) >= MIN_RESPONSE_CHARS:
+            report_id = save_job_report(job, self.source_id, self.kind, self.results_dir)
+            if report_id is not None:
+                self.report_saved.emit(report_id)
+        self.completed.emit()
+    
+    def isRunning(self):
+        """İstek kuyrukta ya da çalışıyor mu"""
+        return self.job is not None and not self.job.done
     
     def stop(self):
-        """Worker'ı durdur"""
-        self.should_stop = True
+        """İsteği iptal et - çalışan akış da kesilir"""
+        if self.job is not None:
+            self.job.cancel()
@@ -1,7 +1,15 @@
 """
 Geçmiş analizler için toplu prompt oluşturma
+
+Prompt boyutu token bütçesiyle sınırlıdır: en yeni seanslar olduğu gibi,
+eskiler haftalık/aylık dönem özetleri (ortalama, std, min, max, eğim)
+olarak yazılır.
 """
-import json
+import math
+from datetime import datetime
+
+import config
+from trend_store import parse_timestamp
 
 
 # Kullanıcı tarafından tanımlanan geçmiş analiz promptu
@@ -49,6 +57,75 @@ Hastanın günlük yaşam aktivitelerindeki potansiyel motor beceri seviyesi hak
 """
 
 
+# (başlık, modül, anahtar, birim) - hem tekil seans hem dönem özetlerinde
+HISTORY_METRICS = [
+    ('Tremor Frekans', 'module_a', 'dominant_frequency_hz', ' (Hz)'),
+    ('Tremor Genlik', 'module_a', 'signal_amplitude', ''),
+    ('Ortalama Hız', 'module_b', 'avg_velocity_mm_s', ' (mm/s)'),
+    ('Maksimum Hız', 'module_b', 'max_velocity_mm_s', ' (mm/s)'),
+    ('Hız Eğimi', 'module_b', 'velocity_slope', ''),
+    ('Reaksiyon Süresi', 'module_c', 'avg_reaction_time_ms', ' (ms)'),
+    ('Yorgunluk Endeksi', 'module_c', 'fatigue_index', ''),
+]
+
+
+def estimate_tokens(text):
+    """Yaklaşık token sayısı (karakter / config.HISTORICAL_CHARS_PER_TOKEN)"""
+    return math.ceil(len(text) / config.HISTORICAL_CHARS_PER_TOKEN)
+
+
+def _metric_value(results, module, key):
+    """Sayısal metrik değeri (yoksa None)"""
+    value = results.get(module, {}).get(key)
+    if isinstance(value, bool) or not isinstance(value, (int, float)) or not math.isfinite(value):
+        return None
+    return value
+
+
+def extract_session(results):
+    """
+    Sonuç sözlüğünden prompt için gereken her şeyi çıkarır (önbelleğe alınabilir).
+
+    Returns:
+        dict: {'ts': epoch ya da None, 'timestamp': metin,
+               'body': seans bölümünün başlıksız metni, 'metrics': {anahtar: sayı}}
+    """
+    module_a = results.get('module_a', {})
+    module_b = results.get('module_b', {})
+    module_c = results.get('module_c', {})
+    timestamp = results.get('analysis_datetime', results.get('timestamp', 'Bilinmiyor'))
+
+    body = f"""• Tremor Frekans: {module_a.get('dominant_frequency_hz', 'N/A')} Hz
+• Tremor Genlik: {module_a.get('signal_amplitude', 'N/A')}
+• Ortalama Hız: {module_b.get('avg_velocity_mm_s', 'N/A')} mm/s
+• Maksimum Hız: {module_b.get('max_velocity_mm_s', 'N/A')} mm/s
+• Hız Eğimi: {module_b.get('velocity_slope', 'N/A')}
+• Reaksiyon Süresi: {module_c.get('avg_reaction_time_ms', 'N/A')} ms
+• Yorgunluk Endeksi: {module_c.get('fatigue_index', 'N/A')}"""
+
+    metrics = {}
+    for _, module, key, _ in HISTORY_METRICS:
+        value = _metric_value(results, module, key)
+        if value is not None:
+            metrics[key] = value
+
+    return {
+        'ts': parse_timestamp(timestamp),
+        'timestamp': timestamp,
+        'body': body,
+        'metrics': metrics,
+    }
+
+
+def _session_section(session, idx):
+    return f"ANALİZ {idx} (Tarih: {session['timestamp']}):\n{session['body']}"
+
+
+def format_session_section(results, idx):
+    """Tek bir seansın metriklerini metin bölümüne dönüştürür"""
+    return _session_section(extract_session(results), idx)
+
+
 def format_analysis_data(results_list):
     """
     Birden fazla analiz sonucunu metin formatına dönüştürür
@@ -62,35 +139,240 @@ def format_analysis_data(results_list):
     if not results_list:
         return ""
     
-    # Her analizi formatla
-    analysis_sections = []
-    for idx, results in enumerate(results_list, 1):
-        module_a = results.get('module_a', {})
-        module_b = results.get('module_b', {})
-        module_c = results.get('module_c', {})
-        timestamp = results.get('analysis_datetime', results.get('timestamp', 'Bilinmiyor'))
-        
-        section = f"""ANALİZ {idx} (Tarih: {timestamp}):
-• Tremor Frekans: {module_a.get('dominant_frequency_hz', 'N/A')} Hz
-• Tremor Genlik: {module_a.get('signal_amplitude', 'N/A')}
-• Ortalama Hız: {module_b.get('avg_velocity_mm_s', 'N/A')} mm/s
-• Maksimum Hız: {module_b.get('max_velocity_mm_s', 'N/A')} mm/s
-• Hız Eğimi: {module_b.get('velocity_slope', 'N/A')}
-• Reaksiyon Süresi: {module_c.get('avg_reaction_time_ms', 'N/A')} ms
-• Yorgunluk Endeksi: {module_c.get('fatigue_index', 'N/A')}"""
-        
-        analysis_sections.append(section)
+    # Her analizi formatla ve birleştir
+    return "\n\n".join(
+        format_session_section(results, idx)
+        for idx, results in enumerate(results_list, 1)
+    )
+
+
+def period_key(ts, period):
+    """Epoch saniyesinin dönem etiketi: 'week' -> '2025-H52', 'month' -> '2025-12'"""
+    moment = datetime.fromtimestamp(ts)
+    if period == 'month':
+        return moment.strftime("%Y-%m")
+    year, week, _ = moment.isocalendar()
+    return f"{year}-H{week:02d}"
+
+
+# --- Artımlı dönem istatistikleri (Welford + eş-moment) ---
+# Birikim sözlükleri JSON'a yazılabilir; history_cache bunları saklayıp
+# yeni seansları mevcut özete ekler.
+
+def new_accumulator():
+    return {'n': 0, 'mean_d': 0.0, 'mean_v': 0.0, 'm2_d': 0.0, 'm2_v': 0.0,
+            'c': 0.0, 'min': None, 'max': None}
+
+
+def accumulate(acc, ts, value):
+    """(zaman, değer) noktasını birikime ekle - gün ekseninde eğim için eş-moment"""
+    day = ts / 86400
+    acc['n'] += 1
+    n = acc['n']
+    delta_d = day - acc['mean_d']
+    delta_v = value - acc['mean_v']
+    acc['mean_d'] += delta_d / n
+    acc['mean_v'] += delta_v / n
+    acc['m2_d'] += delta_d * (day - acc['mean_d'])
+    acc['m2_v'] += delta_v * (value - acc['mean_v'])
+    acc['c'] += delta_d * (value - acc['mean_v'])
+    acc['min'] = value if acc['min'] is None else min(acc['min'], value)
+    acc['max'] = value if acc['max'] is None else max(acc['max'], value)
+
+
+def summarize_metric(acc):
+    """
+    Birikimden metrik özeti
+
+    Returns:
+        dict: {'count', 'mean', 'std', 'min', 'max', 'slope_per_day'}
+              (std/slope tek noktada None)
+    """
+    n = acc['n']
+    return {
+        'count': n,
+        'mean': acc['mean_v'],
+        'std': math.sqrt(acc['m2_v'] / (n - 1)) if n > 1 else None,
+        'min': acc['min'],
+        'max': acc['max'],
+        # En küçük kareler eğimi (gün başına) - tüm seanslar aynı anda ise tanımsız
+        'slope_per_day': acc['c'] / acc['m2_d'] if acc['m2_d'] > 1e-12 else None,
+    }
+
+
+def new_period_summary():
+    return {'count': 0, 'first_ts': None, 'last_ts': None,
+            'metrics': {key: new_accumulator() for _, _, key, _ in HISTORY_METRICS}}
+
+
+def add_to_period_summary(summary, session):
+    """Seansı dönem özetine ekle (sıradan bağımsız)"""
+    ts = session['ts']
+    summary['count'] += 1
+    summary['first_ts'] = ts if summary['first_ts'] is None else min(summary['first_ts'], ts)
+    summary['last_ts'] = ts if summary['last_ts'] is None else max(summary['last_ts'], ts)
+    for key, value in session['metrics'].items():
+        if key in summary['metrics']:
+            accumulate(summary['metrics'][key], ts, value)
+
+
+def period_summary(sessions):
+    """Tarihli seansların dönem özeti (extract_session kayıtları)"""
+    summary = new_period_summary()
+    for session in sessions:
+        add_to_period_summary(summary, session)
+    return summary
+
+
+def _fmt(value):
+    return "N/A" if value is None else f"{value:.3g}"
+
+
+def format_period_section(label, summary):
+    """
+    Dönem özetini metrik başına istatistik satırlarına dönüştürür
+
+    Args:
+        label (str): Dönem etiketi
+        summary (dict): period_summary çıktısı
+    """
+    first = datetime.fromtimestamp(summary['first_ts']).strftime("%Y-%m-%d")
+    last = datetime.fromtimestamp(summary['last_ts']).strftime("%Y-%m-%d")
+    lines = [f"DÖNEM {label} ({first} - {last}, {summary['count']} seans, özet):"]
+
+    for title, _, key, unit in HISTORY_METRICS:
+        acc = summary['metrics'][key]
+        if not acc['n']:
+            lines.append(f"• {title}: N/A")
+            continue
+        stats = summarize_metric(acc)
+        slope = "N/A" if stats['slope_per_day'] is None else f"{stats['slope_per_day']:.3g}/gün"
+        lines.append(
+            f"• {title}{unit}: ort {_fmt(stats['mean'])}, std {_fmt(stats['std'])}, "
+            f"min {_fmt(stats['min'])}, max {_fmt(stats['max'])}, "
+            f"eğim {slope} (n={stats['count']})"
+        )
+    return "\n".join(lines)
+
+
+def _group_periods(sessions, period):
+    """Zaman sıralı seansları sıralı [(etiket, [seans])] dönemlerine böler"""
+    groups = []
+    for session in sessions:
+        label = period_key(session['ts'], period)
+        if groups and groups[-1][0] == label:
+            groups[-1][1].append(session)
+        else:
+            groups.append((label, [session]))
+    return groups
+
+
+def _omitted_note(count):
+    return f"(Prompt boyutu sınırı nedeniyle en eski {count} seans dahil edilmedi)"
+
+
+def build_budgeted_sessions(sessions, token_budget=None, recent_sessions=None, period=None,
+                            period_section=None):
+    """
+    Token bütçesine sığan geçmiş veri metni.
+
+    Son K seans olduğu gibi, daha eskiler dönem (hafta/ay) özetleri olarak
+    yazılır. Bütçe aşılırsa haftalık dönemler aylığa çevrilir, hâlâ
+    sığmıyorsa en eski dönemler çıkarılır (tekil seanslar en son
+    kısaltılır); böylece hasta ne kadar uzun takip edilirse edilsin prompt
+    boyutu sınırlı kalır.
+
+    Args:
+        sessions (list): extract_session kayıtları
+        token_budget (int): Veri bölümü için yaklaşık token sınırı
+        recent_sessions (int): Olduğu gibi yazılacak en yeni seans sayısı
+        period (str): 'week' veya 'month'
+        period_section (callable): (dönem türü, etiket, seanslar) -> dönem bölümü
+            metni; varsayılan her seferinde hesaplar (history_cache saklananı kullanır)
+
+    Returns:
+        str: Formatlanmış veri metni
+    """
+    token_budget = token_budget or config.HISTORICAL_PROMPT_TOKEN_BUDGET
+    if recent_sessions is None:
+        recent_sessions = config.HISTORICAL_RECENT_SESSIONS
+    period = period or config.HISTORICAL_PERIOD
+    period_section = period_section or (
+        lambda kind, label, members: format_period_section(label, period_summary(members))
+    )
+
+    # Tarihi okunamayanlar en eski kabul edilir
+    ordered = [session for session in sessions if session['ts'] is None]
+    ordered += sorted((session for session in sessions if session['ts'] is not None),
+                      key=lambda session: session['ts'])
+
+    split = max(0, len(ordered) - recent_sessions)
+    older = [session for session in ordered[:split] if session['ts'] is not None]
+    undated_older = split - len(older)  # Dönemlere bölünemez, çıkarılanlarla sayılır
+    recent_sections = [
+        _session_section(session, idx)
+        for idx, session in enumerate(ordered[split:], split + 1)
+    ]
+
+    def compose(periods, omitted):
+        parts = ([_omitted_note(omitted)] if omitted else []) + periods + recent_sections
+        return "\n\n".join(parts)
+
+    for grouping in (['week', 'month'] if period == 'week' else [period]):
+        groups = _group_periods(older, grouping)
+        period_sections = [period_section(grouping, label, members) for label, members in groups]
+        text = compose(period_sections, undated_older)
+        if estimate_tokens(text) <= token_budget:
+            return text
+
+    # En kaba dönemlerle bile sığmadı - en yeni dönemlerden geriye doğru doldur
+    remaining = token_budget * config.HISTORICAL_CHARS_PER_TOKEN - len(compose([], split))
+    kept = len(period_sections)
+    while kept and remaining - len(period_sections[kept - 1]) - 2 >= 0:
+        remaining -= len(period_sections[kept - 1]) + 2
+        kept -= 1
+    omitted = undated_older + sum(len(members) for _, members in groups[:kept])
+    text = compose(period_sections[kept:], omitted)
+
+    # Tekil seanslar da sığmıyorsa en eskilerini çıkar (en az biri kalır)
+    while len(recent_sections) > 1 and estimate_tokens(text) > token_budget:
+        recent_sections.pop(0)
+        omitted += 1
+        text = compose(period_sections[kept:], omitted)
+    return text
+
+
+def build_budgeted_data(results_list, token_budget=None, recent_sessions=None, period=None):
+    """build_budgeted_sessions'ın sonuç sözlükleri alan biçimi"""
+    return build_budgeted_sessions(
+        [extract_session(results) for results in results_list],
+        token_budget, recent_sessions, period
+    )
+
+
+def _prompt_from_sessions(sessions, token_budget=None, period_section=None):
+    """Şablonu bütçeye sığan veriyle doldurur"""
+    # Şablonun kendisi de bütçeden düşülür
+    token_budget = token_budget or config.HISTORICAL_PROMPT_TOKEN_BUDGET
+    template_tokens = estimate_tokens(HISTORICAL_ANALYSIS_PROMPT.format(data=""))
+    
+    # Veriyi bütçeye sığacak şekilde formatla
+    data_text = build_budgeted_sessions(
+        sessions, max(1, token_budget - template_tokens), period_section=period_section
+    )
     
-    # Tüm analizleri birleştir
-    return "\n\n".join(analysis_sections)
+    # Kullanıcı tanımlı prompt'a veriyi ekle
+    return HISTORICAL_ANALYSIS_PROMPT.format(data=data_text)
 
 
-def create_historical_analysis_prompt(results_list):
+def create_historical_analysis_prompt(results_list, token_budget=None):
     """
     Kullanıcı tanımlı prompt şablonuna analiz verilerini ekler
     
     Args:
         results_list: Analiz sonuçları listesi (her biri bir dict)
+        token_budget: Toplam prompt için yaklaşık token sınırı
+            (varsayılan config.HISTORICAL_PROMPT_TOKEN_BUDGET)
         
     Returns:
         str: Oluşturulan toplu analiz prompt metni
@@ -98,18 +380,17 @@ def create_historical_analysis_prompt(results_list):
     if not results_list:
         return None
     
-    # Veriyi formatla
-    data_text = format_analysis_data(results_list)
-    
-    # Kullanıcı tanımlı prompt'a veriyi ekle
-    prompt = HISTORICAL_ANALYSIS_PROMPT.format(data=data_text)
-    
-    return prompt
+    return _prompt_from_sessions(
+        [extract_session(results) for results in results_list], token_budget
+    )
 
 
 def create_prompt_from_files(json_filepaths):
     """
     Birden fazla JSON dosyasından toplu prompt oluşturur
+
+    Seans bölümleri ve dönem özetleri history_cache'ten gelir; sadece
+    yeni/değişmiş sonuç dosyaları okunur.
     
     Args:
         json_filepaths: JSON dosya yolları listesi
@@ -118,14 +399,17 @@ def create_prompt_from_files(json_filepaths):
         str: Oluşturulan prompt metni veya None
     """
     try:
-        results_list = []
+        if not json_filepaths:
+            return None
         
-        for filepath in json_filepaths:
-            with open(filepath, 'r', encoding='utf-8') as f:
-                results = json.load(f)
-                results_list.append(results)
+        from history_cache import HistoryCache
         
-        return create_historical_analysis_prompt(results_list)
+        cache = HistoryCache()
+        try:
+            sessions = cache.load_sessions(json_filepaths)
+            return _prompt_from_sessions(sessions, period_section=cache.period_section)
+        finally:
+            cache.close()
         
     except Exception as e:
         print(f"Toplu prompt oluşturma hatası: {e}")
@@ -0,0 +1,160 @@
+"""
+Geçmiş Prompt Önbelleği - Seans Bölümleri ve Dönem Özetleri
+Toplu (geçmiş) analiz prompt'u için SQLite önbelleği
+
+- Her sonuç dosyasının prompt bölümü ve sayısal metrikleri (dosya yolu,
+  mtime, boyut) kimliğiyle saklanır; prompt hazırlanırken sadece yeni ya da
+  değişmiş JSON dosyaları açılır
+- Her dönemin (hafta/ay) istatistik birikimi (Welford + eş-moment) ve
+  biçimlenmiş bölümü üye seanslarıyla birlikte saklanır; döneme yeni seans
+  gelince sadece o seans birikime eklenir, üye silinmiş/değişmişse dönem
+  yeniden hesaplanır
+
+Böylece yüzlerce seanslık bir geçmişin prompt'u milisaniyeler içinde hazırlanır.
+"""
+
+import json
+import os
+import sqlite3
+
+import config
+from analysis_cache import make_key
+from historical_analysis import (
+    extract_session, period_summary, add_to_period_summary, format_period_section
+)
+
+
+class HistoryCache:
+    """Seans bölümü ve dönem özeti önbelleği"""
+
+    def __init__(self, db_path=None):
+        """
+        Args:
+            db_path (str): Önbellek dosyası (varsayılan config.HISTORY_CACHE_FILE)
+        """
+        self.db_path = db_path or config.HISTORY_CACHE_FILE
+        self._conn = None
+
+    @property
+    def conn(self):
+        """Bağlantı ilk kullanımda açılır (bağlantılar thread'ler arasında paylaşılmaz)"""
+        if self._conn is None:
+            os.makedirs(os.path.dirname(self.db_path) or ".", exist_ok=True)
+            self._conn = sqlite3.connect(self.db_path, timeout=10)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._create_schema()
+        return self._conn
+
+    def _create_schema(self):
+        with self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS history_sessions ("
+                "file_path TEXT PRIMARY KEY, file_mtime REAL NOT NULL, "
+                "file_size INTEGER NOT NULL, ts REAL, timestamp TEXT, "
+                "body TEXT NOT NULL, metrics TEXT NOT NULL)"
+            )
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS history_periods ("
+                "kind TEXT NOT NULL, label TEXT NOT NULL, members_key TEXT NOT NULL, "
+                "members TEXT NOT NULL, summary TEXT NOT NULL, section TEXT NOT NULL, "
+                "PRIMARY KEY (kind, label))"
+            )
+
+    def close(self):
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    def load_sessions(self, json_filepaths):
+        """
+        Dosyaların seans kayıtlarını döndürür - değişmemiş dosyalar okunmaz.
+
+        Önbellekten gelen kayıtlarda metrikler JSON metni olarak kalır
+        ('metrics_json'); sadece dönem özeti yeniden hesaplanırken çözülür.
+
+        Returns:
+            list: extract_session kayıtları ('identity' = [yol, mtime, boyut] eklenmiş)
+        """
+        known = {
+            row[0]: row[1:]
+            for row in self.conn.execute(
+                "SELECT file_path, file_mtime, file_size, ts, timestamp, body, metrics "
+                "FROM history_sessions"
+            )
+        }
+
+        sessions = []
+        with self.conn:
+            for path in json_filepaths:
+                path = os.path.abspath(path)
+                stat = os.stat(path)
+                cached = known.get(path)
+                if cached is not None and cached[:2] == (stat.st_mtime, stat.st_size):
+                    ts, timestamp, body, metrics_json = cached[2:]
+                    session = {'ts': ts, 'timestamp': timestamp, 'body': body,
+                               'metrics_json': metrics_json}
+                else:
+                    with open(path, 'r', encoding='utf-8') as f:
+                        session = extract_session(json.load(f))
+                    self.conn.execute(
+                        "INSERT OR REPLACE INTO history_sessions "
+                        "(file_path, file_mtime, file_size, ts, timestamp, body, metrics) "
+                        "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                        (path, stat.st_mtime, stat.st_size, session['ts'],
+                         session['timestamp'], session['body'], json.dumps(session['metrics']))
+                    )
+                session['identity'] = (path, stat.st_mtime, stat.st_size)
+                sessions.append(session)
+        return sessions
+
+    @staticmethod
+    def _with_metrics(session):
+        if 'metrics' not in session:
+            session['metrics'] = json.loads(session['metrics_json'])
+        return session
+
+    def period_section(self, kind, label, sessions):
+        """
+        Dönem bölümü metni - üyeler aynıysa saklanan metin, döneme sadece
+        yeni seans eklendiyse saklanan birikim + yeni seanslar kullanılır.
+
+        Args:
+            kind (str): 'week' veya 'month'
+            label (str): Dönem etiketi
+            sessions (list): Dönemin seansları (load_sessions kayıtları)
+        """
+        members = sorted(session['identity'] for session in sessions)
+        members_key = make_key(*members)
+        row = self.conn.execute(
+            "SELECT members_key, members, summary, section FROM history_periods "
+            "WHERE kind = ? AND label = ?",
+            (kind, label)
+        ).fetchone()
+
+        if row is not None and row[0] == members_key:
+            return row[3]
+
+        summary = None
+        if row is not None:
+            stored = {tuple(identity) for identity in json.loads(row[1])}
+            if stored <= set(members):
+                # Sadece yeni seanslar birikime eklenir
+                summary = json.loads(row[2])
+                for session in sessions:
+                    if session['identity'] not in stored:
+                        add_to_period_summary(summary, self._with_metrics(session))
+
+        if summary is None:
+            # Üye silinmiş/değişmiş ya da ilk kez - baştan hesapla
+            summary = period_summary([self._with_metrics(session) for session in sessions])
+
+        section = format_period_section(label, summary)
+        with self.conn:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO history_periods "
+                "(kind, label, members_key, members, summary, section) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (kind, label, members_key, json.dumps(members, ensure_ascii=False),
+                 json.dumps(summary), section)
+            )
+        return section
@@ -0,0 +1,410 @@
+"""
+Uçtan Uca Gecikme Ölçümü - Seri Bayttan Grafiğe ve Diske
+Firmware'in yazdığı bir örneğin Modül A/B grafiğine ve CSV'ye ne kadar
+sürede ulaştığını ölçer
+
+SerialManager sanal bir seri porta ("loop://") bağlanır; ayrı bir thread
+synthetic_data ile üretilen firmware satırlarını bu porta verilen hızda
+yazar. Her örnek, yazılması gereken andan (takvim zamanı) itibaren şu
+aşamalarda zaman damgası alır:
+
+- read:  SerialManager satırı porttan okudu (seri thread)
+- emit:  data_received sinyali yayıldı (seri thread, doğrudan bağlantı)
+- slot:  sinyal arayüz thread'inde işlenmeye başladı
+- parse: serial_protocol.parse_line satırı çözdü
+- log:   DataLogger satırı CSV'ye yazdı
+- plot:  RenderScheduler örneği içeren veriyle eğriyi güncelledi (setData)
+
+Gerçek TerminalUI penceresi kullanılır; ölçüm için uygulama koduna dokunulmaz,
+damgalar örnek (instance) düzeyinde sarmalayıcılarla alınır. Satır başına
+"Arduino: ..." konsol çıktısı ölçüm sırasında /dev/null'a yönlendirilir.
+
+Her hız için p50/p95/p99 gecikmeler raporlanır. Gecikme zamanla büyüyorsa
+(birikim eğimi > BACKLOG_SLOPE ve toplam artış > BACKLOG_TOLERANCE_S) ya da
+örnekler süre sonunda hâlâ bekliyorsa o hız sürdürülemez sayılır; tarama ilk
+başarısız hızda durur.
+
+Komut satırı:
+    python latency_harness.py                                   # varsayılan tarama
+    python latency_harness.py --rates 10,50,100 --duration 10 --module B
+    python latency_harness.py --min-rate 50 --json latency.json  # eşik altında çıkış kodu 1
+"""
+
+import argparse
+import contextlib
+import json
+import os
+import shutil
+import sys
+import tempfile
+import threading
+import time
+
+import numpy as np
+
+import config
+import synthetic_data
+
+
+DEFAULT_RATES = "10,25,50,100,200,400"  # Hz (satır/s)
+DEFAULT_DURATION_S = 5.0  # Hız başına yazma süresi
+DRAIN_TIMEOUT_S = 3.0  # Yazma bittikten sonra son örneklerin grafiğe ulaşması için süre
+BACKLOG_SLOPE = 0.01  # Gecikme artışı (s/s) - üstü birikim büyüyor demek
+BACKLOG_TOLERANCE_S = 0.05  # Ölçüm boyunca toplam artış bunun altındaysa eğim jitter sayılır
+MAX_RATE_HZ = 1000  # Firmware zaman damgası ms çözünürlüklü (millis())
+LOOP_URL = "loop://"
+
+STAGES = ('read', 'emit', 'slot', 'parse', 'log', 'plot')
+PERCENTILES = (50, 95, 99)
+
+
+def _line_ms(line):
+    """Modül A/B satırının başındaki firmware zamanı (ms) - örnek anahtarı"""
+    return int(line.split(None, 1)[0])
+
+
+def wire_rate(lines, baud_rate=None):
+    """
+    Seri hattın taşıyabileceği satır/s (8N1: bayt başına 10 bit, println '\\r\\n').
+
+    Args:
+        lines (list): Örnek satırlar
+        baud_rate (int): Varsayılan config.BAUD_RATE
+    """
+    baud_rate = baud_rate or config.BAUD_RATE
+    avg_bytes = np.mean([len(line) + 2 for line in lines])
+    return baud_rate / (10 * avg_bytes)
+
+
+def percentiles_ms(values):
+    """Gecikme dizisinin p50/p95/p99 değerleri (ms) - boşsa None"""
+    values = values[~np.isnan(values)]
+    if not len(values):
+        return None
+    return {f"p{p}": float(np.percentile(values, p) * 1000) for p in PERCENTILES}
+
+
+def backlog_slope(scheduled, latency):
+    """
+    Gecikmenin takvim zamanına göre eğimi (s/s).
+
+    Hat işlem hızına yetişemezse kuyruk büyür ve gecikme zamanla doğrusal
+    artar; yetişiyorsa eğim ~0 olur.
+    """
+    mask = ~np.isnan(latency)
+    if mask.sum() < 2:
+        return float('inf')
+    return float(np.polyfit(scheduled[mask] - scheduled[0], latency[mask], 1)[0])
+
+
+class _ReadStamper:
+    """Seri bağlantı sarmalayıcısı - readline dönüşünde 'read' damgası"""
+
+    def __init__(self, conn, probe):
+        self._conn = conn
+        self._probe = probe
+
+    def readline(self, *args, **kwargs):
+        line = self._conn.readline(*args, **kwargs)
+        self._probe.stamp_line('read', line)
+        return line
+
+    def __getattr__(self, name):
+        return getattr(self._conn, name)
+
+
+class LatencyProbe:
+    """Tek bir hızdaki ölçümün zaman damgaları"""
+
+    def __init__(self, lines, rate_hz):
+        self.lines = lines
+        self.rate_hz = rate_hz
+        self.index = {_line_ms(line): i for i, line in enumerate(lines)}
+        self.scheduled = np.full(len(lines), np.nan)
+        self.stamps = {stage: np.full(len(lines), np.nan) for stage in STAGES}
+        self.pending_plot = []  # Kaydedilip henüz çizilmemiş örnekler
+        self.writer_done = threading.Event()
+        self.errors = []
+
+    def stamp(self, stage, key):
+        i = self.index.get(key)
+        if i is not None:
+            self.stamps[stage][i] = time.perf_counter()
+        return i
+
+    def stamp_line(self, stage, line):
+        try:
+            self.stamp(stage, _line_ms(line))
+        except (ValueError, IndexError):
+            pass
+
+    def stamp_plot(self):
+        now = time.perf_counter()
+        for i in self.pending_plot:
+            self.stamps['plot'][i] = now
+        self.pending_plot = []
+
+    def done(self):
+        return self.writer_done.is_set() and not np.isnan(self.stamps['plot']).any()
+
+    def result(self):
+        """Aşama bazında gecikme yüzdelikleri, birikim eğimi ve sürdürülebilirlik"""
+        stages = {
+            stage: percentiles_ms(self.stamps[stage] - self.scheduled) for stage in STAGES
+        }
+        end_to_end = self.stamps['plot'] - self.scheduled
+        delivered = int((~np.isnan(end_to_end)).sum())
+        slope = backlog_slope(self.scheduled, end_to_end)
+        growth = slope * (self.scheduled[-1] - self.scheduled[0]) if delivered else float('inf')
+        backlog_grows = slope > BACKLOG_SLOPE and growth > BACKLOG_TOLERANCE_S
+        return {
+            'rate_hz': self.rate_hz,
+            'sent': len(self.lines),
+            'delivered': delivered,
+            'backlog_slope': slope,
+            'sustainable': delivered == len(self.lines) and not backlog_grows and not self.errors,
+            'stages': stages,
+            'errors': self.errors,
+        }
+
+
+def _write_lines(conn, probe):
+    """Satırları takvime göre yaz (firmware println); geride kalınırsa beklemeden yaz"""
+    interval = 1.0 / probe.rate_hz
+    start = time.perf_counter() + 0.05
+    try:
+        for i, line in enumerate(probe.lines):
+            due = start + i * interval
+            delay = due - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+            probe.scheduled[i] = due
+            conn.write(f"{line}\r\n".encode('utf-8'))
+    except Exception as e:
+        probe.errors.append(f"Yazma hatası: {e}")
+    finally:
+        probe.writer_done.set()
+
+
+def measure_rate(window, module, rate_hz, duration_s, save_dir, seed=None):
+    """
+    Tek bir hızda ölçüm.
+
+    Args:
+        window: TerminalUI penceresi
+        module (str): 'A' ya da 'B'
+        rate_hz (float): Satır/s
+        duration_s (float): Yazma süresi
+        save_dir (str): CSV klasörü
+
+    Returns:
+        dict: LatencyProbe.result()
+    """
+    import main
+    from PyQt6.QtCore import Qt, QEventLoop, QTimer
+    from data_logger import DataLogger
+    from serial_manager import SerialManager
+
+    samples = max(2, int(rate_hz * duration_s))
+    interval_ms = 1000.0 / rate_hz
+    if module == 'A':
+        x, y = synthetic_data.tremor_signal(samples, interval_ms=interval_ms, jitter_ms=0, seed=seed)
+    else:
+        x, y = synthetic_data.distance_signal(samples, interval_ms=interval_ms, jitter_ms=0, seed=seed)
+    probe = LatencyProbe(synthetic_data.serial_lines(module, x, y), rate_hz)
+    connected = threading.Event()
+
+    class StampedSerialManager(SerialManager):
+        def connect(self):
+            ok = SerialManager.connect(self)
+            if ok:
+                self.serial_conn = _ReadStamper(self.serial_conn, probe)
+                connected.set()
+            return ok
+
+    # Aşama sarmalayıcıları (sadece bu pencere örneği)
+    window.data_logger = DataLogger(save_dir)
+    log_name = f"log_module_{module.lower()}"
+    log_method = getattr(window.data_logger, log_name)
+    curve = window.mod_a_curve if module == 'A' else window.mod_b_curve
+
+    def stamped_log(time_s, value):
+        log_method(time_s, value)
+        i = probe.stamp('log', round(time_s * 1000))
+        if i is not None:
+            probe.pending_plot.append(i)
+
+    def stamped_set_data(*args, **kwargs):
+        type(curve).setData(curve, *args, **kwargs)
+        probe.stamp_plot()
+
+    def stamped_parse(data):
+        event = original_parse(data)
+        probe.stamp_line('parse', data)
+        return event
+
+    def on_data(data):
+        probe.stamp_line('slot', data)
+        window.on_data_received(data)
+
+    setattr(window.data_logger, log_name, stamped_log)
+    curve.setData = stamped_set_data
+    original_parse = main.parse_line
+    main.parse_line = stamped_parse
+
+    manager = StampedSerialManager(LOOP_URL, config.BAUD_RATE)
+    manager.data_received.connect(
+        lambda data: probe.stamp_line('emit', data), Qt.ConnectionType.DirectConnection
+    )
+    manager.data_received.connect(on_data)
+    manager.error_occurred.connect(probe.errors.append)
+
+    loop = QEventLoop()
+    deadline = [None]
+
+    def check():
+        if probe.done():
+            loop.quit()
+        elif probe.writer_done.is_set():
+            deadline[0] = deadline[0] or time.perf_counter() + DRAIN_TIMEOUT_S
+            if time.perf_counter() > deadline[0]:
+                loop.quit()
+
+    poll = QTimer()
+    poll.setInterval(20)
+    poll.timeout.connect(check)
+
+    writer = None
+    try:
+        with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+            manager.start()
+            if not connected.wait(5.0):
+                probe.errors.append(f"{LOOP_URL} bağlantısı kurulamadı")
+                probe.writer_done.set()
+            else:
+                writer = threading.Thread(
+                    target=_write_lines, args=(manager.serial_conn._conn, probe), daemon=True
+                )
+                writer.start()
+                poll.start()
+                loop.exec()
+    finally:
+        poll.stop()
+        manager.disconnect()
+        manager.wait()
+        if writer:
+            writer.join(timeout=1.0)
+        main.parse_line = original_parse
+        del curve.setData
+    return probe.result()
+
+
+def format_result(result):
+    """Tek hız sonucunu okunabilir metne çevir"""
+    verdict = "sürdürülebilir" if result['sustainable'] else "SÜRDÜRÜLEMEZ"
+    lines = [
+        f"{result['rate_hz']:g} Hz: {result['delivered']}/{result['sent']} örnek, "
+        f"birikim eğimi {result['backlog_slope'] * 1000:.1f} ms/s -> {verdict}",
+        "  aşama        p50 ms    p95 ms    p99 ms   (yazma anından itibaren)",
+    ]
+    for stage in STAGES:
+        values = result['stages'][stage]
+        if values is None:
+            lines.append(f"  {stage:<8}         -         -         -")
+        else:
+            lines.append(
+                f"  {stage:<8} {values['p50']:>9.2f} {values['p95']:>9.2f} {values['p99']:>9.2f}"
+            )
+    for error in result['errors']:
+        lines.append(f"  HATA: {error}")
+    return "\n".join(lines)
+
+
+def run(rates, module='A', duration_s=DEFAULT_DURATION_S, seed=1, save_dir=None):
+    """
+    Hızları sırayla ölçer, ilk sürdürülemeyen hızda durur.
+
+    Returns:
+        dict: {'module', 'results': [...], 'max_sustainable_hz', 'wire_rate_hz'}
+    """
+    from PyQt6.QtWidgets import QApplication
+
+    app = QApplication.instance() or QApplication(sys.argv)
+    import main
+
+    # Pencerenin kendi DataLogger'ı ve seans indeksi geçici klasörde çalışır
+    previous_dir = os.getcwd()
+    work_dir = tempfile.mkdtemp(prefix="latency_")
+    save_dir = os.path.abspath(save_dir) if save_dir else os.path.join(work_dir, "test_data")
+    os.chdir(work_dir)
+
+    window = main.TerminalUI()
+    window.show()
+    app.processEvents()
+
+    results = []
+    max_sustainable = None
+    try:
+        for rate_hz in rates:
+            result = measure_rate(window, module, rate_hz, duration_s, save_dir, seed)
+            results.append(result)
+            print(format_result(result))
+            if not result['sustainable']:
+                break
+            max_sustainable = rate_hz
+    finally:
+        window.render_scheduler.stop()
+        window.close()
+        os.chdir(previous_dir)
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+    sample_x, sample_y = (synthetic_data.tremor_signal(100, seed=seed) if module == 'A'
+                          else synthetic_data.distance_signal(100, seed=seed))
+    return {
+        'module': module,
+        'duration_s': duration_s,
+        'results': results,
+        'max_sustainable_hz': max_sustainable,
+        'wire_rate_hz': wire_rate(synthetic_data.serial_lines(module, sample_x, sample_y)),
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Seri bayttan grafiğe/CSV'ye uçtan uca gecikme ölçümü")
+    parser.add_argument("--module", choices=['A', 'B'], default='A', help="Ölçülen modül (varsayılan: A)")
+    parser.add_argument("--rates", default=DEFAULT_RATES,
+                        help=f"Denenecek hızlar (Hz), virgülle, artan sırada (varsayılan: {DEFAULT_RATES})")
+    parser.add_argument("--duration", type=float, default=DEFAULT_DURATION_S,
+                        help=f"Hız başına yazma süresi, sn (varsayılan: {DEFAULT_DURATION_S:g})")
+    parser.add_argument("--seed", type=int, default=1, help="Sentetik veri tohumu")
+    parser.add_argument("--out", help="CSV klasörü (varsayılan: geçici, silinir)")
+    parser.add_argument("--json", help="Sonuçları JSON olarak bu dosyaya yaz")
+    parser.add_argument("--min-rate", type=float,
+                        help="En yüksek sürdürülebilir hız bunun altındaysa çıkış kodu 1")
+    args = parser.parse_args(argv)
+
+    rates = sorted(float(rate) for rate in args.rates.split(","))
+    if rates[0] <= 0 or rates[-1] > MAX_RATE_HZ:
+        parser.error(f"Hızlar 0-{MAX_RATE_HZ} Hz aralığında olmalı")
+
+    summary = run(rates, args.module, args.duration, args.seed, args.out)
+
+    print(f"\nMevcut örnekleme: {1000 / config.SAMPLE_INTERVAL_MS:g} Hz, "
+          f"{config.BAUD_RATE} baud hat kapasitesi: ~{summary['wire_rate_hz']:.0f} satır/s")
+    if summary['max_sustainable_hz'] is None:
+        print(f"En yüksek sürdürülebilir hız: yok (en düşük hız {rates[0]:g} Hz bile birikti)")
+    else:
+        print(f"En yüksek sürdürülebilir hız: {summary['max_sustainable_hz']:g} Hz")
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(summary, f, ensure_ascii=False, indent=2)
+        print(f"Sonuçlar: {args.json}")
+
+    if args.min_rate is not None and (summary['max_sustainable_hz'] or 0) < args.min_rate:
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
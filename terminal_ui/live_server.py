@@ -0,0 +1,344 @@
+"""
+Canlı Web Paneli Sunucusu
+web_interface.html'i sunar ve canlı veriyi SSE (Server-Sent Events) ile yayınlar
+
+Veri akışı:
+- Seri/UI tarafı örnekleri publish_sample() ile bırakır (kilitli liste ekleme,
+  izleyici sayısından bağımsız sabit maliyet)
+- Tek bir yayın thread'i sabit hızda (LIVE_PUSH_HZ) biriken örnekleri
+  seyreltir, mesajı BİR KEZ JSON'a çevirir ve her istemcinin kuyruğuna koyar
+- Her istemcinin sınırlı kuyruğu vardır; yavaş bir tablet kuyruğu doldurursa
+  en eski mesajları kaybeder (geri basınç), diğer izleyiciler ve seri
+  okuma etkilenmez
+- Yeni bağlanan izleyiciye önce son örneklerin anlık görüntüsü gönderilir
+- Arşivlenmiş seanslar /api/sessions ve /api/range uç noktalarıyla
+  sunucu tarafında seyreltilerek sorgulanır (archive_query)
+
+Sadece standart kütüphane kullanır (http.server, threading, queue).
+"""
+
+import json
+import os
+import queue
+import threading
+from collections import deque
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+import config
+
+
+_HTML_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "web_interface.html")
+
+
+def downsample(points, max_points):
+    """
+    Nokta listesini en fazla max_points noktaya indirir (kova başına min/max).
+
+    Args:
+        points (list): [(t, v), ...] zaman sıralı
+        max_points (int): Üst sınır
+
+    Returns:
+        list: Seyreltilmiş [(t, v), ...]
+    """
+    if len(points) <= max_points:
+        return points
+
+    buckets = max(1, max_points // 2)
+    size = len(points) / buckets
+    result = []
+    for b in range(buckets):
+        bucket = points[int(b * size):int((b + 1) * size)]
+        if not bucket:
+            continue
+        low = min(bucket, key=lambda p: p[1])
+        high = max(bucket, key=lambda p: p[1])
+        # Zaman sırasını koru
+        result.extend(sorted({low, high}, key=lambda p: p[0]))
+    return result
+
+
+class _Client:
+    """Tek bir SSE izleyicisi - sınırlı mesaj kuyruğu"""
+
+    def __init__(self, maxsize):
+        self.queue = queue.Queue(maxsize=maxsize)
+        self.dropped = 0
+
+    def offer(self, message):
+        """Mesajı kuyruğa koy; doluysa en eskiyi at (bloklamaz)"""
+        while True:
+            try:
+                self.queue.put_nowait(message)
+                return
+            except queue.Full:
+                try:
+                    self.queue.get_nowait()
+                    self.dropped += 1
+                except queue.Empty:
+                    pass
+
+
+class LiveBroadcaster:
+    """Örnek/olay toplayıcı ve sabit hızlı yayıncı"""
+
+    def __init__(self, push_hz=None, max_points=None, client_queue=None, history_points=None):
+        self.push_hz = push_hz or config.LIVE_PUSH_HZ
+        self.max_points = max_points or config.LIVE_MAX_POINTS_PER_PUSH
+        self.client_queue = client_queue or config.LIVE_CLIENT_QUEUE
+        history_points = history_points or config.LIVE_HISTORY_POINTS
+
+        self._lock = threading.Lock()
+        self._pending = {'A': [], 'B': [], 'C': []}  # Son yayından beri gelen örnekler
+        self._events = []  # Son yayından beri gelen olaylar (durum, metrik)
+        self._history = {module: deque(maxlen=history_points) for module in self._pending}
+        self._status = {}  # Modül -> son durum (yeni izleyici için)
+        self._clients = set()
+
+        self._stop = threading.Event()
+        self._thread = None
+
+    # --- Üretici tarafı (seri/UI thread'i) ---
+
+    def publish_sample(self, module, t, value):
+        """Canlı örnek bırak (O(1), izleyici sayısından bağımsız)"""
+        with self._lock:
+            self._pending[module].append((t, value))
+
+    def publish_event(self, event, payload):
+        """Durum/metrik olayı bırak (bir sonraki yayında gönderilir)"""
+        with self._lock:
+            self._events.append((event, payload))
+            if event == 'status':
+                self._status[payload.get('module')] = payload
+
+    # --- İstemciler ---
+
+    def add_client(self):
+        """Yeni izleyici - anlık görüntü kuyruğun başına konur"""
+        client = _Client(self.client_queue)
+        with self._lock:
+            snapshot = {
+                'samples': {
+                    module: downsample(list(history), self.max_points * 4)
+                    for module, history in self._history.items()
+                },
+                'status': list(self._status.values()),
+            }
+            self._clients.add(client)
+        client.offer(self._format('snapshot', snapshot))
+        return client
+
+    def remove_client(self, client):
+        with self._lock:
+            self._clients.discard(client)
+
+    def close_clients(self):
+        """Tüm izleyici akışlarını sonlandır"""
+        with self._lock:
+            clients = list(self._clients)
+        for client in clients:
+            client.offer(None)
+
+    @property
+    def client_count(self):
+        with self._lock:
+            return len(self._clients)
+
+    # --- Yayın thread'i ---
+
+    def start(self):
+        if self._thread is None:
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run, name="live_broadcast", daemon=True)
+            self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=2)
+            self._thread = None
+
+    def _run(self):
+        interval = 1.0 / self.push_hz
+        while not self._stop.wait(interval):
+            self.push_once()
+
+    def push_once(self):
+        """Biriken örnek ve olayları tek mesajda tüm izleyicilere dağıt"""
+        with self._lock:
+            pending, self._pending = self._pending, {module: [] for module in self._pending}
+            events, self._events = self._events, []
+            for module, points in pending.items():
+                self._history[module].extend(points)
+            clients = list(self._clients)
+
+        if not clients:
+            return
+
+        messages = [self._format(event, payload) for event, payload in events]
+        samples = {
+            module: downsample(points, self.max_points)
+            for module, points in pending.items() if points
+        }
+        if samples:
+            messages.append(self._format('samples', samples))
+
+        # Mesajlar bir kez serileştirilir, izleyici başına sadece kuyruğa ekleme
+        for message in messages:
+            for client in clients:
+                client.offer(message)
+
+    @staticmethod
+    def _format(event, payload):
+        """SSE mesajı (UTF-8 bayt)"""
+        data = json.dumps(payload, ensure_ascii=False, separators=(',', ':'))
+        return f"event: {event}\ndata: {data}\n\n".encode('utf-8')
+
+
+class _Handler(BaseHTTPRequestHandler):
+    """
+    '/' -> web_interface.html, '/events' -> SSE akışı,
+    '/api/sessions' ve '/api/range' -> arşiv sorguları (JSON)
+    """
+
+    broadcaster = None  # LiveServer tarafından atanır
+
+    def do_GET(self):
+        url = urlsplit(self.path)
+        if url.path in ("/", "/index.html"):
+            self._serve_html()
+        elif url.path == "/events":
+            self._serve_events()
+        elif url.path == "/api/sessions":
+            self._serve_sessions()
+        elif url.path == "/api/range":
+            self._serve_range(parse_qs(url.query))
+        else:
+            self.send_error(404)
+
+    def _serve_html(self):
+        try:
+            with open(_HTML_PATH, 'rb') as f:
+                body = f.read()
+        except OSError:
+            self.send_error(500, "web_interface.html bulunamadı")
+            return
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _send_json(self, payload, status=200):
+        body = json.dumps(payload, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _serve_sessions(self):
+        import archive_query
+        self._send_json({'status': 'success', 'sessions': archive_query.list_sessions()})
+
+    def _serve_range(self, query):
+        """/api/range?session=...&module=A&start=0&end=60&points=1000"""
+        import archive_query
+
+        def param(name, convert=str):
+            values = query.get(name)
+            return convert(values[0]) if values and values[0] != "" else None
+
+        try:
+            session_id = param('session')
+            module = param('module')
+            start = param('start', float)
+            end = param('end', float)
+            points = param('points', int)
+        except ValueError:
+            self._send_json({'status': 'error', 'error_message': 'Geçersiz sorgu parametresi'}, 400)
+            return
+        if not session_id or not module:
+            self._send_json({'status': 'error', 'error_message': 'session ve module gerekli'}, 400)
+            return
+        # Kimlik dosya yoluna girer - dosya sistemine dokunmadan önce doğrula
+        if not archive_query.is_valid_session_id(session_id):
+            self._send_json({'status': 'error', 'error_message': 'Geçersiz seans kimliği'}, 400)
+            return
+
+        result = archive_query.query_range(session_id, module.upper(), start, end, points)
+        self._send_json(result, 200 if result['status'] == 'success' else 404)
+
+    def _serve_events(self):
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream; charset=utf-8")
+        self.send_header("Cache-Control", "no-cache")
+        self.send_header("Connection", "keep-alive")
+        self.end_headers()
+
+        client = self.broadcaster.add_client()
+        try:
+            while True:
+                try:
+                    message = client.queue.get(timeout=config.LIVE_KEEPALIVE_S)
+                except queue.Empty:
+                    # Ara sunucular bağlantıyı kapatmasın
+                    message = b": ping\n\n"
+                if message is None:
+                    break
+                self.wfile.write(message)
+                self.wfile.flush()
+        except (BrokenPipeError, ConnectionResetError, OSError):
+            pass
+        finally:
+            self.broadcaster.remove_client(client)
+
+    def log_message(self, format, *args):
+        # Her istek için terminale yazma
+        pass
+
+
+class LiveServer:
+    """Canlı web paneli HTTP sunucusu (arka plan thread'inde)"""
+
+    def __init__(self, host=None, port=None, broadcaster=None):
+        self.host = host or config.LIVE_SERVER_HOST
+        self.port = port if port is not None else config.LIVE_SERVER_PORT
+        self.broadcaster = broadcaster or LiveBroadcaster()
+        self._server = None
+        self._thread = None
+
+    @property
+    def url(self):
+        host = "localhost" if self.host in ("0.0.0.0", "") else self.host
+        return f"http://{host}:{self.port}/"
+
+    def start(self):
+        """Sunucuyu başlat - port kullanılıyorsa OSError fırlatır"""
+        handler = type("LiveHandler", (_Handler,), {'broadcaster': self.broadcaster})
+        self._server = ThreadingHTTPServer((self.host, self.port), handler)
+        self._server.daemon_threads = True
+        self.port = self._server.server_address[1]
+        self._thread = threading.Thread(
+            target=self._server.serve_forever, name="live_server", daemon=True
+        )
+        self._thread.start()
+        self.broadcaster.start()
+        print(f"Canlı web paneli: {self.url}")
+
+    def stop(self):
+        self.broadcaster.stop()
+        self.broadcaster.close_clients()
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    # Kısa yollar
+    def publish_sample(self, module, t, value):
+        self.broadcaster.publish_sample(module, t, value)
+
+    def publish_event(self, event, payload):
+        self.broadcaster.publish_event(event, payload)
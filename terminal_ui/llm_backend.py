@@ -0,0 +1,304 @@
+"""
+LLM Arka Uçları - Gemini ve Çevrimdışı Yerel Yanıtlayıcı
+GeminiWorker ve toplu komut satırı aracının kullandığı ortak akış arayüzü
+
+- GeminiBackend: google.generativeai ilk istekte bir kez yapılandırılır,
+  GenerativeModel bir kez oluşturulup sonraki isteklerde yeniden kullanılır
+  (istek başına kurulum gecikmesi yok)
+- LocalBackend: ağ ve API anahtarı olmadan hazır bir rapor metnini
+  ayarlanabilir ilk-token süresi (TTFT) ve hızla akıtır; AI yolunun tamamı
+  (chunk işleme, arayüz çizimi) çevrimdışı test edilip ölçülebilir
+
+Arka uç config.LLM_BACKEND ile ya da LLM_BACKEND çevre değişkeniyle seçilir.
+"""
+
+import os
+import threading
+import time
+
+import config
+
+
+# Model ayarları - Daha uzun ve detaylı yanıtlar için
+GENERATION_CONFIG = {
+    "temperature": 0.7,
+    "top_p": 0.95,
+    "top_k": 40,
+    "max_output_tokens": 8192,
+}
+
+# Güvenlik ayarları - Tıbbi içerik için
+SAFETY_SETTINGS = [
+    {
+        "category": "HARM_CATEGORY_HARASSMENT",
+        "threshold": "BLOCK_NONE",
+    },
+    {
+        "category": "HARM_CATEGORY_HATE_SPEECH",
+        "threshold": "BLOCK_NONE",
+    },
+    {
+        "category": "HARM_CATEGORY_SEXUALLY_EXPLICIT",
+        "threshold": "BLOCK_NONE",
+    },
+    {
+        "category": "HARM_CATEGORY_DANGEROUS_CONTENT",
+        "threshold": "BLOCK_NONE",
+    },
+]
+
+
+class BackendError(Exception):
+    """Arka uç hazırlanamadı ya da istek başarısız (mesaj kullanıcıya gösterilir)"""
+
+    def __init__(self, message, transient=False):
+        super().__init__(message)
+        self.transient = transient  # Yeniden denemeye değer mi (kota, geçici ağ hatası)
+
+
+# Yeniden denenebilir sağlayıcı hataları (google.api_core sınıf adları - import gerektirmez)
+_TRANSIENT_ERROR_NAMES = {
+    'ResourceExhausted', 'TooManyRequests', 'ServiceUnavailable',
+    'DeadlineExceeded', 'InternalServerError', 'GatewayTimeout', 'Aborted',
+}
+
+
+def is_transient_error(exc):
+    """Hata geçici mi (hız sınırı, zaman aşımı, sunucu tarafı) - yeniden denenebilir"""
+    if isinstance(exc, BackendError):
+        return exc.transient
+    if isinstance(exc, (ConnectionError, TimeoutError)):
+        return True
+    return type(exc).__name__ in _TRANSIENT_ERROR_NAMES
+
+
+class CancelToken:
+    """
+    İptal işareti - akış döngüsü kontrol eder, kayıtlı geri çağrılar
+    (ör. açık gRPC akışını kapatma) iptal anında hemen çalışır.
+    """
+
+    def __init__(self):
+        self._event = threading.Event()
+        self._callbacks = []
+        self._lock = threading.Lock()
+
+    @property
+    def cancelled(self):
+        return self._event.is_set()
+
+    def cancel(self):
+        with self._lock:
+            if self._event.is_set():
+                return
+            self._event.set()
+            callbacks, self._callbacks = self._callbacks, []
+        for callback in callbacks:
+            try:
+                callback()
+            except Exception as e:
+                print(f"İptal geri çağrısı hatası: {e}")
+
+    def on_cancel(self, callback):
+        """İptalde çağrılacak fonksiyon (zaten iptal edildiyse hemen çağrılır)"""
+        with self._lock:
+            if not self._event.is_set():
+                self._callbacks.append(callback)
+                return
+        callback()
+
+    def wait(self, timeout):
+        """timeout kadar bekle; iptal edilirse hemen True döner"""
+        return self._event.wait(timeout)
+
+
+class LLMBackend:
+    """Akışlı metin üreten arka uç arayüzü"""
+
+    name = "base"
+
+    def __init__(self, model_name, generation_config=None):
+        self.model_name = model_name
+        self.generation_config = dict(generation_config or GENERATION_CONFIG)
+
+    def prepare(self):
+        """İstemciyi hazırla (tekrar çağrılması ucuz olmalı) - hata: BackendError"""
+
+    def stream(self, prompt_text, cancel=None):
+        """
+        Yanıtı parça parça üretir.
+
+        Args:
+            prompt_text (str): Gönderilecek prompt
+            cancel (CancelToken): İptal edilince akış kesilir
+
+        Yields:
+            str: Yanıt chunk'ları
+        """
+        raise NotImplementedError
+
+
+class GeminiBackend(LLMBackend):
+    """google.generativeai üzerinden Gemini - istemci bir kez kurulur"""
+
+    name = "gemini"
+
+    def __init__(self, model_name=None, generation_config=None, safety_settings=None, api_key=None):
+        super().__init__(model_name or config.GEMINI_MODEL, generation_config)
+        self.safety_settings = safety_settings or SAFETY_SETTINGS
+        self.api_key = api_key
+        self._model = None
+        self._lock = threading.Lock()
+
+    def prepare(self):
+        if self._model is not None:
+            return
+
+        with self._lock:
+            if self._model is not None:
+                return
+
+            # API Key kontrolü
+            api_key = self.api_key or os.getenv("GEMINI_API_KEY")
+            if not api_key:
+                raise BackendError(
+                    "HATA: GEMINI_API_KEY çevre değişkeni bulunamadı.\n"
+                    "Lütfen API anahtarınızı ayarlayın:\n"
+                    "$env:GEMINI_API_KEY='API_ANAHTARINIZ' (PowerShell)"
+                )
+
+            # Gemini kütüphanesi ağırdır - açılışı yavaşlatmasın diye ilk kullanımda yüklenir
+            # (genelde açılıştaki arka plan ön yüklemesiyle zaten yüklenmiş olur)
+            import google.generativeai as genai
+
+            genai.configure(api_key=api_key)
+            self._model = genai.GenerativeModel(
+                model_name=self.model_name,
+                generation_config=self.generation_config,
+                safety_settings=self.safety_settings
+            )
+
+    def stream(self, prompt_text, cancel=None):
+        self.prepare()
+        response = self._model.generate_content(prompt_text, stream=True)
+        if cancel is not None:
+            # Bir sonraki chunk'ı beklerken iptal edilirse alttaki gRPC akışı kapatılır
+            cancel.on_cancel(lambda: _abort_stream(response))
+        for chunk in response:
+            if cancel is not None and cancel.cancelled:
+                break
+            if chunk.text:
+                yield chunk.text
+
+
+def _abort_stream(response):
+    """Gemini akış yanıtının alttaki çağrısını iptal et (destekleniyorsa)"""
+    abort = getattr(getattr(response, '_iterator', None), 'cancel', None)
+    if callable(abort):
+        abort()
+
+
+# Yerel arka ucun akıttığı hazır rapor (uzunluğu kısa yanıt uyarısını tetiklemez)
+LOCAL_RESPONSE = """## Yerel Test Yanıtı
+
+Bu metin **çevrimdışı yerel arka uç** tarafından üretilmiştir; gerçek bir
+klinik değerlendirme değildir. Gecikme ve akış ölçümü için kullanılır.
+
+### 1. Tremor Analizi (Modül A)
+
+- Dominant frekans ve genlik değerleri prompt içinde verilen metriklerden okunur.
+- Frekansın 4-6 Hz aralığına göre konumu bu bölümde yorumlanır.
+
+### 2. Kinematik Performans (Modül B)
+
+- Ortalama ve maksimum hız, hız eğimi ile birlikte değerlendirilir.
+- Negatif eğim hareket süresince yavaşlamaya işaret edebilir.
+
+### 3. Reaksiyon ve Yorgunluk (Modül C)
+
+- Ortalama reaksiyon süresi ve yorgunluk indeksi karşılaştırılır.
+- Deneme sırasındaki artış nöromüsküler yorgunluğu gösterebilir.
+
+### 4. Genel Sentez
+
+| Alan | Durum |
+|------|-------|
+| Tremor | Test |
+| Hız | Test |
+| Reaksiyon | Test |
+
+Bu rapor tamamen test amaçlıdır ve teşhis niteliği taşımaz.
+"""
+
+
+class LocalBackend(LLMBackend):
+    """Hazır yanıtı ayarlanabilir TTFT ve hızla akıtan çevrimdışı arka uç"""
+
+    name = "local"
+
+    def __init__(self, ttft_s=None, chars_per_s=None, chunk_chars=None, response_text=None,
+                 transient_failures=0):
+        """
+        Args:
+            transient_failures (int): İlk bu kadar istek geçici hatayla (kota
+                aşımı benzeri) başarısız olur - yeniden deneme yolunu sınamak için
+        """
+        super().__init__("local-stub")
+        self.ttft_s = config.LOCAL_LLM_TTFT_S if ttft_s is None else ttft_s
+        self.chars_per_s = config.LOCAL_LLM_CHARS_PER_S if chars_per_s is None else chars_per_s
+        self.chunk_chars = chunk_chars or config.LOCAL_LLM_CHUNK_CHARS
+        self.response_text = response_text or LOCAL_RESPONSE
+        self.transient_failures = transient_failures
+        self._lock = threading.Lock()
+
+    def stream(self, prompt_text, cancel=None):
+        cancel = cancel or CancelToken()
+        if self.ttft_s > 0 and cancel.wait(self.ttft_s):
+            return
+
+        with self._lock:
+            fail = self.transient_failures > 0
+            if fail:
+                self.transient_failures -= 1
+        if fail:
+            raise BackendError("Yerel arka uç: simüle edilmiş kota aşımı (429)", transient=True)
+
+        text = self.response_text
+        # Chunk'lar sabit aralıkla değil, hedef hıza göre zamanlanır (birikmiş kayma yok)
+        start = time.perf_counter()
+        for offset in range(0, len(text), self.chunk_chars):
+            if self.chars_per_s > 0:
+                delay = start + offset / self.chars_per_s - time.perf_counter()
+                if delay > 0 and cancel.wait(delay):
+                    return
+            if cancel.cancelled:
+                return
+            yield text[offset:offset + self.chunk_chars]
+
+
+BACKENDS = {
+    GeminiBackend.name: GeminiBackend,
+    LocalBackend.name: LocalBackend,
+}
+
+_backends = {}
+_backends_lock = threading.Lock()
+
+
+def get_backend(name=None):
+    """
+    Paylaşılan arka uç örneğini döndürür (istemci istekler arasında yeniden kullanılır).
+
+    Args:
+        name (str): 'gemini' veya 'local' (varsayılan: LLM_BACKEND çevre
+            değişkeni, yoksa config.LLM_BACKEND)
+    """
+    name = name or os.getenv("LLM_BACKEND") or config.LLM_BACKEND
+    if name not in BACKENDS:
+        raise BackendError(f"Bilinmeyen LLM arka ucu: {name}")
+
+    with _backends_lock:
+        backend = _backends.get(name)
+        if backend is None:
+            backend = _backends[name] = BACKENDS[name]()
+        return backend
@@ -1,18 +1,42 @@
 import sys
 import os
+import startup
+startup.enable_from_argv()  # --startup-report: import süreleri burada ölçülmeye başlar
+import profiling
+profiling.enable_from_argv()  # --profile / TERMINAL_UI_PROFILE: seans profili burada başlar
 from PyQt6.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout, 
                              QHBoxLayout, QPushButton, QLabel, QComboBox,
-                             QGroupBox, QStatusBar, QGridLayout, QScrollArea, QTextEdit)
-from PyQt6.QtCore import Qt
+                             QGroupBox, QStatusBar, QGridLayout, QScrollArea, QTextEdit,
+                             QCheckBox, QProgressBar, QLineEdit, QTableView,
+                             QAbstractItemView, QHeaderView, QTabWidget,
+                             QTableWidget, QTableWidgetItem)
+from PyQt6.QtCore import Qt, QTimer
 from PyQt6.QtGui import QFont
+import numpy as np
 import pyqtgraph as pg
 import config
 from styles import get_stylesheet, Colors
 from serial_manager import SerialManager, get_available_ports
+from serial_protocol import parse_line, EVENT_FINISHED, EVENT_CONTINUOUS_STOPPED
 from data_logger import DataLogger
-from signal_processor import process_all_modules, save_results_to_file
+from ring_buffer import RingBuffer
+from render_scheduler import RenderScheduler
+from streaming_text import StreamingTextSink
+from decimation import MinMaxDecimator
+from continuous_monitor import ContinuousSession
+from analysis_worker import AnalysisWorker, format_timings
 from gemini_api_handler import GeminiWorker, get_latest_analysis_json, create_prompt_from_json, get_all_analysis_json_files
 from historical_analysis import create_prompt_from_files
+from startup import PrewarmWorker
+from session_index import SessionIndex
+from session_browser import SessionTableModel, SessionIndexWorker
+from trend_store import TREND_METRICS
+from report_store import ReportStore
+from live_server import LiveServer
+
+
+# Arşiv tablosunda kaynak yanında gösterilen rapor türü (tek seans raporu etiketsiz)
+REPORT_KIND_LABELS = {'history': 'geçmiş', 'patient': 'hasta'}
 
 
 class TerminalUI(QMainWindow):
@@ -24,6 +48,12 @@ class TerminalUI(QMainWindow):
         self.data_logger = DataLogger()  # Veri kaydedici
         self.modules_completed = {'A': False, 'B': False, 'C': False}  # Modül tamamlanma takibi
         self.gemini_worker = None  # Gemini API worker thread
+        self.analysis_worker = None  # Seans sonu analiz worker thread
+        self.retired_analysis_workers = []  # İptal edilip arka planda biten eski analizler
+        self.continuous_sessions = {}  # Sürekli izleme oturumları (modül -> ContinuousSession)
+        self.prewarm_worker = None  # Ağır modülleri arka planda yükleyen thread
+        self.session_index_worker = None  # Seans indeksi eşitleme thread
+        self.live_server = None  # Canlı web paneli (opsiyonel)
         self.init_ui()
         
     def init_ui(self):
@@ -67,8 +97,20 @@ class TerminalUI(QMainWindow):
         left_layout.addWidget(self.create_module_b())
         left_layout.addWidget(self.create_module_c())
         
-        # Sağ taraf - AI Analiz paneli
-        right_widget = self.create_ai_analysis_panel()
+        # Sağ taraf - AI Analiz paneli ve seans tarayıcısı
+        right_widget = QWidget()
+        right_layout = QVBoxLayout()
+        right_layout.setContentsMargins(0, 0, 0, 0)
+        right_widget.setLayout(right_layout)
+        right_layout.addWidget(self.create_ai_analysis_panel(), 3)
+        
+        # Geçmiş seanslar ve hasta trendleri sekmeleri
+        self.history_tabs = QTabWidget()
+        self.history_tabs.addTab(self.create_session_browser(), "Geçmiş Seanslar")
+        self.history_tabs.addTab(self.create_trends_panel(), "Trendler")
+        self.history_tabs.addTab(self.create_report_archive_panel(), "AI Raporları")
+        self.history_tabs.currentChanged.connect(self.on_history_tab_changed)
+        right_layout.addWidget(self.history_tabs, 2)
         
         # Layout'a ekle (70% sol, 30% sağ)
         main_layout.addWidget(left_widget, 7)
@@ -79,9 +121,36 @@ class TerminalUI(QMainWindow):
         self.setStatusBar(self.status_bar)
         self.status_bar.showMessage("Hazır")
         
+        # Arka plan analiz ilerlemesi ve iptal
+        self.analysis_progress = QProgressBar()
+        self.analysis_progress.setRange(0, 100)
+        self.analysis_progress.setMaximumWidth(200)
+        self.analysis_progress.hide()
+        self.status_bar.addPermanentWidget(self.analysis_progress)
+        
+        self.analysis_cancel_btn = QPushButton("Analizi İptal Et")
+        self.analysis_cancel_btn.setObjectName("stopButton")
+        self.analysis_cancel_btn.clicked.connect(self.on_cancel_signal_processing)
+        self.analysis_cancel_btn.hide()
+        self.status_bar.addPermanentWidget(self.analysis_cancel_btn)
+        
         # Dark theme
         self.setStyleSheet(get_stylesheet())
         
+        # Grafik yenileme - örnekleme hızından bağımsız, sabit FPS
+        self.render_scheduler = RenderScheduler(parent=self)
+        # Modül A/B uzun kayıtlarda min/max seyreltilmiş veriyle çizilir
+        self.render_scheduler.register(
+            'A', self.mod_a_curve,
+            lambda: self.mod_a_decimator.select(self.visible_x_range(self.mod_a_plot))
+        )
+        self.render_scheduler.register(
+            'B', self.mod_b_curve,
+            lambda: self.mod_b_decimator.select(self.visible_x_range(self.mod_b_plot))
+        )
+        self.render_scheduler.register('C', self.mod_c_curve, self.mod_c_buffer.columns)
+        self.render_scheduler.start()
+        
     def create_control_panel(self):
         """Kontrol paneli oluştur"""
         group = QGroupBox("Kontrol Paneli")
@@ -112,6 +181,16 @@ class TerminalUI(QMainWindow):
         
         layout.addLayout(conn_layout)
         
+        # Hasta satırı - sonuç dosyasına ve seans indeksine yazılır
+        patient_layout = QHBoxLayout()
+        patient_layout.addWidget(QLabel("Hasta ID:"))
+        self.patient_input = QLineEdit()
+        self.patient_input.setPlaceholderText("ör. H-0001")
+        self.patient_input.setMaximumWidth(200)
+        patient_layout.addWidget(self.patient_input)
+        patient_layout.addStretch()
+        layout.addLayout(patient_layout)
+        
         # Modül kontrolleri
         module_group = QGroupBox("Modül Kontrolleri")
         module_layout = QGridLayout()
@@ -167,6 +246,12 @@ class TerminalUI(QMainWindow):
         self.mod_c_status.setStyleSheet("color: #999999;")
         module_layout.addWidget(self.mod_c_status, 2, 3)
         
+        # Sürekli izleme - Modül A/B süre sınırı olmadan akar, pencereli analiz
+        self.continuous_check = QCheckBox(
+            f"Sürekli İzleme (Modül A/B, {config.CONTINUOUS_WINDOW_S} sn pencereler)"
+        )
+        module_layout.addWidget(self.continuous_check, 3, 0, 1, 4)
+        
         module_group.setLayout(module_layout)
         layout.addWidget(module_group)
         
@@ -192,6 +277,12 @@ class TerminalUI(QMainWindow):
         self.ai_historical_btn.clicked.connect(self.on_run_historical_analysis)
         control_layout.addWidget(self.ai_historical_btn)
         
+        self.ai_cancel_btn = QPushButton("İptal")
+        self.ai_cancel_btn.setObjectName("stopButton")
+        self.ai_cancel_btn.clicked.connect(self.on_cancel_ai_analysis)
+        self.ai_cancel_btn.setEnabled(False)
+        control_layout.addWidget(self.ai_cancel_btn)
+        
         control_layout.addStretch()
         
         self.ai_status_label = QLabel("● Hazır")
@@ -214,9 +305,147 @@ class TerminalUI(QMainWindow):
         
         layout.addWidget(self.ai_result_text)
         
+        # Akış yanıtı kare hızında, birleştirilerek yazılır
+        self.ai_stream = StreamingTextSink(self.ai_result_text, parent=self)
+        
+        group.setLayout(layout)
+        return group
+        
+    def create_session_browser(self):
+        """Geçmiş seans tarayıcısı - indekslenmiş, sayfalı tablo"""
+        group = QGroupBox("Geçmiş Seanslar")
+        layout = QVBoxLayout()
+        
+        # Filtre satırı
+        filter_layout = QHBoxLayout()
+        self.session_filter = QLineEdit()
+        self.session_filter.setPlaceholderText("Hasta ID veya tarih (YYYY-AA-GG) ile filtrele...")
+        self.session_filter.textChanged.connect(self.on_session_filter_changed)
+        filter_layout.addWidget(self.session_filter)
+        
+        self.session_refresh_btn = QPushButton("Yenile")
+        self.session_refresh_btn.clicked.connect(self.refresh_session_index)
+        filter_layout.addWidget(self.session_refresh_btn)
+        
+        self.session_count_label = QLabel("")
+        filter_layout.addWidget(self.session_count_label)
+        layout.addLayout(filter_layout)
+        
+        # Tablo - satırlar kaydırdıkça indeksten sayfa sayfa çekilir
+        self.session_index = SessionIndex()
+        self.session_model = SessionTableModel(self.session_index, parent=self)
+        self.session_model.modelReset.connect(self.update_session_count)
+        
+        self.session_table = QTableView()
+        self.session_table.setModel(self.session_model)
+        self.session_table.setSortingEnabled(True)
+        self.session_table.sortByColumn(1, Qt.SortOrder.DescendingOrder)
+        self.session_table.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
+        self.session_table.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+        self.session_table.verticalHeader().setVisible(False)
+        # İçeriğe göre boyutlandırma her satırı ölçer - sabit genişlik kullan
+        self.session_table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Interactive)
+        self.session_table.doubleClicked.connect(self.on_session_double_clicked)
+        layout.addWidget(self.session_table)
+        
+        # Debounce - her tuş vuruşunda sorgu atılmasın
+        self.session_filter_timer = QTimer(self)
+        self.session_filter_timer.setSingleShot(True)
+        self.session_filter_timer.setInterval(250)
+        self.session_filter_timer.timeout.connect(
+            lambda: self.session_model.set_filter(self.session_filter.text())
+        )
+        
         group.setLayout(layout)
         return group
+    
+    def create_trends_panel(self):
+        """Hasta bazlı boylamsal trend grafiği - önceden hesaplanmış serilerden"""
+        group = QGroupBox("Hasta Trendleri")
+        layout = QVBoxLayout()
+        
+        # Seçim satırı
+        select_layout = QHBoxLayout()
+        select_layout.addWidget(QLabel("Hasta:"))
+        self.trend_patient_combo = QComboBox()
+        self.trend_patient_combo.currentIndexChanged.connect(self.update_trend_plot)
+        select_layout.addWidget(self.trend_patient_combo)
+        
+        select_layout.addWidget(QLabel("Metrik:"))
+        self.trend_metric_combo = QComboBox()
+        for metric, title in TREND_METRICS:
+            self.trend_metric_combo.addItem(title, metric)
+        self.trend_metric_combo.currentIndexChanged.connect(self.update_trend_plot)
+        select_layout.addWidget(self.trend_metric_combo)
+        select_layout.addStretch()
+        layout.addLayout(select_layout)
+        
+        # Grafik - seans değerleri, hareketli ortalama ve ±1 std bandı
+        self.trend_plot = pg.PlotWidget(axisItems={'bottom': pg.DateAxisItem()})
+        self.trend_plot.setBackground(Colors.BG_SECONDARY)
+        self.trend_plot.showGrid(x=True, y=True, alpha=0.3)
+        self.trend_plot.addLegend()
+        
+        self.trend_upper_curve = self.trend_plot.plot(pen=None)
+        self.trend_lower_curve = self.trend_plot.plot(pen=None)
+        self.trend_plot.addItem(pg.FillBetweenItem(
+            self.trend_upper_curve, self.trend_lower_curve,
+            brush=pg.mkBrush(Colors.ACCENT + "40")
+        ))
+        self.trend_mean_curve = self.trend_plot.plot(
+            pen=pg.mkPen(Colors.ACCENT, width=2),
+            name=f"Hareketli ort. ({config.TREND_ROLLING_WINDOW} seans)"
+        )
+        self.trend_value_curve = self.trend_plot.plot(
+            pen=pg.mkPen('#999999', width=1),
+            symbol='o', symbolSize=6, symbolBrush='#ffffff',
+            name="Seans"
+        )
+        layout.addWidget(self.trend_plot)
         
+        self.trend_summary_label = QLabel("")
+        layout.addWidget(self.trend_summary_label)
+        
+        group.setLayout(layout)
+        return group
+    
+    def create_report_archive_panel(self):
+        """Kayıtlı AI raporları - tam metin arama (SQLite FTS5)"""
+        group = QGroupBox("AI Rapor Arşivi")
+        layout = QVBoxLayout()
+        
+        # Arama satırı
+        search_layout = QHBoxLayout()
+        self.report_search = QLineEdit()
+        self.report_search.setPlaceholderText("Raporlarda ara (ör. tremor yorgunluk)...")
+        self.report_search.textChanged.connect(self.on_report_search_changed)
+        search_layout.addWidget(self.report_search)
+        
+        self.report_count_label = QLabel("")
+        search_layout.addWidget(self.report_count_label)
+        layout.addLayout(search_layout)
+        
+        # Sonuç tablosu - en ilgili rapor önce, eşleşen bölüm [ ] içinde
+        self.report_store = ReportStore()
+        self.report_table = QTableWidget(0, 4)
+        self.report_table.setHorizontalHeaderLabels(["Tarih", "Kaynak", "Model", "Eşleşme"])
+        self.report_table.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
+        self.report_table.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+        self.report_table.verticalHeader().setVisible(False)
+        self.report_table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Interactive)
+        self.report_table.horizontalHeader().setStretchLastSection(True)
+        self.report_table.doubleClicked.connect(self.on_report_double_clicked)
+        layout.addWidget(self.report_table)
+        
+        # Debounce - her tuş vuruşunda sorgu atılmasın
+        self.report_search_timer = QTimer(self)
+        self.report_search_timer.setSingleShot(True)
+        self.report_search_timer.setInterval(250)
+        self.report_search_timer.timeout.connect(self.refresh_reports)
+        
+        group.setLayout(layout)
+        return group
+    
     def create_module_a(self):
         """Modül A - Tremor"""
         group = QGroupBox("MODÜL A: Tremor Analizi (LDR Sensör)")
@@ -235,9 +464,15 @@ class TerminalUI(QMainWindow):
             pen=pg.mkPen(Colors.ACCENT, width=2)
         )
         
-        # Veri bufferleri
-        self.mod_a_time_data = []
-        self.mod_a_ldr_data = []
+        # Veri bufferi (Zaman, LDR)
+        self.mod_a_buffer = RingBuffer(
+            config.PLOT_BUFFER_CAPACITY,
+            initial_capacity=config.PLOT_BUFFER_INITIAL_CAPACITY
+        )
+        self.mod_a_decimator = MinMaxDecimator(self.mod_a_buffer)
+        
+        # Yakınlaştırma/kaydırmada görünür aralığa göre yeniden seyrelt
+        self.mod_a_plot.sigXRangeChanged.connect(lambda *_: self.on_plot_range_changed('A'))
         
         layout.addWidget(self.mod_a_plot)
         
@@ -262,9 +497,15 @@ class TerminalUI(QMainWindow):
             pen=pg.mkPen('#00ff88', width=2)  # Yeşil renk
         )
         
-        # Veri bufferleri
-        self.mod_b_time_data = []
-        self.mod_b_distance_data = []
+        # Veri bufferi (Zaman, Mesafe)
+        self.mod_b_buffer = RingBuffer(
+            config.PLOT_BUFFER_CAPACITY,
+            initial_capacity=config.PLOT_BUFFER_INITIAL_CAPACITY
+        )
+        self.mod_b_decimator = MinMaxDecimator(self.mod_b_buffer)
+        
+        # Yakınlaştırma/kaydırmada görünür aralığa göre yeniden seyrelt
+        self.mod_b_plot.sigXRangeChanged.connect(lambda *_: self.on_plot_range_changed('B'))
         
         layout.addWidget(self.mod_b_plot)
         
@@ -301,15 +542,31 @@ class TerminalUI(QMainWindow):
             symbolBrush='#ffaa00'  # Turuncu renk
         )
         
-        # Veri bufferleri
-        self.mod_c_trial_data = []
-        self.mod_c_reaction_data = []
+        # Veri bufferi (Deneme #, Reaksiyon Zamanı)
+        self.mod_c_buffer = RingBuffer(
+            config.PLOT_BUFFER_CAPACITY,
+            initial_capacity=config.MODULE_C_MAX_PRESSES
+        )
         
         layout.addWidget(self.mod_c_plot)
         
         group.setLayout(layout)
         return group
         
+    @staticmethod
+    def visible_x_range(plot):
+        """Grafiğin görünür zaman aralığı - otomatik ölçekte None (tüm veri)"""
+        view_box = plot.getViewBox()
+        if view_box.state['autoRange'][0]:
+            return None
+        return tuple(view_box.viewRange()[0])
+    
+    def on_plot_range_changed(self, module):
+        """Kullanıcı yakınlaştırdı/kaydırdı - eğriyi yeni aralıkla yeniden çiz"""
+        plot = self.mod_a_plot if module == 'A' else self.mod_b_plot
+        if not plot.getViewBox().state['autoRange'][0]:
+            self.render_scheduler.mark_dirty(module)
+        
     def on_connect(self):
         """Bağlan/Bağlantıyı kes"""
         if self.connect_btn.text() == "Bağlan":
@@ -336,7 +593,8 @@ class TerminalUI(QMainWindow):
             self.status_label.setStyleSheet("color: #ffaa00; font-weight: bold;")
             
         else:
-            # Bağlantıyı kes
+            # Bağlantıyı kes - önce sürekli izlemenin son penceresi kaydedilsin
+            self.stop_continuous_monitoring()
             if self.serial_manager:
                 self.serial_manager.disconnect()
                 self.serial_manager.wait()  # Thread'in bitmesini bekle
@@ -374,99 +632,54 @@ class TerminalUI(QMainWindow):
         """Arduino'dan veri geldi"""
         print(f"Arduino: {data}")
         
-        # Test bitişini kontrol et
-        # Arduino mesajları:
-        # ">>> System 1 Finished (10 seconds elapsed) <<<"
-        # ">>> System 2 Finished (10 seconds elapsed) <<<"
-        # ">>> GAME OVER! Total 20 correct presses completed! <<<"
-        
-        if "System 1 Finished" in data or "FINISHED!" in data:
-            # Modül A testi bitti
-            self.auto_stop_module('A')
-            return
-        elif "System 2 Finished" in data:
-            # Modül B testi bitti
-            self.auto_stop_module('B')
+        event = parse_line(data)
+        if event is None:
             return
-        elif "GAME OVER" in data:
-            # Modül C testi bitti
-            self.auto_stop_module('C')
-            return
-        
-        # Veriyi parse et
-        try:
-            if '|' in data:
-                parts = data.split('|')
-                
-                # MODÜL A: "1138 ms | 532 | 132" (3 parça)
-                if len(parts) >= 3:
-                    # İlk kısım: zaman (ms)
-                    time_str = parts[0].strip().replace('ms', '').strip()
-                    time_ms = float(time_str)
-                    time_s = time_ms / 1000.0
-                    
-                    # İkinci kısım: LDR değeri
-                    ldr_value = int(parts[1].strip())
-                    
-                    # Modül A grafiğine ekle
-                    self.mod_a_time_data.append(time_s)
-                    self.mod_a_ldr_data.append(ldr_value)
-                    self.mod_a_curve.setData(self.mod_a_time_data, self.mod_a_ldr_data)
-                    
-                    # CSV'ye kaydet (sadece zaman ve LDR)
-                    self.data_logger.log_module_a(time_s, ldr_value)
-                
-                # MODÜL B: "500 ms | 145.3 mm" (2 parça)
-                elif len(parts) == 2 and 'mm' in parts[1]:
-                    # İlk kısım: zaman (ms)
-                    time_str = parts[0].strip().replace('ms', '').strip()
-                    time_ms = float(time_str)
-                    time_s = time_ms / 1000.0
-                    
-                    # İkinci kısım: mesafe (mm)
-                    distance_str = parts[1].strip().replace('mm', '').strip()
-                    distance = float(distance_str)
-                    
-                    # Modül B grafiğine ekle
-                    self.mod_b_time_data.append(time_s)
-                    self.mod_b_distance_data.append(distance)
-                    self.mod_b_curve.setData(self.mod_b_time_data, self.mod_b_distance_data)
-                    
-                    # CSV'ye kaydet
-                    self.data_logger.log_module_b(time_s, distance)
+        kind, module, x, y = event
+        
+        if kind == EVENT_CONTINUOUS_STOPPED:
+            # Sürekli izleme durduruldu (firmware '0' komutunu onayladı)
+            self.finish_continuous_sessions()
+        elif kind == EVENT_FINISHED:
+            # Modül testi bitti
+            self.auto_stop_module(module)
+        elif module == 'A':
+            # Modül A grafiğine ekle (x: zaman (s), y: LDR değeri)
+            self.mod_a_buffer.append(x, y)
+            self.render_scheduler.mark_dirty('A')
+            self.publish_live_sample('A', x, y)
             
-            # MODÜL C: "Correct! Reaction Time: 879 ms | Presses: 3/20"
-            if 'Reaction Time:' in data and 'Presses:' in data:
-                parts = data.split('|')
-                if len(parts) >= 2:
-                    # İlk kısım: "Correct! Reaction Time: 879 ms"
-                    reaction_part = parts[0].strip()
-                    if 'Reaction Time:' in reaction_part:
-                        reaction_str = reaction_part.split('Reaction Time:')[1].strip()
-                        reaction_time = float(reaction_str.replace('ms', '').strip())
-                        
-                        # İkinci kısım: "Presses: 3/20"
-                        presses_part = parts[1].strip()
-                        if 'Presses:' in presses_part:
-                            presses_str = presses_part.split('Presses:')[1].strip()
-                            trial_num = int(presses_str.split('/')[0].strip())
-                            
-                            # Modül C grafiğine ekle
-                            self.mod_c_trial_data.append(trial_num)
-                            self.mod_c_reaction_data.append(reaction_time)
-                            self.mod_c_curve.setData(self.mod_c_trial_data, self.mod_c_reaction_data)
-                            
-                            # İstatistikleri güncelle
-                            avg_reaction = sum(self.mod_c_reaction_data) / len(self.mod_c_reaction_data)
-                            self.mod_c_total_label.setText(f"Toplam Basış: {trial_num}/20")
-                            self.mod_c_avg_label.setText(f"Ortalama: {avg_reaction:.0f} ms")
-                            
-                            # CSV'ye kaydet
-                            self.data_logger.log_module_c(trial_num, reaction_time)
-                    
-        except Exception as e:
-            # Parse hatası - sadece devam et
-            pass
+            # Sürekli modda pencere parçalarına, aksi halde CSV'ye kaydet
+            session = self.continuous_sessions.get('A')
+            if session:
+                session.add_sample(x, y)
+            else:
+                self.data_logger.log_module_a(x, y)
+        elif module == 'B':
+            # Modül B grafiğine ekle (x: zaman (s), y: mesafe (mm))
+            self.mod_b_buffer.append(x, y)
+            self.render_scheduler.mark_dirty('B')
+            self.publish_live_sample('B', x, y)
+            
+            # Sürekli modda pencere parçalarına, aksi halde CSV'ye kaydet
+            session = self.continuous_sessions.get('B')
+            if session:
+                session.add_sample(x, y)
+            else:
+                self.data_logger.log_module_b(x, y)
+        elif module == 'C':
+            # Modül C grafiğine ekle (x: deneme no, y: reaksiyon süresi (ms))
+            self.mod_c_buffer.append(x, y)
+            self.render_scheduler.mark_dirty('C')
+            self.publish_live_sample('C', x, y)
+            
+            # İstatistikleri güncelle
+            avg_reaction = self.mod_c_buffer.columns()[1].mean()
+            self.mod_c_total_label.setText(f"Toplam Basış: {x}/20")
+            self.mod_c_avg_label.setText(f"Ortalama: {avg_reaction:.0f} ms")
+            
+            # CSV'ye kaydet
+            self.data_logger.log_module_c(x, y)
     
     def auto_stop_module(self, module):
         """Test bittiğinde otomatik durdur"""
@@ -477,6 +690,7 @@ class TerminalUI(QMainWindow):
         self.modules_completed[module] = True
         
         self.status_bar.showMessage(f"✓ Modül {module} tamamlandı! Veri kaydedildi: {file_path}")
+        self.publish_live_event('status', {'module': module, 'state': 'completed'})
         
         if module == 'A':
             self.mod_a_start.setEnabled(True)
@@ -499,35 +713,87 @@ class TerminalUI(QMainWindow):
             self.run_signal_processing()
     
     def run_signal_processing(self):
-        """Tüm modüller tamamlandığında sinyal işleme analizi yap"""
+        """Tüm modüller tamamlandığında sinyal işleme analizini arka planda başlat"""
         self.status_bar.showMessage(">> Sinyal işleme analizi başlatılıyor...")
         
-        try:
-            # Get CSV file paths
-            files = self.data_logger.get_files()
-            
-            # Run analysis
-            results = process_all_modules(
-                files['A'],  # module_A CSV
-                files['B'],  # module_B CSV  
-                files['C']   # module_C CSV
-            )
-            
-            # Save results to JSON
-            saved_file = save_results_to_file(results)
-            
-            # Show success message
-            self.status_bar.showMessage(f">> Analiz tamamlandı! Sonuçlar: {saved_file}")
-            
-            # Otomatik AI analizi başlat
-            self.on_run_ai_analysis()
-            
-            # Reset completion tracking for next session
-            self.modules_completed = {'A': False, 'B': False, 'C': False}
-            
-        except Exception as e:
-            self.status_bar.showMessage(f"xx Analiz hatası: {str(e)}")
-            
+        # Önceki analiz hâlâ sürüyorsa iptal et; beklenmez (UI donmasın), sinyalleri
+        # koparılır ve bitene kadar referansı tutulur
+        if self.analysis_worker and self.analysis_worker.isRunning():
+            self.retire_analysis_worker(self.analysis_worker)
+        
+        # Worker thread oluştur ve başlat (CSV okuma, FFT, JSON, prompt)
+        self.analysis_worker = AnalysisWorker(
+            self.data_logger.get_files(),
+            patient_id=self.patient_input.text().strip()
+        )
+        self.analysis_worker.progress.connect(self.on_signal_processing_progress)
+        self.analysis_worker.completed.connect(self.on_signal_processing_complete)
+        self.analysis_worker.cancelled.connect(self.on_signal_processing_cancelled)
+        self.analysis_worker.error_occurred.connect(self.on_signal_processing_error)
+        
+        self.analysis_progress.setValue(0)
+        self.analysis_progress.show()
+        self.analysis_cancel_btn.show()
+        self.analysis_worker.start()
+    
+    def retire_analysis_worker(self, worker):
+        """Eski analiz worker'ını iptal et ve sonucunu UI'dan ayır"""
+        for signal in (worker.progress, worker.completed, worker.cancelled, worker.error_occurred):
+            signal.disconnect()
+        worker.cancel()
+        self.retired_analysis_workers.append(worker)
+        worker.finished.connect(lambda: self.retired_analysis_workers.remove(worker))
+    
+    def on_signal_processing_progress(self, percent, message):
+        """Analiz ilerlemesi"""
+        self.analysis_progress.setValue(percent)
+        self.status_bar.showMessage(f">> {message}")
+    
+    def on_signal_processing_complete(self, results, saved_file, prompt_text, timings):
+        """Arka plan analizi tamamlandı - sonucu göster ve AI analizini başlat"""
+        self.hide_signal_processing_progress()
+        
+        # Show success message
+        timing_text = format_timings(timings)
+        print(f"Analiz gecikme dağılımı: {timing_text}")
+        self.status_bar.showMessage(f">> Analiz tamamlandı! Sonuçlar: {saved_file} ({timing_text})")
+        
+        self.publish_live_event('analysis', results)
+        
+        # Otomatik AI analizi başlat (prompt worker'da hazırlandı)
+        self.start_gemini_worker(
+            prompt_text,
+            f"📄 Analiz dosyası: {os.path.basename(saved_file)}\n",
+            source_id=os.path.basename(saved_file)
+        )
+        
+        # Seans tarayıcısında ve trendlerde yeni kaydı göster
+        self.refresh_history_views()
+        
+        # Reset completion tracking for next session
+        self.modules_completed = {'A': False, 'B': False, 'C': False}
+    
+    def on_signal_processing_cancelled(self):
+        """Analiz kullanıcı tarafından iptal edildi"""
+        self.hide_signal_processing_progress()
+        self.status_bar.showMessage("xx Analiz iptal edildi")
+    
+    def on_signal_processing_error(self, error_text):
+        """Arka plan analizinde hata oluştu"""
+        self.hide_signal_processing_progress()
+        self.status_bar.showMessage(f"xx {error_text}")
+    
+    def on_cancel_signal_processing(self):
+        """İptal butonu"""
+        if self.analysis_worker and self.analysis_worker.isRunning():
+            self.analysis_worker.cancel()
+            self.status_bar.showMessage(">> Analiz iptal ediliyor...")
+    
+    def hide_signal_processing_progress(self):
+        """İlerleme çubuğunu ve iptal butonunu gizle"""
+        self.analysis_progress.hide()
+        self.analysis_cancel_btn.hide()
+    
     def on_start_module(self, module):
         """Modül başlat - Arduino'ya komut gönder"""
         if not self.serial_manager:
@@ -535,11 +801,12 @@ class TerminalUI(QMainWindow):
             return
             
         # Komut belirle
+        continuous = self.continuous_check.isChecked() and module in ('A', 'B')
         command = None
         if module == 'A':
-            command = '1'
+            command = '4' if continuous else '1'
         elif module == 'B':
-            command = '2'
+            command = '5' if continuous else '2'
         elif module == 'C':
             command = '3'
             
@@ -548,13 +815,22 @@ class TerminalUI(QMainWindow):
             # Reset completion status
             self.modules_completed[module] = False
             
+            if continuous:
+                # Önceki oturum varsa kapat, yenisini başlat
+                self.finish_continuous_sessions(module)
+                session = ContinuousSession(module)
+                session.window_analyzed.connect(self.on_continuous_window)
+                self.continuous_sessions[module] = session
+            
             self.status_bar.showMessage(f"Modül {module} başlatıldı - Komut '{command}' gönderildi")
+            self.publish_live_event('status', {
+                'module': module, 'state': 'running', 'continuous': continuous
+            })
             
             if module == 'A':
                 # Veriyi temizle
-                self.mod_a_time_data.clear()
-                self.mod_a_ldr_data.clear()
-                self.mod_a_curve.setData([], [])
+                self.mod_a_buffer.clear()
+                self.render_scheduler.mark_dirty('A')
                 
                 self.mod_a_start.setEnabled(False)
                 self.mod_a_stop.setEnabled(True)
@@ -562,9 +838,8 @@ class TerminalUI(QMainWindow):
                 self.mod_a_status.setStyleSheet("color: #00a86b; font-weight: bold;")
             elif module == 'B':
                 # Veriyi temizle
-                self.mod_b_time_data.clear()
-                self.mod_b_distance_data.clear()
-                self.mod_b_curve.setData([], [])
+                self.mod_b_buffer.clear()
+                self.render_scheduler.mark_dirty('B')
                 
                 self.mod_b_start.setEnabled(False)
                 self.mod_b_stop.setEnabled(True)
@@ -572,9 +847,8 @@ class TerminalUI(QMainWindow):
                 self.mod_b_status.setStyleSheet("color: #00a86b; font-weight: bold;")
             elif module == 'C':
                 # Veriyi temizle
-                self.mod_c_trial_data.clear()
-                self.mod_c_reaction_data.clear()
-                self.mod_c_curve.setData([], [])
+                self.mod_c_buffer.clear()
+                self.render_scheduler.mark_dirty('C')
                 self.mod_c_total_label.setText("Toplam Basış: 0/20")
                 self.mod_c_avg_label.setText("Ortalama: - ms")
                 
@@ -586,6 +860,13 @@ class TerminalUI(QMainWindow):
     def on_stop_module(self, module):
         """Modül durdur"""
         self.status_bar.showMessage(f"Modül {module} durduruldu")
+        self.publish_live_event('status', {'module': module, 'state': 'stopped'})
+        
+        # Sürekli izlemede firmware'e durdurma komutu gönder
+        if module in self.continuous_sessions:
+            if self.serial_manager:
+                self.serial_manager.send_command('0')
+            self.finish_continuous_sessions(module)
         
         if module == 'A':
             self.mod_a_start.setEnabled(True)
@@ -603,6 +884,49 @@ class TerminalUI(QMainWindow):
             self.mod_c_status.setText("● Durduruldu")
             self.mod_c_status.setStyleSheet("color: #999999;")
     
+    def finish_continuous_sessions(self, module=None, wait=False):
+        """Sürekli izleme oturum(lar)ını kapat - son pencere arka planda analiz edilir"""
+        modules = [module] if module else list(self.continuous_sessions)
+        for key in modules:
+            session = self.continuous_sessions.pop(key, None)
+            if session:
+                session.finish(wait=wait)
+                self.status_bar.showMessage(
+                    f"Modül {key} sürekli izleme bitti - {session.window_index} pencere: {session.session_dir}"
+                )
+    
+    def stop_continuous_monitoring(self):
+        """
+        Bağlantı kesilirken/pencere kapanırken sürekli izlemeyi durdur.
+        
+        Firmware'e durdurma komutu gönderilir, açık son pencere kapatılır ve
+        CSV parçası ile metrics.jsonl satırı yazılana kadar beklenir.
+        """
+        if not self.continuous_sessions:
+            return
+        if self.serial_manager:
+            self.serial_manager.send_command('0')
+        self.finish_continuous_sessions(wait=True)
+    
+    def on_continuous_window(self, module, record):
+        """Sürekli izleme penceresi analiz edildi"""
+        self.publish_live_event('window', {'module': module, **record})
+        index = record.get('window_index')
+        if record.get('status') != 'success':
+            self.status_bar.showMessage(
+                f"Modül {module} pencere {index}: {record.get('error_message', 'hata')}"
+            )
+        elif module == 'A':
+            self.status_bar.showMessage(
+                f"Modül A pencere {index}: {record['dominant_frequency_hz']} Hz, "
+                f"genlik {record['signal_amplitude']}"
+            )
+        else:
+            self.status_bar.showMessage(
+                f"Modül B pencere {index}: ort. hız {record['avg_velocity_mm_s']} mm/s, "
+                f"eğim {record['velocity_slope']}"
+            )
+    
     def on_run_ai_analysis(self):
         """AI analizini çalıştır"""
         # En yeni JSON dosyasını bul
@@ -626,21 +950,40 @@ class TerminalUI(QMainWindow):
             self.ai_result_text.setText(f"Prompt oluşturma hatası: {str(e)}")
             return
         
+        self.start_gemini_worker(
+            prompt_text,
+            f"📄 Analiz dosyası: {os.path.basename(json_file)}\n",
+            source_id=os.path.basename(json_file)
+        )
+    
+    def start_gemini_worker(self, prompt_text, header_text, source_id=None, kind="session"):
+        """
+        UI'ı hazırla ve isteği AI kuyruğuna gönder
+        
+        Args:
+            source_id (str): Tamamlanan raporun arşivde bağlanacağı sonuç dosyası
+            kind (str): 'session' (tek seans) veya 'history' (geçmiş analizi)
+        """
         # UI'ı güncelle
         self.ai_status_label.setText("● Yükleniyor...")
         self.ai_status_label.setStyleSheet("color: #ffaa00; font-weight: bold;")
         self.ai_result_text.clear()
-        self.ai_result_text.append(f"📄 Analiz dosyası: {os.path.basename(json_file)}\n")
+        self.ai_result_text.append(header_text)
         self.ai_result_text.append(f"📊 Prompt uzunluğu: {len(prompt_text)} karakter\n")
         self.ai_result_text.append("-" * 50 + "\n\n")
         self.ai_run_btn.setEnabled(False)
+        self.ai_historical_btn.setEnabled(False)
+        self.ai_cancel_btn.setEnabled(True)
+        self.ai_stream.begin()
         
-        # Worker thread oluştur ve başlat
-        self.gemini_worker = GeminiWorker(prompt_text)
+        # İsteği AI kuyruğuna gönder (worker havuzu paylaşılır)
+        self.gemini_worker = GeminiWorker(prompt_text, source_id=source_id, kind=kind)
         self.gemini_worker.status_update.connect(self.on_ai_analysis_status)
         self.gemini_worker.chunk_received.connect(self.on_ai_analysis_chunk)
         self.gemini_worker.completed.connect(self.on_ai_analysis_complete)
         self.gemini_worker.error_occurred.connect(self.on_ai_analysis_error)
+        self.gemini_worker.cancelled.connect(self.on_ai_analysis_cancelled)
+        self.gemini_worker.report_saved.connect(self.on_ai_report_saved)
         self.gemini_worker.start()
     
     def on_ai_analysis_status(self, status_text):
@@ -648,29 +991,50 @@ class TerminalUI(QMainWindow):
         self.status_bar.showMessage(f"AI Analiz: {status_text}")
     
     def on_ai_analysis_chunk(self, text_chunk):
-        """AI'dan chunk geldi - ekrana yaz"""
-        self.ai_result_text.insertPlainText(text_chunk)
-        # Auto-scroll to bottom
-        scrollbar = self.ai_result_text.verticalScrollBar()
-        scrollbar.setValue(scrollbar.maximum())
+        """AI'dan chunk geldi - bir sonraki karede ekrana yazılır"""
+        self.ai_stream.append(text_chunk)
     
     def on_ai_analysis_complete(self):
         """AI analizi tamamlandı"""
+        self.ai_stream.finish()
         self.ai_status_label.setText("● Tamamlandı")
         self.ai_status_label.setStyleSheet("color: #00a86b; font-weight: bold;")
         self.ai_run_btn.setEnabled(True)
         self.ai_historical_btn.setEnabled(True)
+        self.ai_cancel_btn.setEnabled(False)
         self.status_bar.showMessage("✓ AI Analizi tamamlandı!")
     
     def on_ai_analysis_error(self, error_text):
         """AI analizinde hata oluştu"""
+        self.ai_stream.finish()
         self.ai_status_label.setText("● Hata")
         self.ai_status_label.setStyleSheet("color: #d9534f; font-weight: bold;")
         self.ai_result_text.append(f"\n\n❌ {error_text}")
         self.ai_run_btn.setEnabled(True)
         self.ai_historical_btn.setEnabled(True)
+        self.ai_cancel_btn.setEnabled(False)
         self.status_bar.showMessage("AI Analiz hatası!")
     
+    def on_ai_analysis_cancelled(self):
+        """AI analizi kullanıcı tarafından iptal edildi"""
+        self.ai_stream.finish()
+        self.ai_status_label.setText("● İptal edildi")
+        self.ai_status_label.setStyleSheet("color: #999999; font-weight: bold;")
+        self.ai_run_btn.setEnabled(True)
+        self.ai_historical_btn.setEnabled(True)
+        self.ai_cancel_btn.setEnabled(False)
+        self.status_bar.showMessage("xx AI analizi iptal edildi")
+    
+    def on_ai_report_saved(self, report_id):
+        """Rapor arşive kaydedildi - arşiv sekmesi açıksa listeyi yenile"""
+        if self.history_tabs.currentIndex() == 2:
+            self.refresh_reports()
+    
+    def on_cancel_ai_analysis(self):
+        """AI iptal butonu - kuyruktaki isteği çıkarır, akan yanıtı keser"""
+        if self.gemini_worker and self.gemini_worker.isRunning():
+            self.gemini_worker.stop()
+    
     def on_run_historical_analysis(self):
         """Geçmiş tüm analizleri toplu olarak çalıştır"""
         # Tüm JSON dosyalarını bul
@@ -694,30 +1058,264 @@ class TerminalUI(QMainWindow):
             self.ai_result_text.setText(f"Prompt oluşturma hatası: {str(e)}")
             return
         
-        # UI'ı güncelle
-        self.ai_status_label.setText("● Yükleniyor...")
-        self.ai_status_label.setStyleSheet("color: #ffaa00; font-weight: bold;")
+        self.start_gemini_worker(
+            prompt_text,
+            f"📄 Toplam {len(json_files)} analiz bulundu\n",
+            source_id=os.path.basename(json_files[-1]),
+            kind="history"
+        )
+    
+    def on_session_filter_changed(self, text):
+        """Filtre metni değişti - kısa bekleme sonrası uygula"""
+        self.session_filter_timer.start()
+    
+    def update_session_count(self):
+        """Toplam seans sayısını göster"""
+        self.session_count_label.setText(f"{self.session_model.total_count()} seans")
+    
+    def refresh_session_index(self):
+        """Sonuç klasörünü indeksle arka planda eşitle"""
+        if self.session_index_worker and self.session_index_worker.isRunning():
+            return
+        self.session_refresh_btn.setEnabled(False)
+        self.session_index_worker = SessionIndexWorker()
+        self.session_index_worker.completed.connect(self.on_session_index_synced)
+        self.session_index_worker.error_occurred.connect(self.on_session_index_error)
+        self.session_index_worker.start()
+    
+    def on_session_index_synced(self, summary):
+        """İndeks eşitlendi - tabloyu yenile"""
+        self.session_refresh_btn.setEnabled(True)
+        if summary['added'] or summary['removed']:
+            self.refresh_history_views()
+    
+    def on_session_index_error(self, error_text):
+        """İndeks eşitleme hatası"""
+        self.session_refresh_btn.setEnabled(True)
+        self.status_bar.showMessage(f"xx {error_text}")
+    
+    def on_history_tab_changed(self, tab_index):
+        """Trend/rapor sekmesi açıldı - içeriği güncelle"""
+        if tab_index == 1:
+            self.refresh_trends()
+        elif tab_index == 2:
+            self.refresh_reports()
+    
+    def refresh_trends(self):
+        """Hasta listesini trend deposundan yeniden oku (JSON okunmaz)"""
+        current = self.trend_patient_combo.currentData()
+        patients = self.session_index.trends.patients()
+        
+        self.trend_patient_combo.blockSignals(True)
+        self.trend_patient_combo.clear()
+        for patient_id in patients:
+            self.trend_patient_combo.addItem(patient_id or "(Hasta ID yok)", patient_id)
+        if current in patients:
+            self.trend_patient_combo.setCurrentIndex(patients.index(current))
+        self.trend_patient_combo.blockSignals(False)
+        
+        self.update_trend_plot()
+    
+    def update_trend_plot(self):
+        """Seçili hasta/metrik serisini çiz"""
+        patient_id = self.trend_patient_combo.currentData()
+        metric = self.trend_metric_combo.currentData()
+        
+        if patient_id is None:
+            for curve in (self.trend_value_curve, self.trend_mean_curve,
+                          self.trend_upper_curve, self.trend_lower_curve):
+                curve.setData([], [])
+            self.trend_summary_label.setText("Trend verisi yok")
+            return
+        
+        series = self.session_index.trends.series(patient_id, metric)
+        ts = np.array(series['ts'], dtype=float)
+        mean = np.array(series['rolling_mean'], dtype=float)
+        std = np.nan_to_num(np.array(series['rolling_std'], dtype=float))
+        
+        self.trend_value_curve.setData(ts, np.array(series['value'], dtype=float))
+        self.trend_mean_curve.setData(ts, mean)
+        self.trend_upper_curve.setData(ts, mean + std)
+        self.trend_lower_curve.setData(ts, mean - std)
+        self.trend_plot.setLabel('left', self.trend_metric_combo.currentText())
+        
+        summary = self.session_index.trends.summary(patient_id, metric)
+        if summary:
+            std_text = f"{summary['std']:.2f}" if summary['std'] is not None else "-"
+            self.trend_summary_label.setText(
+                f"{summary['count']} seans | Ort: {summary['mean']:.2f} | Std: {std_text} | "
+                f"Min: {summary['min']:.2f} | Maks: {summary['max']:.2f}"
+            )
+        else:
+            self.trend_summary_label.setText("Bu metrik için veri yok")
+    
+    def on_report_search_changed(self, text):
+        """Arama metni değişti - kısa bekleme sonrası uygula"""
+        self.report_search_timer.start()
+    
+    def refresh_reports(self):
+        """Arama sonuçlarını FTS indeksinden getir (rapor metinleri yüklenmez)"""
+        query = self.report_search.text().strip()
+        rows = self.report_store.search(query)
+        
+        self.report_table.setRowCount(len(rows))
+        for row_index, (report_id, created_at, source_id, kind, model, snippet) in enumerate(rows):
+            source = source_id or "-"
+            if kind in REPORT_KIND_LABELS:
+                source = f"{source} ({REPORT_KIND_LABELS[kind]})"
+            values = (created_at, source, model or "-", " ".join(snippet.split()))
+            for column, value in enumerate(values):
+                item = QTableWidgetItem(value)
+                item.setData(Qt.ItemDataRole.UserRole, report_id)
+                self.report_table.setItem(row_index, column, item)
+        
+        if query:
+            self.report_count_label.setText(f"{len(rows)} eşleşme")
+        else:
+            self.report_count_label.setText(f"{self.report_store.count()} rapor")
+    
+    def show_stored_report(self, report):
+        """Arşivdeki raporu AI panelinde göster (yeniden üretmeden)"""
+        ttft = f"{report['ttft_ms'] / 1000:.1f} sn" if report['ttft_ms'] is not None else "-"
+        total = f"{report['total_ms'] / 1000:.1f} sn" if report['total_ms'] is not None else "-"
         self.ai_result_text.clear()
-        self.ai_result_text.append(f"📄 Toplam {len(json_files)} analiz bulundu\n")
-        self.ai_result_text.append(f"📊 Prompt uzunluğu: {len(prompt_text)} karakter\n")
+        self.ai_result_text.append(f"📄 Kayıtlı rapor: {report['source_id'] or '-'} ({report['created_at']})\n")
+        self.ai_result_text.append(
+            f"🤖 Model: {report['model'] or '-'} | İlk yanıt: {ttft} | Toplam: {total}\n"
+        )
         self.ai_result_text.append("-" * 50 + "\n\n")
-        self.ai_run_btn.setEnabled(False)
-        self.ai_historical_btn.setEnabled(False)
+        self.ai_result_text.append(report['text'])
+        self.ai_status_label.setText("● Arşivden")
+        self.ai_status_label.setStyleSheet("color: #999999; font-weight: bold;")
+    
+    def on_report_double_clicked(self, index):
+        """Seçilen arşiv raporunu AI panelinde göster"""
+        if self.ai_stream.active:
+            self.status_bar.showMessage("AI analizi sürerken rapor görüntülenemez")
+            return
+        report_id = self.report_table.item(index.row(), 0).data(Qt.ItemDataRole.UserRole)
+        report = self.report_store.get(report_id)
+        if report:
+            self.show_stored_report(report)
+    
+    def refresh_history_views(self):
+        """Seans tablosunu ve (açıksa) trendleri yenile"""
+        self.session_model.reload()
+        if self.history_tabs.currentIndex() == 1:
+            self.refresh_trends()
+    
+    def on_session_double_clicked(self, index):
+        """Seçilen seansın kayıtlı AI raporunu (yoksa sonuç dosyasını) AI panelinde göster"""
+        if self.ai_stream.active:
+            self.status_bar.showMessage("AI analizi sürerken seans görüntülenemez")
+            return
+        json_file = self.session_model.file_path(index.row())
         
-        # Worker thread oluştur ve başlat
-        self.gemini_worker = GeminiWorker(prompt_text)
-        self.gemini_worker.status_update.connect(self.on_ai_analysis_status)
-        self.gemini_worker.chunk_received.connect(self.on_ai_analysis_chunk)
-        self.gemini_worker.completed.connect(self.on_ai_analysis_complete)
-        self.gemini_worker.error_occurred.connect(self.on_ai_analysis_error)
-        self.gemini_worker.start()
+        # Seansın kayıtlı AI raporu varsa onu göster
+        report = self.report_store.latest_for_source(os.path.basename(json_file))
+        if report:
+            self.show_stored_report(report)
+            self.status_bar.showMessage("Seansın kayıtlı AI raporu gösteriliyor")
+            return
+        
+        try:
+            with open(json_file, 'r', encoding='utf-8') as f:
+                content = f.read()
+        except OSError as e:
+            self.status_bar.showMessage(f"xx Seans dosyası okunamadı: {e}")
+            return
+        self.ai_result_text.clear()
+        self.ai_result_text.append(f"📄 Seans: {os.path.basename(json_file)}\n")
+        self.ai_result_text.append(content)
+    
+    def start_live_server(self):
+        """Canlı web panelini başlat (web_interface.html + SSE yayını)"""
+        if self.live_server:
+            return
+        try:
+            server = LiveServer()
+            server.start()
+        except OSError as e:
+            self.status_bar.showMessage(f"xx Canlı web paneli başlatılamadı: {e}")
+            return
+        self.live_server = server
+        self.status_bar.showMessage(f"Canlı web paneli: {server.url}")
+    
+    def publish_live_sample(self, module, t, value):
+        """Canlı panele örnek bırak (sunucu kapalıysa hiçbir şey yapmaz)"""
+        if self.live_server:
+            self.live_server.publish_sample(module, t, value)
+    
+    def publish_live_event(self, event, payload):
+        """Canlı panele durum/metrik olayı bırak"""
+        if self.live_server:
+            self.live_server.publish_event(event, payload)
+    
+    def on_first_paint(self):
+        """Pencere ilk kez çizildi - ağır modülleri arka planda yükle"""
+        startup.mark("ilk boyama")
+        startup.stop_import_timing()
+        
+        # Dışarıdan eklenmiş/silinmiş sonuç dosyalarını indeksle eşitle
+        self.refresh_session_index()
+        
+        if not config.PREWARM_ENABLED:
+            if startup.is_enabled():
+                print(startup.format_report())
+            return
+        
+        self.prewarm_worker = PrewarmWorker()
+        self.prewarm_worker.completed.connect(self.on_prewarm_complete)
+        self.prewarm_worker.start()
+    
+    def on_prewarm_complete(self, timings):
+        """Arka plan ön yükleme tamamlandı"""
+        startup.mark("ön yükleme tamamlandı")
+        if startup.is_enabled():
+            print(startup.format_report(timings))
+    
+    def closeEvent(self, event):
+        """Pencere kapanırken arka plan analizini durdur"""
+        # Sürekli izlemenin son penceresini kaydet, sonra portu kapat
+        self.stop_continuous_monitoring()
+        if self.serial_manager:
+            self.serial_manager.disconnect()
+            self.serial_manager.wait()
+            self.serial_manager = None
+        if self.analysis_worker and self.analysis_worker.isRunning():
+            self.analysis_worker.cancel()
+            self.analysis_worker.wait()
+        for worker in list(self.retired_analysis_workers):
+            worker.wait()
+        if self.session_index_worker and self.session_index_worker.isRunning():
+            self.session_index_worker.stop()
+            self.session_index_worker.wait()
+        if self.prewarm_worker and self.prewarm_worker.isRunning():
+            self.prewarm_worker.wait()
+        if self.gemini_worker and self.gemini_worker.isRunning():
+            self.gemini_worker.stop()
+        if self.live_server:
+            self.live_server.stop()
+        super().closeEvent(event)
 
 
 def main():
+    startup.mark("import'lar")
+    if profiling.is_enabled():
+        # Sinyaller bağlanmadan önce (pencereden önce) kurulmalı
+        profiling.install_stage_timers(TerminalUI)
     app = QApplication(sys.argv)
+    startup.mark("QApplication")
     window = TerminalUI()
+    startup.mark("pencere oluşturuldu")
     window.show()
-    sys.exit(app.exec())
+    if config.LIVE_SERVER_ENABLED or "--live-server" in sys.argv:
+        window.start_live_server()
+    # Olay döngüsünün ilk turunda (ilk boyamadan sonra) çalışır
+    QTimer.singleShot(0, window.on_first_paint)
+    exit_code = app.exec()
+    profiling.finish()
+    sys.exit(exit_code)
 
 
 if __name__ == '__main__':
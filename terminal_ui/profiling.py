@@ -0,0 +1,379 @@
+"""
+İsteğe Bağlı Seans Profili - cProfile / Örnekleyici, tracemalloc, Aşama Süreleri
+Klinikte yavaşlık şikayetinde bir seansın nerede zaman ve bellek harcadığını kaydeder
+
+Etkinleştirme (ikisinden biri):
+    python main.py --profile              # cProfile (arayüz thread'i, deterministik)
+    python main.py --profile=sample       # örnekleyici (tüm thread'ler, istatistiksel)
+    TERMINAL_UI_PROFILE=cprofile|sample python main.py
+
+- cProfile sadece başlatıldığı thread'i (arayüz/olay döngüsü) görür;
+  SerialManager ve AI worker thread'leri için "sample" kipi
+  sys._current_frames() ile her PROFILE_SAMPLE_INTERVAL_MS'de tüm
+  thread'lerin yığınını örnekler.
+- tracemalloc açılışta ve seans sonunda anlık görüntü alır; özet en çok
+  büyüyen ayırma satırlarını listeler.
+- Aşama zamanlayıcıları SerialManager._read_line, on_data_received,
+  DataLogger.log_module_a/b/c, process_all_modules ve AIScheduler._run
+  (GeminiWorker'ın istek döngüsü) çağrılarını sarmalar; çağrı sayısı,
+  toplam, ortalama, p95 ve en uzun süre raporlanır.
+
+Uygulama kapanınca PROFILE_DIR altına profil dosyası (.prof - pstats /
+snakeviz ile açılır, ya da .folded - flamegraph/speedscope yığın sayıları),
+bellek görüntüsü (.tracemalloc) ve okunabilir özet (_summary.txt) yazılır.
+
+Bayrak yoksa hiçbir kanca, profilci ya da sarmalayıcı kurulmaz; ölçülen
+fonksiyonlar normal yollarından çağrılır. Ertelenmiş yüklenen modüller
+(signal_processor) açılışta yüklenmez; ilk import'ta sarmalanır.
+"""
+
+import builtins
+import functools
+import os
+import sys
+import threading
+import time
+import tracemalloc
+from collections import Counter, deque
+from datetime import datetime
+
+import config
+
+
+PROFILE_FLAG = "--profile"
+PROFILE_ENV = "TERMINAL_UI_PROFILE"
+MODE_CPROFILE = "cprofile"
+MODE_SAMPLE = "sample"
+MODES = (MODE_CPROFILE, MODE_SAMPLE)
+
+STAGE_WINDOW = 100_000  # Aşama başına yüzdelik için tutulan son süre sayısı
+# Yığının tepesi bunlardan biriyse thread boşta bekliyor - özet listelerine girmez
+IDLE_FRAMES = {
+    "threading.py:wait", "threading.py:_wait_for_tstate_lock", "thread.py:_worker",
+    "queue.py:get", "selectors.py:select", "socketserver.py:serve_forever",
+}
+
+_mode = None
+_profiler = None  # cProfile.Profile ya da _StackSampler
+_start_snapshot = None
+_started_at = None
+_stages = {}  # aşama adı -> _StageStats
+_summary_path = None
+_deferred = {}  # henüz yüklenmemiş modül -> [(aşama, öznitelik)]
+_deferred_lock = threading.Lock()  # Ön yükleme thread'i de aynı anda import eder
+_original_import = builtins.__import__
+
+
+class _StageStats:
+    """Bir aşamanın çağrı süreleri"""
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.recent = deque(maxlen=STAGE_WINDOW)
+
+    def add(self, duration):
+        self.count += 1
+        self.total += duration
+        if duration > self.max:
+            self.max = duration
+        self.recent.append(duration)
+
+    def p95(self):
+        ordered = sorted(self.recent)
+        return ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))] if ordered else 0.0
+
+
+class _StackSampler(threading.Thread):
+    """Tüm thread'lerin Python yığınını düzenli aralıkla sayan örnekleyici"""
+
+    def __init__(self, interval_s):
+        super().__init__(name="profile-sampler", daemon=True)
+        self.interval_s = interval_s
+        self.stacks = Counter()  # (thread, çerçeve, ...) -> örnek sayısı
+        self.samples = 0
+        self._stop_event = threading.Event()
+
+    def run(self):
+        own_id = threading.get_ident()
+        while not self._stop_event.wait(self.interval_s):
+            names = {thread.ident: thread.name for thread in threading.enumerate()}
+            for thread_id, frame in sys._current_frames().items():
+                if thread_id == own_id:
+                    continue
+                stack = []
+                while frame is not None:
+                    code = frame.f_code
+                    stack.append(f"{os.path.basename(code.co_filename)}:{code.co_name}")
+                    frame = frame.f_back
+                # Qt'nin başlattığı thread'ler threading'de kayıtlı değil
+                thread_name = names.get(thread_id, f"QThread-{thread_id}")
+                self.stacks[(thread_name,) + tuple(reversed(stack))] += 1
+            self.samples += 1
+
+    def stop(self):
+        self._stop_event.set()
+        self.join(timeout=1.0)
+
+
+def enable(mode=MODE_CPROFILE):
+    """
+    Profili başlatır (tekrar çağrılırsa etkisiz).
+
+    Args:
+        mode (str): "cprofile" ya da "sample"
+    """
+    global _mode, _profiler, _start_snapshot, _started_at
+    if _mode is not None:
+        return
+    if mode not in MODES:
+        raise ValueError(f"Bilinmeyen profil kipi: {mode} ({', '.join(MODES)})")
+
+    _mode = mode
+    _started_at = datetime.now()
+    tracemalloc.start(config.PROFILE_TRACEMALLOC_FRAMES)
+    _start_snapshot = tracemalloc.take_snapshot()
+
+    if mode == MODE_CPROFILE:
+        import cProfile
+        _profiler = cProfile.Profile()
+        _profiler.enable()
+    else:
+        _profiler = _StackSampler(config.PROFILE_SAMPLE_INTERVAL_MS / 1000.0)
+        _profiler.start()
+    print(f"Profil etkin ({mode}) - çıkışta {config.PROFILE_DIR}/ altına yazılacak")
+
+
+def enable_from_argv(argv=None):
+    """
+    --profile[=kip] bayrağı ya da TERMINAL_UI_PROFILE çevre değişkeni varsa profili başlatır.
+
+    Ana modülün başında, pencere oluşturulmadan önce çağrılmalıdır.
+
+    Returns:
+        bool: Profil etkin mi
+    """
+    argv = sys.argv if argv is None else argv
+    mode = None
+    for arg in list(argv):
+        if arg == PROFILE_FLAG or arg.startswith(PROFILE_FLAG + "="):
+            mode = arg.partition("=")[2] or MODE_CPROFILE
+            argv.remove(arg)
+    if mode is None:
+        value = os.getenv(PROFILE_ENV, "").strip().lower()
+        if value in ("1", "true", "yes"):
+            mode = MODE_CPROFILE
+        elif value:
+            mode = value
+    if mode is not None:
+        try:
+            enable(mode)
+        except ValueError as e:
+            print(f"Profil başlatılamadı: {e}")
+    return is_enabled()
+
+
+def is_enabled():
+    return _mode is not None
+
+
+def timed(stage, func):
+    """func'u aşama süresini kaydeden sarmalayıcıyla döndürür"""
+    stats = _stages.setdefault(stage, _StageStats())
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        start = time.perf_counter()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            stats.add(time.perf_counter() - start)
+    return wrapper
+
+
+def _wrap(stage, owner, name):
+    setattr(owner, name, timed(stage, getattr(owner, name)))
+
+
+def _deferred_import(name, globals=None, locals=None, fromlist=(), level=0):
+    """builtins.__import__ sarmalayıcısı - ertelenmiş modül yüklenince zamanlayıcısını kurar"""
+    module = _original_import(name, globals, locals, fromlist, level)
+    ready = []
+    with _deferred_lock:
+        for module_name in [key for key in _deferred if key in sys.modules]:
+            # İç içe import'larda modül henüz yarı yüklü olabilir
+            if all(hasattr(sys.modules[module_name], attribute)
+                   for _, attribute in _deferred[module_name]):
+                ready.append((module_name, _deferred.pop(module_name)))
+        if not _deferred and builtins.__import__ is _deferred_import:
+            builtins.__import__ = _original_import
+    # Sarmalama kilit dışında: içinde yapılan bir import kilidi yeniden istemesin
+    for module_name, targets in ready:
+        for stage, attribute in targets:
+            _wrap(stage, sys.modules[module_name], attribute)
+    return module
+
+
+def remove_import_hook(hook, original):
+    """
+    Zincirde bu modülün altında kalan bir import kancasını kaldırır.
+
+    builtins.__import__'u startup._timed_import ile paylaşırız: --startup-report
+    ile birlikte açıldığında _deferred_import onun üstüne kurulur ve
+    _original_import olarak onu saklar. Kaldırılmazsa ertelenmiş modül
+    yüklendiğinde _timed_import kalıcı olarak geri konur.
+
+    Args:
+        hook: Kaldırılacak kanca
+        original: Kancanın sardığı asıl __import__
+    """
+    global _original_import
+    with _deferred_lock:
+        if _original_import is hook:
+            _original_import = original
+
+
+def _wrap_when_imported(stage, module_name, attribute):
+    """Modül yüklüyse hemen, değilse ilk import'unda sarmala"""
+    global _original_import
+    if module_name in sys.modules:
+        _wrap(stage, sys.modules[module_name], attribute)
+        return
+    _stages.setdefault(stage, _StageStats())
+    with _deferred_lock:
+        _deferred.setdefault(module_name, []).append((stage, attribute))
+        if builtins.__import__ is not _deferred_import:
+            _original_import = builtins.__import__
+            builtins.__import__ = _deferred_import
+
+
+def install_stage_timers(ui_class=None):
+    """
+    Aşama zamanlayıcılarını kurar - sadece profil etkinken çağrılır.
+
+    Sinyaller bağlanmadan (pencere oluşturulmadan) önce çağrılmalıdır;
+    bağlanmış metotlar sarmalayıcıyı görmez.
+
+    Args:
+        ui_class: on_data_received'i ölçülecek pencere sınıfı (TerminalUI)
+    """
+    import ai_scheduler
+    import data_logger
+    import serial_manager
+
+    _wrap("seri okuma (_read_line)", serial_manager.SerialManager, "_read_line")
+    if ui_class is not None:
+        _wrap("on_data_received", ui_class, "on_data_received")
+    for module in ("a", "b", "c"):
+        _wrap(f"DataLogger.log_module_{module}", data_logger.DataLogger, f"log_module_{module}")
+    # signal_processor ilk boyamadan sonra arka planda yüklenir - açılışı yavaşlatma
+    _wrap_when_imported("process_all_modules", "signal_processor", "process_all_modules")
+    _wrap("AI isteği (AIScheduler._run)", ai_scheduler.AIScheduler, "_run")
+
+
+def _format_stages():
+    lines = ["Aşama süreleri:",
+             f"  {'aşama':<32} {'çağrı':>8} {'toplam ms':>11} {'ort. ms':>9} {'p95 ms':>9} {'en uzun':>9}"]
+    for stage, stats in _stages.items():
+        if not stats.count:
+            lines.append(f"  {stage:<32} {0:>8}")
+            continue
+        lines.append(
+            f"  {stage:<32} {stats.count:>8} {stats.total * 1000:>11.1f} "
+            f"{stats.total / stats.count * 1000:>9.3f} {stats.p95() * 1000:>9.3f} {stats.max * 1000:>9.1f}"
+        )
+    return lines
+
+
+def _format_cprofile(top):
+    import io
+    import pstats
+
+    stream = io.StringIO()
+    stats = pstats.Stats(_profiler, stream=stream)
+    stats.strip_dirs().sort_stats("cumulative").print_stats(top)
+    stats.sort_stats("tottime").print_stats(top)
+    return ["Sıcak noktalar (cProfile, arayüz thread'i):", stream.getvalue()]
+
+
+def _format_samples(top):
+    sampler = _profiler
+    own, inclusive = Counter(), Counter()
+    idle = 0
+    for stack, count in sampler.stacks.items():
+        frames = stack[1:]
+        if not frames or frames[-1] in IDLE_FRAMES:
+            idle += count
+            continue
+        own[frames[-1]] += count
+        for frame in set(frames):
+            inclusive[frame] += count
+
+    busy = sum(own.values())
+    total = busy or 1
+    lines = [f"Sıcak noktalar (örnekleyici, {sampler.samples} tur, "
+             f"{config.PROFILE_SAMPLE_INTERVAL_MS} ms aralık, tüm thread'ler):",
+             f"  {busy} çalışan thread örneği; boşta bekleyen {idle} örnek sayılmadı (.folded dosyasında var)",
+             "  Kendi süresi (yığının tepesinde):"]
+    for frame, count in own.most_common(top):
+        lines.append(f"    {count / total * 100:6.1f}%  {frame}")
+    lines.append("  Toplam (yığında herhangi bir yerde):")
+    for frame, count in inclusive.most_common(top):
+        lines.append(f"    {count / total * 100:6.1f}%  {frame}")
+    return lines
+
+
+def _format_memory(end_snapshot, top):
+    lines = ["Bellek (tracemalloc, açılıştan seans sonuna en çok büyüyen):"]
+    for stat in end_snapshot.compare_to(_start_snapshot, "lineno")[:top]:
+        lines.append(f"  {stat.size_diff / 1024:+10.1f} KiB  {stat.count_diff:+8d} blok  {stat.traceback}")
+    current, peak = tracemalloc.get_traced_memory()
+    lines.append(f"  İzlenen bellek: şu an {current / 1024 ** 2:.1f} MiB, tepe {peak / 1024 ** 2:.1f} MiB")
+    return lines
+
+
+def finish(save_dir=None, top=None):
+    """
+    Profili durdurur, dosyaları ve sıcak nokta özetini yazar (tekrar çağrılırsa etkisiz).
+
+    Returns:
+        str: Özet dosyasının yolu ya da profil kapalıysa None
+    """
+    global _summary_path
+    if _mode is None or _summary_path is not None:
+        return _summary_path
+    save_dir = save_dir or config.PROFILE_DIR
+    top = top or config.PROFILE_TOP
+    os.makedirs(save_dir, exist_ok=True)
+    base = os.path.join(save_dir, f"profile_{_started_at.strftime('%Y%m%d_%H%M%S')}")
+
+    if _mode == MODE_CPROFILE:
+        _profiler.disable()
+        profile_path = f"{base}.prof"
+        _profiler.dump_stats(profile_path)
+        hot_spots = _format_cprofile(top)
+    else:
+        _profiler.stop()
+        profile_path = f"{base}.folded"
+        with open(profile_path, 'w', encoding='utf-8') as f:
+            for stack, count in _profiler.stacks.items():
+                f.write(f"{';'.join(stack)} {count}\n")
+        hot_spots = _format_samples(top)
+
+    end_snapshot = tracemalloc.take_snapshot()
+    end_snapshot.dump(f"{base}.tracemalloc")
+    memory = _format_memory(end_snapshot, top)
+    tracemalloc.stop()
+
+    duration = (datetime.now() - _started_at).total_seconds()
+    lines = ["=" * 60, "SEANS PROFİLİ", "=" * 60,
+             f"Kip: {_mode}, süre: {duration:.1f} sn, profil: {profile_path}", ""]
+    lines += _format_stages() + [""] + hot_spots + [""] + memory + ["=" * 60]
+
+    _summary_path = f"{base}_summary.txt"
+    with open(_summary_path, 'w', encoding='utf-8') as f:
+        f.write("\n".join(lines) + "\n")
+    print(f"Profil kaydedildi: {profile_path}")
+    print(f"Sıcak nokta özeti: {_summary_path}")
+    return _summary_path
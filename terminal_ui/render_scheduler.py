@@ -0,0 +1,109 @@
+"""
+Grafik Yenileme Zamanlayıcısı
+Çizimi örnekleme hızından ayırır - sabit FPS, sadece değişen eğriler
+
+Veri geldiğinde eğri sadece "kirli" olarak işaretlenir; QTimer her karede
+kirli eğrileri tamponlarındaki güncel veriyle bir kez çizer. Kare süresi
+bütçeyi aşarsa FPS otomatik düşürülür, yük azalınca hedefe geri çıkar.
+"""
+
+import time
+
+from PyQt6.QtCore import QObject, QTimer
+
+import config
+
+
+class RenderScheduler(QObject):
+    """Sabit FPS'li, uyarlanabilir grafik yenileme zamanlayıcısı"""
+
+    def __init__(self, fps=None, min_fps=None, frame_budget=None, parent=None):
+        super().__init__(parent)
+        self.target_fps = fps or config.PLOT_FPS
+        self.min_fps = min_fps or config.PLOT_MIN_FPS
+        # Kare aralığının ne kadarı çizime harcanabilir (0-1)
+        self.frame_budget = frame_budget or config.PLOT_FRAME_BUDGET
+        self.current_fps = self.target_fps
+
+        self._targets = {}  # anahtar -> (eğri, veri kaynağı)
+        self._dirty = set()
+        self._last_tick = None
+        self.last_frame_ms = 0.0
+
+        self._timer = QTimer(self)
+        self._timer.timeout.connect(self._on_tick)
+        self._apply_interval()
+
+    def register(self, key, curve, source):
+        """
+        Eğri kaydet
+
+        Args:
+            key (str): Eğri anahtarı (ör. 'A')
+            curve: pyqtgraph PlotDataItem
+            source (callable): Çizilecek (x, y) verisini döndüren fonksiyon
+        """
+        self._targets[key] = (curve, source)
+
+    def mark_dirty(self, key):
+        """Eğriyi bir sonraki karede yeniden çizilecek olarak işaretle"""
+        self._dirty.add(key)
+
+    def start(self):
+        self._timer.start()
+
+    def stop(self):
+        self._timer.stop()
+
+    def flush(self):
+        """Kirli eğrileri beklemeden hemen çiz"""
+        self._draw_dirty()
+
+    def _apply_interval(self):
+        self._timer.setInterval(max(1, int(1000 / self.current_fps)))
+
+    def _on_tick(self):
+        """Kare: sadece kirli eğrileri çiz ve süreyi ölç"""
+        # Zamanlayıcı gecikmesi = önceki karenin boyama (paint) maliyeti
+        now = time.perf_counter()
+        lateness = 0.0
+        if self._last_tick is not None:
+            lateness = max(0.0, (now - self._last_tick) - 1.0 / self.current_fps)
+        self._last_tick = now
+
+        frame_time = self._draw_dirty()
+        if frame_time is not None:
+            frame_time += lateness
+            self.last_frame_ms = frame_time * 1000
+            self._adapt(frame_time)
+
+    def _draw_dirty(self):
+        """Kirli eğrileri çiz, çizim süresini (s) döndür; iş yoksa None"""
+        if not self._dirty:
+            return None
+
+        dirty = self._dirty
+        self._dirty = set()
+
+        frame_start = time.perf_counter()
+        for key in dirty:
+            target = self._targets.get(key)
+            if target is None:
+                continue
+            curve, source = target
+            curve.setData(*source())
+        return time.perf_counter() - frame_start
+
+    def _adapt(self, frame_time):
+        """Kare süresi bütçeyi aşarsa FPS'i düşür, rahatlayınca geri yükselt"""
+        budget = self.frame_budget / self.current_fps
+        new_fps = self.current_fps
+
+        if frame_time > budget and self.current_fps > self.min_fps:
+            new_fps = max(self.min_fps, self.current_fps * 0.75)
+        elif frame_time < budget * 0.5 and self.current_fps < self.target_fps:
+            new_fps = min(self.target_fps, self.current_fps * 1.1)
+
+        if new_fps != self.current_fps:
+            self.current_fps = new_fps
+            self._apply_interval()
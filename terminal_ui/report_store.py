@@ -0,0 +1,266 @@
+"""
+AI Rapor Arşivi - Kayıtlı Raporlar ve Tam Metin Arama
+Tamamlanan AI raporları için SQLite (FTS5) deposu
+
+Her rapor prompt özeti, model, arka uç, kaynak sonuç kimliği ve gecikme
+ölçümleriyle (ilk chunk süresi, toplam süre, chunk sayısı) saklanır.
+Rapor metinleri FTS5 ile indekslenir; geçmiş raporlarda arama dosya
+taramadan milisaniyeler içinde yapılır. Önbellekten gelmeyen kayıtların
+süreleri AI gecikme veri setidir (latency_summary).
+"""
+
+import os
+import re
+import sqlite3
+from datetime import datetime
+
+import config
+from analysis_cache import make_key
+
+
+# Sıralama/arama sütunları (sorgu sonuçları bu sırayla döner)
+_LIST_COLUMNS = "id, created_at, source_id, kind, model"
+
+_TOKEN_PATTERN = re.compile(r"\w+", re.UNICODE)
+
+
+def prompt_hash(prompt_text):
+    """Prompt özeti (yanıt önbelleğiyle aynı özet)"""
+    return make_key(prompt_text)
+
+
+def build_match_query(text):
+    """
+    Kullanıcı metnini FTS5 sorgusuna çevirir - her kelime önek olarak aranır
+    ve hepsi geçmelidir. FTS5 sözdizimi karakterleri (", *, -, :) aranmaz.
+
+    Returns:
+        str: MATCH ifadesi (kelime yoksa boş)
+    """
+    return " ".join(f'"{token}"*' for token in _TOKEN_PATTERN.findall(text))
+
+
+def _percentile(sorted_values, q):
+    """Sıralı listede en yakın sıra yüzdeliği"""
+    if not sorted_values:
+        return None
+    index = max(0, min(len(sorted_values) - 1, round(q / 100 * len(sorted_values)) - 1))
+    return sorted_values[index]
+
+
+class ReportStore:
+    """AI raporları ve tam metin indeksi"""
+
+    def __init__(self, results_dir="analysis_results", db_path=None):
+        """
+        Args:
+            results_dir (str): Sonuç klasörü
+            db_path (str): Veritabanı (varsayılan: klasör içinde config.AI_REPORT_DB_FILE)
+        """
+        self.db_path = db_path or os.path.join(results_dir, config.AI_REPORT_DB_FILE)
+        self._conn = None
+
+    @property
+    def conn(self):
+        """Bağlantı ilk kullanımda açılır (bağlantılar thread'ler arasında paylaşılmaz)"""
+        if self._conn is None:
+            os.makedirs(os.path.dirname(self.db_path) or ".", exist_ok=True)
+            self._conn = sqlite3.connect(self.db_path, timeout=10)
+            # Arayüz ararken AI worker'ı rapor yazabilsin
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._create_schema()
+        return self._conn
+
+    def _create_schema(self):
+        with self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS ai_reports ("
+                "id INTEGER PRIMARY KEY, "
+                "created_at TEXT NOT NULL, "
+                "source_id TEXT, "
+                "kind TEXT, "
+                "prompt_hash TEXT NOT NULL, "
+                "model TEXT, "
+                "backend TEXT, "
+                "from_cache INTEGER NOT NULL DEFAULT 0, "
+                "ttft_ms REAL, "
+                "total_ms REAL, "
+                "chunk_count INTEGER, "
+                "char_count INTEGER, "
+                "text TEXT NOT NULL)"
+            )
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_ai_reports_source ON ai_reports (source_id, created_at)"
+            )
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_ai_reports_prompt ON ai_reports (prompt_hash, model)"
+            )
+            # Metin tabloda bir kez saklanır; FTS sadece indeksi tutar (tetikleyicilerle güncel)
+            # remove_diacritics: "yorgunluk" araması "Yorgunluğu" da bulur (ş/s, ğ/g, ü/u)
+            self._conn.execute(
+                "CREATE VIRTUAL TABLE IF NOT EXISTS ai_reports_fts USING fts5("
+                "text, content='ai_reports', content_rowid='id', "
+                "tokenize='unicode61 remove_diacritics 2')"
+            )
+            self._conn.execute(
+                "CREATE TRIGGER IF NOT EXISTS ai_reports_ai AFTER INSERT ON ai_reports BEGIN "
+                "INSERT INTO ai_reports_fts (rowid, text) VALUES (new.id, new.text); END"
+            )
+            self._conn.execute(
+                "CREATE TRIGGER IF NOT EXISTS ai_reports_ad AFTER DELETE ON ai_reports BEGIN "
+                "INSERT INTO ai_reports_fts (ai_reports_fts, rowid, text) "
+                "VALUES ('delete', old.id, old.text); END"
+            )
+
+    def close(self):
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    def add(self, text, prompt_text, model=None, backend=None, source_id=None,
+            kind="session", timings=None, from_cache=False):
+        """
+        Raporu kaydet.
+
+        Args:
+            text (str): Rapor metni
+            prompt_text (str): Raporu üreten prompt (sadece özeti saklanır)
+            model (str): Model adı
+            backend (str): Arka uç adı ('gemini', 'local')
+            source_id (str): Kaynak sonuç kimliği (ör. analysis_result_X.json)
+            kind (str): 'session', 'history' veya 'patient'
+            timings (dict): AIJob.timings ({'ttft_ms', 'total_ms', 'chunk_count'})
+            from_cache (bool): Yanıt önbelleğinden mi geldi
+
+        Returns:
+            int: Rapor kimliği
+        """
+        timings = timings or {}
+        with self.conn:
+            cursor = self.conn.execute(
+                "INSERT INTO ai_reports (created_at, source_id, kind, prompt_hash, model, backend, "
+                "from_cache, ttft_ms, total_ms, chunk_count, char_count, text) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (datetime.now().strftime("%Y-%m-%d %H:%M:%S"), source_id, kind,
+                 prompt_hash(prompt_text), model, backend, int(bool(from_cache)),
+                 timings.get('ttft_ms'), timings.get('total_ms'), timings.get('chunk_count'),
+                 len(text), text)
+            )
+        return cursor.lastrowid
+
+    def has_report(self, prompt_text, model):
+        """Bu prompt ve model için kayıtlı rapor var mı"""
+        row = self.conn.execute(
+            "SELECT 1 FROM ai_reports WHERE prompt_hash = ? AND model IS ? LIMIT 1",
+            (prompt_hash(prompt_text), model)
+        ).fetchone()
+        return row is not None
+
+    def get(self, report_id):
+        """
+        Tek bir rapor.
+
+        Returns:
+            dict: Tüm sütunlar (yoksa None)
+        """
+        cursor = self.conn.execute("SELECT * FROM ai_reports WHERE id = ?", (report_id,))
+        row = cursor.fetchone()
+        if row is None:
+            return None
+        return dict(zip([column[0] for column in cursor.description], row))
+
+    def latest_for_source(self, source_id):
+        """Kaynağın en son raporu (yoksa None)"""
+        row = self.conn.execute(
+            "SELECT id FROM ai_reports WHERE source_id = ? ORDER BY created_at DESC, id DESC LIMIT 1",
+            (source_id,)
+        ).fetchone()
+        return self.get(row[0]) if row else None
+
+    def count(self):
+        return self.conn.execute("SELECT COUNT(*) FROM ai_reports").fetchone()[0]
+
+    def search(self, text="", limit=None):
+        """
+        Rapor metinlerinde tam metin arama (boş metin: en yeni raporlar).
+
+        Returns:
+            list: [(id, created_at, source_id, kind, model, snippet)] - en ilgili
+                  önce; snippet eşleşen bölümü [ ] içinde gösterir
+        """
+        limit = limit or config.AI_REPORT_SEARCH_LIMIT
+        match = build_match_query(text)
+        if not match:
+            return self.conn.execute(
+                f"SELECT {_LIST_COLUMNS}, substr(text, 1, 120) FROM ai_reports "
+                "ORDER BY created_at DESC, id DESC LIMIT ?",
+                (limit,)
+            ).fetchall()
+
+        return self.conn.execute(
+            "SELECT r.id, r.created_at, r.source_id, r.kind, r.model, "
+            "snippet(ai_reports_fts, 0, '[', ']', '…', 12) "
+            "FROM ai_reports_fts JOIN ai_reports r ON r.id = ai_reports_fts.rowid "
+            "WHERE ai_reports_fts MATCH ? ORDER BY bm25(ai_reports_fts), r.id DESC LIMIT ?",
+            (match, limit)
+        ).fetchall()
+
+    def latency_summary(self):
+        """
+        Arka uç/model başına gecikme özeti (önbellekten gelen raporlar hariç).
+
+        Returns:
+            list: [{'backend', 'model', 'count', 'ttft_p50_ms', 'ttft_p95_ms',
+                    'total_p50_ms', 'total_p95_ms'}]
+        """
+        groups = {}
+        for backend, model, ttft_ms, total_ms in self.conn.execute(
+            "SELECT backend, model, ttft_ms, total_ms FROM ai_reports WHERE from_cache = 0"
+        ):
+            group = groups.setdefault((backend, model), ([], []))
+            if ttft_ms is not None:
+                group[0].append(ttft_ms)
+            if total_ms is not None:
+                group[1].append(total_ms)
+
+        summary = []
+        for (backend, model), (ttfts, totals) in sorted(groups.items(), key=lambda g: str(g[0])):
+            ttfts.sort()
+            totals.sort()
+            summary.append({
+                'backend': backend,
+                'model': model,
+                'count': len(totals),
+                'ttft_p50_ms': _percentile(ttfts, 50),
+                'ttft_p95_ms': _percentile(ttfts, 95),
+                'total_p50_ms': _percentile(totals, 50),
+                'total_p95_ms': _percentile(totals, 95),
+            })
+        return summary
+
+
+def save_job_report(job, source_id=None, kind="session", results_dir="analysis_results"):
+    """
+    Tamamlanan AI işini arşive kaydet (hata akışı bozmaz).
+
+    Önbellekten yeniden oynatılan yanıt zaten kayıtlıysa tekrar eklenmez.
+
+    Returns:
+        int: Rapor kimliği (kaydedilmediyse None)
+    """
+    backend = job.backend
+    model = getattr(backend, 'model_name', None)
+    store = ReportStore(results_dir)
+    try:
+        if job.from_cache and store.has_report(job.prompt_text, model):
+            return None
+        return store.add(
+            job.text, job.prompt_text, model=model,
+            backend=getattr(backend, 'name', None), source_id=source_id, kind=kind,
+            timings=job.timings, from_cache=job.from_cache,
+        )
+    except sqlite3.Error as e:
+        print(f"AI rapor arşivi yazma hatası: {e}")
+        return None
+    finally:
+        store.close()
@@ -0,0 +1,165 @@
+"""
+Düzgün Örnekleme (Resampling) Modülü
+Arduino zaman damgalarındaki titreşimi (jitter) FFT öncesi giderir
+
+Firmware örnekleri millis() zamanlamasıyla alır; LCD yazımları ve pulseIn
+çağrıları aralıkları kaydırır. Bu modül sinyali sabit hızlı bir ızgaraya
+doğrusal interpolasyonla taşır ve veri kopukluklarını (gap) işaretler.
+"""
+
+from functools import lru_cache
+
+import numpy as np
+
+import config
+
+
+@lru_cache(maxsize=64)
+def _cached_grid(n_samples, rate):
+    """Sıfırdan başlayan, salt okunur göreli zaman ızgarası"""
+    grid = np.arange(n_samples, dtype=float) / rate
+    grid.setflags(write=False)
+    return grid
+
+
+def uniform_grid(duration, rate):
+    """
+    (süre, hız) çifti için önbellekli düzgün zaman ızgarası döndürür
+
+    Args:
+        duration (float): Sinyal süresi (s)
+        rate (float): Hedef örnekleme hızı (Hz)
+
+    Returns:
+        np.ndarray: 0'dan başlayan salt okunur zaman ızgarası (s)
+    """
+    n_samples = int(np.floor(duration * rate + 1e-9)) + 1
+    return _cached_grid(n_samples, float(rate))
+
+
+def _clean_series(time, values):
+    """NaN'ları atar, zamana göre sıralar ve tekrar eden zaman damgalarını birleştirir"""
+    time = np.asarray(time, dtype=float)
+    values = np.asarray(values, dtype=float)
+
+    valid_mask = ~np.isnan(time) & ~np.isnan(values)
+    time = time[valid_mask]
+    values = values[valid_mask]
+
+    if len(time) > 1 and np.any(np.diff(time) <= 0):
+        order = np.argsort(time, kind='stable')
+        time = time[order]
+        values = values[order]
+        time, unique_index = np.unique(time, return_index=True)
+        values = values[unique_index]
+
+    return time, values
+
+
+def resample_uniform(time, values, target_rate=None, gap_factor=None):
+    """
+    Düzensiz örneklenmiş sinyali düzgün ızgaraya interpolasyonla taşır.
+
+    Nominal örnek aralığının gap_factor katından uzun boşluklar kopukluk
+    kabul edilir; bu boşluğa düşen ızgara noktaları interpolasyonla
+    doldurulmaz, NaN olarak işaretlenir.
+
+    Args:
+        time (array-like): Zaman damgaları (s)
+        values (array-like): Ölçüm değerleri
+        target_rate (float): Hedef örnekleme hızı (Hz), None ise config
+        gap_factor (float): Kopukluk eşiği (nominal aralığın katı), None ise config
+
+    Returns:
+        dict: {
+            'time': Düzgün zaman ızgarası (s),
+            'values': Interpolasyonlu değerler (kopukluklar NaN),
+            'sampling_rate': Kullanılan örnekleme hızı (Hz),
+            'gap_mask': Kopukluğa düşen ızgara noktaları (bool),
+            'gaps': [(başlangıç_s, bitiş_s), ...],
+            'gap_count': Kopukluk sayısı
+        }
+    """
+    if target_rate is None:
+        target_rate = config.RESAMPLE_RATE_HZ
+    if gap_factor is None:
+        gap_factor = config.RESAMPLE_GAP_FACTOR
+
+    time, values = _clean_series(time, values)
+
+    if len(time) < 2:
+        raise ValueError("Yeniden örnekleme için en az 2 geçerli örnek gerekli")
+
+    # Kopukluk tespiti - medyan aralık jitter'a karşı dayanıklıdır
+    time_diff = np.diff(time)
+    nominal_dt = np.median(time_diff)
+    gap_after = time_diff > gap_factor * nominal_dt
+
+    # Izgara ve interpolasyon
+    grid = time[0] + uniform_grid(time[-1] - time[0], target_rate)
+    resampled = np.interp(grid, time, values)
+
+    # Kopukluk içine düşen ızgara noktalarını işaretle
+    left_index = np.clip(np.searchsorted(time, grid, side='right') - 1, 0, len(gap_after) - 1)
+    gap_mask = gap_after[left_index] & (grid > time[left_index]) & (grid < time[left_index + 1])
+    resampled[gap_mask] = np.nan
+
+    gap_index = np.flatnonzero(gap_after)
+    gaps = [(float(time[i]), float(time[i + 1])) for i in gap_index]
+
+    return {
+        'time': grid,
+        'values': resampled,
+        'sampling_rate': float(target_rate),
+        'gap_mask': gap_mask,
+        'gaps': gaps,
+        'gap_count': len(gaps)
+    }
+
+
+def resample_batch(sessions, target_rate=None, duration=None, gap_factor=None):
+    """
+    Birden fazla seansı aynı göreli ızgaraya taşıyıp üst üste dizer.
+
+    Aynı uzunluktaki satırlar tek bir toplu FFT çağrısıyla
+    (ör. scipy.fft.rfft(matrix, axis=1)) işlenebilir.
+
+    Args:
+        sessions (list): [(time, values), ...] çiftleri
+        target_rate (float): Hedef örnekleme hızı (Hz), None ise config
+        duration (float): Ortak süre (s), None ise en kısa seansın süresi
+        gap_factor (float): Kopukluk eşiği, None ise config
+
+    Returns:
+        dict: {
+            'time': Ortak göreli ızgara (s),
+            'values': (seans_sayısı, örnek_sayısı) matrisi,
+            'gap_mask': Aynı boyutta kopukluk maskesi,
+            'sampling_rate': Kullanılan örnekleme hızı (Hz)
+        }
+    """
+    if not sessions:
+        raise ValueError("Toplu yeniden örnekleme için en az bir seans gerekli")
+
+    if target_rate is None:
+        target_rate = config.RESAMPLE_RATE_HZ
+
+    resampled = [
+        resample_uniform(time, values, target_rate=target_rate, gap_factor=gap_factor)
+        for time, values in sessions
+    ]
+
+    # Ortak süre: en kısa seans (ya da istenen süre)
+    shortest = min(r['time'][-1] - r['time'][0] for r in resampled)
+    if duration is None or duration > shortest:
+        duration = shortest
+
+    grid = uniform_grid(duration, target_rate)
+    n_samples = len(grid)
+
+    return {
+        'time': grid,
+        'values': np.vstack([r['values'][:n_samples] for r in resampled]),
+        'gap_mask': np.vstack([r['gap_mask'][:n_samples] for r in resampled]),
+        'sampling_rate': float(target_rate)
+    }
@@ -0,0 +1,112 @@
+"""
+Halka Tampon - Canlı Grafik Verisi
+Önceden ayrılmış NumPy dizisi, çizim için her zaman bitişik görünüm
+
+Her örnek hem i hem de i + kapasite konumuna yazılır (ayna yazım); böylece
+tampon dolup başa sardığında bile en eski -> en yeni sıralı veri tek bir
+bitişik dilimdir ve grafiğe kopyalamadan verilebilir. Kapasite başlangıçta
+küçüktür, dolunca iki katına çıkar (amortize büyüme) ve max_capacity'de
+sabitlenir; sonrasında en eski örneklerin üzerine yazılır.
+"""
+
+import numpy as np
+
+
+class RingBuffer:
+    """Sabit üst kapasiteli, çok sütunlu NumPy halka tamponu"""
+
+    def __init__(self, max_capacity, columns=2, initial_capacity=1024, dtype=float):
+        if max_capacity < 1:
+            raise ValueError("Kapasite en az 1 olmalıdır")
+
+        self.max_capacity = int(max_capacity)
+        self.n_columns = columns
+        self.dtype = dtype
+        self.total = 0  # Şimdiye kadar eklenen toplam örnek (tahliye edilenler dahil)
+        self.generation = 0  # Her clear() çağrısında artar
+
+        self._capacity = min(int(initial_capacity), self.max_capacity)
+        self._data = np.empty((columns, 2 * self._capacity), dtype=dtype)
+        self._start = 0
+        self._size = 0
+
+    def __len__(self):
+        return self._size
+
+    @property
+    def capacity(self):
+        """Şu an ayrılmış kapasite"""
+        return self._capacity
+
+    def _grow(self):
+        """Kapasiteyi iki katına çıkar (max_capacity ile sınırlı)"""
+        new_capacity = min(self._capacity * 2, self.max_capacity)
+        current = self.view()
+        data = np.empty((self.n_columns, 2 * new_capacity), dtype=self.dtype)
+        data[:, :self._size] = current
+        data[:, new_capacity:new_capacity + self._size] = current
+        self._data = data
+        self._capacity = new_capacity
+        self._start = 0
+
+    def append(self, *row):
+        """Tek satır ekle (her sütun için bir değer)"""
+        if self._size == self._capacity and self._capacity < self.max_capacity:
+            self._grow()
+
+        capacity = self._capacity
+        if self._size < capacity:
+            position = (self._start + self._size) % capacity
+            self._size += 1
+        else:
+            # Dolu - en eski örneğin üzerine yaz
+            position = self._start
+            self._start = (self._start + 1) % capacity
+
+        self._data[:, position] = row
+        self._data[:, position + capacity] = row
+        self.total += 1
+
+    def extend(self, block):
+        """
+        Çok sayıda örneği tek seferde ekle
+
+        Args:
+            block (array-like): (sütun_sayısı, n) boyutlu veri
+        """
+        block = np.asarray(block, dtype=self.dtype).reshape(self.n_columns, -1)
+        n = block.shape[1]
+        if n == 0:
+            return
+
+        self.total += n
+        if n > self.max_capacity:
+            block = block[:, -self.max_capacity:]
+            n = self.max_capacity
+
+        while self._size + n > self._capacity and self._capacity < self.max_capacity:
+            self._grow()
+
+        capacity = self._capacity
+        positions = (self._start + self._size + np.arange(n)) % capacity
+        self._data[:, positions] = block
+        self._data[:, positions + capacity] = block
+
+        overflow = max(0, self._size + n - capacity)
+        self._size = min(self._size + n, capacity)
+        self._start = (self._start + overflow) % capacity
+
+    def view(self):
+        """En eskiden en yeniye (sütun_sayısı, n) bitişik görünüm (kopyasız)"""
+        return self._data[:, self._start:self._start + self._size]
+
+    def columns(self):
+        """Sütun başına bitişik görünümler - ör. curve.setData(*buf.columns())"""
+        return tuple(self.view())
+
+    def clear(self):
+        """Tamponu boşalt (ayrılmış bellek korunur)"""
+        self._start = 0
+        self._size = 0
+        self.total = 0
+        self.generation += 1
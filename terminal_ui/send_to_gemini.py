@@ -1,107 +1,305 @@
+"""
+Toplu AI Rapor Üretimi - Komut Satırı Aracı
+Seçilen seanslar ya da hastalar için AI raporlarını eşzamanlı üretir
+
+Kullanım:
+    python send_to_gemini.py                          # tüm seanslar, seans başına rapor
+    python send_to_gemini.py --patient H-0001 --since 2025-01-01
+    python send_to_gemini.py --mode patient           # hasta başına geçmiş raporu
+    python send_to_gemini.py --backend local --dry-run
+
+- Seanslar seans indeksinden (session_index) hasta ve tarih aralığıyla seçilir
+- Seans raporu create_prompt_from_results, hasta raporu geçmiş prompt
+  oluşturucusuyla (create_prompt_from_files) hazırlanır
+- Raporlar asyncio altında en fazla --concurrency kadar eşzamanlı üretilir;
+  istekler ai_scheduler kuyruğundan geçer (hız sınırı, yeniden deneme, önbellek)
+- Her rapor sonucun yanına yazılır (analysis_result_X.json -> ai_report_X.md,
+  hasta raporu ai_report_patient_<id>.md); dosya geçici adla yazılıp
+  yeniden adlandırılır, yarım rapor kalmaz. Rapor ve gecikme ölçümleri
+  ayrıca arayüzün arama yaptığı rapor arşivine (report_store) eklenir
+- Yarıda kesilen çalışma tekrar başlatılınca güncel raporu olan sonuçlar
+  atlanır (rapor kaynaklarından yeniyse güncel sayılır)
+"""
+
+import argparse
+import asyncio
+import json
 import os
-import google.generativeai as genai
-
-def main():
-    # API Key kontrolü
-    api_key = os.getenv("GEMINI_API_KEY")
-    if not api_key:
-        print("Hata: GEMINI_API_KEY çevre değişkeni bulunamadı.")
-        print("Lütfen API anahtarınızı ayarlayın. Örnek (Windows):")
-        print("set GEMINI_API_KEY=API_ANAHTARINIZ")
-        print("$env:GEMINI_API_KEY='API_ANAHTARINIZ' (PowerShell)")
-        return
-
-    # Gemini API konfigürasyonu
+import re
+import sys
+import time
+
+import config
+from ai_scheduler import MIN_RESPONSE_CHARS, PRIORITY_BATCH, AIScheduler
+from llm_backend import BACKENDS, BackendError, get_backend
+from report_store import save_job_report
+from session_index import SessionIndex
+
+
+REPORT_PREFIX = "ai_report_"
+_RESULT_PREFIX = "analysis_result_"
+
+
+def report_path_for(result_path):
+    """Seans raporunun yolu (sonuç dosyasının yanında)"""
+    directory, name = os.path.split(result_path)
+    stem = os.path.splitext(name)[0]
+    if stem.startswith(_RESULT_PREFIX):
+        stem = stem[len(_RESULT_PREFIX):]
+    return os.path.join(directory, f"{REPORT_PREFIX}{stem}.md")
+
+
+def patient_report_path(results_dir, patient_id):
+    """Hasta geçmiş raporunun yolu (dosya adına uygun olmayan karakterler '_')"""
+    safe_id = re.sub(r"[^\w.-]", "_", patient_id)
+    return os.path.join(results_dir, f"{REPORT_PREFIX}patient_{safe_id}.md")
+
+
+def is_report_current(report_path, sources):
+    """Rapor var ve tüm kaynak dosyalardan yeni mi"""
     try:
-        genai.configure(api_key=api_key)
-    except Exception as e:
-        print(f"Konfigürasyon hatası: {e}")
-        return
-
-    # Model ayarları - Daha uzun ve detaylı yanıtlar için
-    generation_config = {
-        "temperature": 0.7,
-        "top_p": 0.95,
-        "top_k": 40,
-        "max_output_tokens": 8192,  # Çok daha uzun yanıtlar için artırıldı
-    }
-
-    # Güvenlik ayarları - Tıbbi içerik için
-    safety_settings = [
-        {
-            "category": "HARM_CATEGORY_HARASSMENT",
-            "threshold": "BLOCK_NONE",
-        },
-        {
-            "category": "HARM_CATEGORY_HATE_SPEECH",
-            "threshold": "BLOCK_NONE",
-        },
-        {
-            "category": "HARM_CATEGORY_SEXUALLY_EXPLICIT",
-            "threshold": "BLOCK_NONE",
-        },
+        report_mtime = os.path.getmtime(report_path)
+        return all(os.path.getmtime(path) <= report_mtime for path in sources)
+    except OSError:
+        return False
+
+
+def select_tasks(results_dir, mode="session", patient_ids=None, since=None, until=None):
+    """
+    Üretilecek raporları seçer.
+
+    Returns:
+        list: [{'name', 'kind', 'source_id', 'sources', 'report'}] - kind: 'session'
+              veya 'patient'
+    """
+    index = SessionIndex(results_dir)
+    try:
+        index.sync()
+        rows = index.select(patient_ids, since, until)
+    finally:
+        index.close()
+
+    if mode == "session":
+        return [
+            {
+                'name': os.path.basename(path),
+                'kind': 'session',
+                'source_id': os.path.basename(path),
+                'sources': [path],
+                'report': report_path_for(path),
+            }
+            for path, _, _ in rows
+        ]
+
+    # Hasta modu - kimliksiz seanslar hastaya bağlanamaz
+    by_patient = {}
+    for path, patient_id, _ in rows:
+        if patient_id:
+            by_patient.setdefault(patient_id, []).append(path)
+    return [
         {
-            "category": "HARM_CATEGORY_DANGEROUS_CONTENT",
-            "threshold": "BLOCK_NONE",
-        },
+            'name': f"Hasta {patient_id} ({len(paths)} seans)",
+            'kind': 'patient',
+            'source_id': patient_id,
+            'sources': paths,
+            'report': patient_report_path(results_dir, patient_id),
+        }
+        for patient_id, paths in sorted(by_patient.items())
     ]
 
+
+def build_prompt(task):
+    """Görevin prompt'u (ağır kütüphaneler ilk kullanımda yüklenir)"""
+    if task['kind'] == 'patient':
+        from historical_analysis import create_prompt_from_files
+        return create_prompt_from_files(task['sources'])
+
+    from signal_processor import create_prompt_from_results
+    with open(task['sources'][0], 'r', encoding='utf-8') as f:
+        return create_prompt_from_results(json.load(f))
+
+
+def write_report(path, text):
+    """Raporu atomik yaz - kesinti yarım dosya bırakmaz"""
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        f.write(text)
+    os.replace(tmp_path, path)
+
+
+async def generate(scheduler, prompt_text, backend, use_cache=True):
+    """
+    İsteği zamanlayıcıya gönderir ve bitmesini event loop'u bloklamadan bekler.
+
+    Returns:
+        AIJob: state 'completed', 'error' ya da 'cancelled'
+    """
+    loop = asyncio.get_running_loop()
+    future = loop.create_future()
+
+    def resolve():
+        if not future.done():
+            future.set_result(None)
+
+    def wake(*args):
+        # Geri çağrılar worker thread'inden gelir
+        try:
+            loop.call_soon_threadsafe(resolve)
+        except RuntimeError:
+            pass  # Event loop kapandı (kesinti sonrası iptal)
+
+    job = scheduler.submit(
+        prompt_text, priority=PRIORITY_BATCH, backend=backend, use_cache=use_cache,
+        on_complete=wake, on_error=wake, on_cancel=wake,
+    )
+    try:
+        await future
+    except asyncio.CancelledError:
+        job.cancel()
+        raise
+    return job
+
+
+async def run_batch(tasks, scheduler, backend, concurrency, use_cache=True,
+                    results_dir="analysis_results"):
+    """
+    Raporları en fazla concurrency kadar eşzamanlı üretir.
+
+    Returns:
+        dict: {'done': n, 'failed': n}
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+    summary = {'done': 0, 'failed': 0}
+    total = len(tasks)
+
+    async def run_one(number, task):
+        async with semaphore:
+            start = time.perf_counter()
+            prefix = f"[{number}/{total}] {task['name']}"
+
+            try:
+                prompt_text = await asyncio.to_thread(build_prompt, task)
+            except (OSError, ValueError, KeyError, TypeError) as e:
+                print(f"Prompt oluşturma hatası ({task['name']}): {e}")
+                prompt_text = None
+            if not prompt_text:
+                summary['failed'] += 1
+                print(f"{prefix}: ✗ prompt oluşturulamadı")
+                return
+
+            job = await generate(scheduler, prompt_text, backend, use_cache)
+            elapsed = time.perf_counter() - start
+            if job.state != "completed":
+                summary['failed'] += 1
+                print(f"{prefix}: ✗ {job.error or job.state}")
+                return
+            if len(job.text) < MIN_RESPONSE_CHARS:
+                # Safety filter'a takılmış olabilir - kaydedilmez, sonraki çalışmada yeniden denenir
+                summary['failed'] += 1
+                print(f"{prefix}: ✗ yanıt çok kısa ({len(job.text)} karakter)")
+                return
+
+            try:
+                await asyncio.to_thread(write_report, task['report'], job.text)
+            except OSError as e:
+                summary['failed'] += 1
+                print(f"{prefix}: ✗ rapor yazılamadı: {e}")
+                return
+            await asyncio.to_thread(save_job_report, job, task['source_id'], task['kind'], results_dir)
+            summary['done'] += 1
+            source = ", önbellekten" if job.from_cache else ""
+            print(f"{prefix}: ✓ {os.path.basename(task['report'])} "
+                  f"({len(job.text)} karakter, {elapsed:.1f} sn{source})")
+
+    await asyncio.gather(*(run_one(number, task) for number, task in enumerate(tasks, 1)))
+    return summary
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Seçilen seanslar/hastalar için toplu AI raporu üretir"
+    )
+    parser.add_argument("--results-dir", default="analysis_results",
+                        help="analysis_result_*.json klasörü (varsayılan: analysis_results)")
+    parser.add_argument("--mode", choices=("session", "patient"), default="session",
+                        help="session: seans başına rapor, patient: hasta başına geçmiş raporu")
+    parser.add_argument("--patient", action="append", dest="patients", metavar="ID",
+                        help="Sadece bu hasta (birden fazla kez verilebilir)")
+    parser.add_argument("--since", metavar="YYYY-AA-GG", help="Bu tarihten itibaren (dahil)")
+    parser.add_argument("--until", metavar="YYYY-AA-GG", help="Bu tarihe kadar (dahil)")
+    parser.add_argument("--concurrency", type=int, default=config.AI_BATCH_CONCURRENCY,
+                        help=f"Eşzamanlı rapor (varsayılan: {config.AI_BATCH_CONCURRENCY})")
+    parser.add_argument("--backend", choices=sorted(BACKENDS),
+                        help="LLM arka ucu (varsayılan: LLM_BACKEND / config)")
+    parser.add_argument("--rpm", type=int,
+                        help="Dakikadaki en fazla istek (varsayılan: config.AI_RATE_LIMITS)")
+    parser.add_argument("--force", action="store_true",
+                        help="Güncel raporu olanları da yeniden üret")
+    parser.add_argument("--no-cache", action="store_true", help="Yanıt önbelleğini kullanma")
+    parser.add_argument("--dry-run", action="store_true",
+                        help="Sadece üretilecek raporları listele")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    concurrency = max(1, args.concurrency)
+
+    if not os.path.isdir(args.results_dir):
+        print(f"Hata: {args.results_dir} klasörü bulunamadı.")
+        return 1
+
+    tasks = select_tasks(args.results_dir, args.mode, args.patients, args.since, args.until)
+    pending = tasks if args.force else [
+        task for task in tasks if not is_report_current(task['report'], task['sources'])
+    ]
+    print(f"{len(tasks)} rapor seçildi, {len(tasks) - len(pending)} tanesi güncel (atlanıyor), "
+          f"{len(pending)} üretilecek")
+
+    if args.dry_run:
+        for task in pending:
+            print(f"  {task['name']} -> {task['report']}")
+        return 0
+    if not pending:
+        return 0
+
+    # Arka uç (varsayılan Gemini; --backend local ile çevrimdışı)
     try:
-        # Gemini 2.5 Flash modelini kullan
-        model_name = "gemini-2.5-flash"
-        print(f"Model: {model_name}")
-
-        model = genai.GenerativeModel(
-            model_name=model_name, 
-            generation_config=generation_config,
-            safety_settings=safety_settings
-        )
-        
-        # ai_prompt dosyasını oku
-        prompt_file = "analysis_results/ai_prompt_20251227_123013.txt"
-        
-        if not os.path.exists(prompt_file):
-            print(f"Hata: {prompt_file} dosyası bulunamadı.")
-            return
-        
-        with open(prompt_file, 'r', encoding='utf-8') as f:
-            prompt_content = f.read()
-        
-        print(f"Dosya okundu: {prompt_file}")
-        print(f"Prompt uzunluğu: {len(prompt_content)} karakter")
-        print("-" * 50)
-        print("Gemini'ye gönderiliyor...")
-        print("-" * 50)
-        
-        # Streaming ile cevap alma
-        print("\nGemini Yanıtı:\n")
-        full_response = ""
-        chunk_count = 0
-        
-        response = model.generate_content(prompt_content, stream=True)
-        
-        for chunk in response:
-            if chunk.text:
-                print(chunk.text, end="", flush=True)
-                full_response += chunk.text
-                chunk_count += 1
-        
-        print("\n" + "-" * 50)
-        print(f"İşlem tamamlandı!")
-        print(f"Toplam {chunk_count} chunk alındı")
-        print(f"Toplam yanıt uzunluğu: {len(full_response)} karakter")
-        
-        # Yanıt çok kısaysa uyarı ver
-        if len(full_response) < 500:
-            print("\n⚠️ UYARI: Yanıt beklenenden çok kısa!")
-            print("Prompt safety filter'a takılmış olabilir.")
-            if hasattr(response, 'prompt_feedback'):
-                print(f"Prompt Feedback: {response.prompt_feedback}")
-
-    except FileNotFoundError as e:
-        print(f"\nDosya bulunamadı: {e}")
+        backend = get_backend(args.backend)
+        backend.prepare()
+    except BackendError as e:
+        print(e)
+        return 1
     except Exception as e:
-        print(f"\nBir hata oluştu: {e}")
+        print(f"Konfigürasyon hatası: {e}")
+        return 1
+
+    rate_limits = dict(config.AI_RATE_LIMITS)
+    if args.rpm:
+        rate_limits[backend.name] = args.rpm
+    # Bu süreçte arayüz isteği yok - tüm worker'lar toplu işlere açık
+    scheduler = AIScheduler(max_workers=concurrency, rate_limits=rate_limits,
+                            reserve_interactive=False)
+
+    print(f"Model: {backend.model_name} ({backend.name}), eşzamanlı: {concurrency}")
+    print("-" * 50)
+    start = time.perf_counter()
+    try:
+        summary = asyncio.run(run_batch(pending, scheduler, backend, concurrency,
+                                        use_cache=not args.no_cache,
+                                        results_dir=args.results_dir))
+    except KeyboardInterrupt:
+        print("\nKesildi - tamamlanan raporlar kaydedildi, tekrar çalıştırınca kalanlar üretilir.")
+        return 130
+    finally:
+        scheduler.shutdown(wait=False)
+
+    elapsed = time.perf_counter() - start
+    print("-" * 50)
+    print(f"İşlem tamamlandı! {summary['done']} rapor üretildi, {summary['failed']} başarısız "
+          f"({elapsed:.1f} sn)")
+    return 1 if summary['failed'] else 0
+
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
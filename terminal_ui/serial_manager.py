@@ -27,8 +27,10 @@ class SerialManager(QThread):
     def connect(self):
         """Seri porta bağlan"""
         try:
-            self.serial_conn = serial.Serial(
-                port=self.port,
+            # Cihaz adı ("COM3", "/dev/ttyUSB0") ya da pyserial URL'i ("loop://" -
+            # gecikme ölçümünde sanal port, "socket://..." vb.)
+            self.serial_conn = serial.serial_for_url(
+                self.port,
                 baudrate=self.baud_rate,
                 timeout=1.0
             )
@@ -63,6 +65,12 @@ class SerialManager(QThread):
             self.error_occurred.emit("Bağlantı yok!")
             return False
             
+    def _read_line(self):
+        """Tek satırı oku ve yayınla (profil modunda aşama olarak ölçülür)"""
+        data = self.serial_conn.readline().decode('utf-8').strip()
+        if data:
+            self.data_received.emit(data)
+            
     def run(self):
         """Thread ana döngüsü - veri okuma"""
         self.running = True
@@ -75,9 +83,7 @@ class SerialManager(QThread):
                 if self.serial_conn and self.serial_conn.is_open:
                     if self.serial_conn.in_waiting > 0:
                         # Veri var, oku
-                        data = self.serial_conn.readline().decode('utf-8').strip()
-                        if data:
-                            self.data_received.emit(data)
+                        self._read_line()
                             
                 time.sleep(0.01)  # CPU yükünü azalt
                 
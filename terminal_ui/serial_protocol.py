@@ -0,0 +1,72 @@
+"""
+Seri Protokol Ayrıştırıcı - Arduino Satırları
+Firmware'in (arduinokod.ino) gönderdiği satırları olaylara çevirir
+
+Satır biçimleri:
+- Modül A: "1138 ms     | 532      | 132"  (zaman, LDR, LED parlaklığı)
+- Modül B: "500 ms | 145.3 mm"
+- Modül C: "Correct! Reaction Time: 879 ms | Presses: 3/20"
+- Test sonu: ">>> System 1 Finished ...", "FINISHED!", ">>> System 2 Finished ...",
+  ">>> GAME OVER! ...", sürekli izleme: "Continuous Monitoring Stopped"
+
+Qt'den bağımsızdır; arayüz (main.on_data_received), benchmark ve gecikme
+ölçüm araçları aynı ayrıştırıcıyı kullanır.
+"""
+
+
+EVENT_SAMPLE = "sample"  # (EVENT_SAMPLE, modül, x, y) - x: zaman (s) ya da deneme no
+EVENT_FINISHED = "finished"  # (EVENT_FINISHED, modül, None, None)
+EVENT_CONTINUOUS_STOPPED = "continuous_stopped"  # (EVENT_CONTINUOUS_STOPPED, None, None, None)
+
+
+def parse_line(data):
+    """
+    Tek bir seri satırı ayrıştırır.
+
+    Args:
+        data (str): Sonundaki satır sonu temizlenmiş satır
+
+    Returns:
+        tuple: (olay, modül, x, y) ya da tanınmayan/bozuk satırda None
+    """
+    # Test bitişini kontrol et
+    if "Continuous Monitoring Stopped" in data:
+        # Sürekli izleme durduruldu (firmware '0' komutunu onayladı)
+        return (EVENT_CONTINUOUS_STOPPED, None, None, None)
+    elif "System 1 Finished" in data or "FINISHED!" in data:
+        return (EVENT_FINISHED, 'A', None, None)
+    elif "System 2 Finished" in data:
+        return (EVENT_FINISHED, 'B', None, None)
+    elif "GAME OVER" in data:
+        return (EVENT_FINISHED, 'C', None, None)
+
+    if '|' not in data:
+        return None
+
+    try:
+        parts = data.split('|')
+
+        # MODÜL A: "1138 ms | 532 | 132" (3 parça)
+        if len(parts) >= 3:
+            time_ms = float(parts[0].replace('ms', '').strip())
+            ldr_value = int(parts[1].strip())
+            return (EVENT_SAMPLE, 'A', time_ms / 1000.0, ldr_value)
+
+        # MODÜL B: "500 ms | 145.3 mm" (2 parça)
+        if len(parts) == 2 and 'mm' in parts[1]:
+            time_ms = float(parts[0].replace('ms', '').strip())
+            distance = float(parts[1].replace('mm', '').strip())
+            return (EVENT_SAMPLE, 'B', time_ms / 1000.0, distance)
+
+        # MODÜL C: "Correct! Reaction Time: 879 ms | Presses: 3/20"
+        if 'Reaction Time:' in parts[0] and 'Presses:' in parts[1]:
+            reaction_str = parts[0].split('Reaction Time:')[1]
+            reaction_time = float(reaction_str.replace('ms', '').strip())
+            presses_str = parts[1].split('Presses:')[1]
+            trial_num = int(presses_str.split('/')[0].strip())
+            return (EVENT_SAMPLE, 'C', trial_num, reaction_time)
+
+    except (ValueError, IndexError):
+        # Parse hatası (yarım satır, gürültü) - satır atlanır
+        pass
+    return None
@@ -0,0 +1,143 @@
+"""
+Seans Tarayıcısı - Geçmiş Analizler Tablosu
+SQLite seans indeksi üzerinde sanal (tembel yüklenen) tablo modeli
+
+Tablo sadece görünür kısım için gereken satırları sayfa sayfa çeker
+(canFetchMore/fetchMore). Sıralama ve filtreleme SQL'de yapılır; bu yüzden
+100 binlerce seansta da bellekte yalnızca kaydırılan sayfalar tutulur.
+"""
+
+from PyQt6.QtCore import Qt, QAbstractTableModel, QModelIndex, QThread, pyqtSignal
+
+import config
+from session_index import SessionIndex, COLUMNS, COLUMN_NAMES
+
+
+class SessionTableModel(QAbstractTableModel):
+    """Seans indeksi için sayfalı, sıralanabilir, filtrelenebilir tablo modeli"""
+
+    def __init__(self, index, page_size=None, parent=None):
+        """
+        Args:
+            index (SessionIndex): Sorgulanacak indeks (GUI thread'ine ait)
+            page_size (int): fetchMore başına çekilen satır sayısı
+        """
+        super().__init__(parent)
+        self.session_index = index
+        self.page_size = page_size or config.SESSION_BROWSER_PAGE_SIZE
+
+        self._rows = []  # [(file_path, değerler...)]
+        self._total = 0
+        self._sort_column = 'analysis_datetime'
+        self._descending = True
+        self._filter_text = ""
+
+    # --- Qt model arayüzü ---
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(COLUMNS)
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if role == Qt.ItemDataRole.DisplayRole and orientation == Qt.Orientation.Horizontal:
+            return COLUMNS[section][1]
+        return None
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+
+        value = self._rows[index.row()][index.column() + 1]
+
+        if role == Qt.ItemDataRole.DisplayRole:
+            if value is None or value == "":
+                return "-"
+            if isinstance(value, float):
+                return f"{value:.2f}"
+            return str(value)
+
+        if role == Qt.ItemDataRole.TextAlignmentRole and isinstance(value, (int, float)):
+            return int(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
+
+        if role == Qt.ItemDataRole.UserRole:
+            return self._rows[index.row()][0]
+
+        return None
+
+    def canFetchMore(self, parent=QModelIndex()):
+        return not parent.isValid() and len(self._rows) < self._total
+
+    def fetchMore(self, parent=QModelIndex()):
+        """Bir sonraki sayfayı indeksten çek"""
+        if parent.isValid():
+            return
+        rows = self.session_index.fetch(
+            len(self._rows), self.page_size,
+            self._sort_column, self._descending, self._filter_text
+        )
+        if not rows:
+            # İndeks başka thread'de küçüldü - sayacı düzelt
+            self._total = len(self._rows)
+            return
+
+        start = len(self._rows)
+        self.beginInsertRows(QModelIndex(), start, start + len(rows) - 1)
+        self._rows.extend(rows)
+        self.endInsertRows()
+
+    def sort(self, column, order=Qt.SortOrder.AscendingOrder):
+        self._sort_column = COLUMN_NAMES[column]
+        self._descending = order == Qt.SortOrder.DescendingOrder
+        self.reload()
+
+    # --- Yardımcılar ---
+
+    def set_filter(self, text):
+        """Hasta/tarih filtresi uygula (önek eşleşmesi)"""
+        self._filter_text = text.strip()
+        self.reload()
+
+    def reload(self):
+        """Modeli sıfırla - görünüm ilk sayfayı fetchMore ile ister"""
+        self.beginResetModel()
+        self._rows = []
+        self._total = self.session_index.count(self._filter_text)
+        self.endResetModel()
+
+    def total_count(self):
+        """Filtreye uyan toplam seans (yüklenmemiş olanlar dahil)"""
+        return self._total
+
+    def file_path(self, row):
+        """Satırın sonuç dosyası yolu"""
+        return self._rows[row][0]
+
+
+class SessionIndexWorker(QThread):
+    """Sonuç klasörünü indeksle arka planda eşitleyen worker thread"""
+
+    # Signaller
+    completed = pyqtSignal(dict)  # {'added', 'removed', 'total'}
+    error_occurred = pyqtSignal(str)
+
+    def __init__(self, results_dir="analysis_results"):
+        super().__init__()
+        self.results_dir = results_dir
+        self.should_stop = False
+
+    def run(self):
+        """Thread ana fonksiyonu - kendi SQLite bağlantısıyla çalışır"""
+        index = SessionIndex(self.results_dir)
+        try:
+            summary = index.sync(should_stop=lambda: self.should_stop)
+            self.completed.emit(summary)
+        except Exception as e:
+            self.error_occurred.emit(f"Seans indeksi hatası: {str(e)}")
+        finally:
+            index.close()
+
+    def stop(self):
+        """Worker'ı durdur"""
+        self.should_stop = True
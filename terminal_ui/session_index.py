@@ -0,0 +1,273 @@
+"""
+Seans İndeksi - Geçmiş Analizlerin Meta Verisi
+analysis_result_*.json dosyaları için SQLite indeksi
+
+Her sonuç dosyasının hasta, tarih ve temel metrikleri tek bir satır olarak
+indekslenir. Seans tarayıcısı sıralama, filtreleme ve sayfalamayı SQL ile
+yapar; JSON dosyalarının hiçbiri belleğe yüklenmez. Yeni sonuçlar kayıt
+anında eklenir (save_results_to_file), dışarıdan kopyalanan dosyalar sync()
+ile artımlı olarak (sadece yeni/değişmiş dosyalar okunarak) eklenir.
+Hasta trendleri (trend_store) aynı işlemde güncellenir.
+"""
+
+import json
+import os
+import sqlite3
+
+import config
+from trend_store import TrendStore
+
+
+# (sütun, başlık, sonuç JSON'undaki yol)
+COLUMNS = [
+    ('patient_id', 'Hasta', ('patient_id',)),
+    ('analysis_datetime', 'Tarih', ('analysis_datetime',)),
+    ('tremor_frequency_hz', 'Tremor (Hz)', ('module_a', 'dominant_frequency_hz')),
+    ('tremor_amplitude', 'Tremor Genlik', ('module_a', 'signal_amplitude')),
+    ('avg_velocity_mm_s', 'Ort. Hız (mm/s)', ('module_b', 'avg_velocity_mm_s')),
+    ('velocity_slope', 'Hız Eğimi', ('module_b', 'velocity_slope')),
+    ('avg_reaction_time_ms', 'Reaksiyon (ms)', ('module_c', 'avg_reaction_time_ms')),
+    ('fatigue_index', 'Yorgunluk', ('module_c', 'fatigue_index')),
+    ('overall_status', 'Durum', ('overall_status',)),
+]
+
+COLUMN_NAMES = [name for name, _, _ in COLUMNS]
+
+_RESULT_PREFIX = "analysis_result_"
+
+# Şema değişince artırılır - eski indeks boşaltılır, sync() yeniden doldurur
+SCHEMA_VERSION = 2
+
+
+def _extract(results, path):
+    """İç içe sözlükten değeri al (yoksa None)"""
+    value = results
+    for key in path:
+        if not isinstance(value, dict):
+            return None
+        value = value.get(key)
+    return value
+
+
+def extract_row(results):
+    """Sonuç sözlüğünden indeks satırı değerlerini çıkarır (COLUMNS sırasıyla)"""
+    return [_extract(results, path) for _, _, path in COLUMNS]
+
+
+class SessionIndex:
+    """Analiz sonuçları klasörü için SQLite meta veri indeksi"""
+
+    def __init__(self, results_dir="analysis_results", db_path=None):
+        """
+        Args:
+            results_dir (str): analysis_result_*.json klasörü
+            db_path (str): İndeks dosyası (varsayılan: klasör içinde config.SESSION_INDEX_FILE)
+        """
+        self.results_dir = results_dir
+        self.db_path = db_path or os.path.join(results_dir, config.SESSION_INDEX_FILE)
+        self._conn = None
+        self._trends = None
+
+    @property
+    def conn(self):
+        """Bağlantı ilk kullanımda açılır (bağlantılar thread'ler arasında paylaşılmaz)"""
+        if self._conn is None:
+            os.makedirs(os.path.dirname(self.db_path) or ".", exist_ok=True)
+            self._conn = sqlite3.connect(self.db_path, timeout=10)
+            # Arayüz okurken analiz thread'i yazabilsin
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._create_schema()
+            self._trends = TrendStore(self._conn)
+        return self._conn
+
+    @property
+    def trends(self):
+        """Aynı veritabanındaki hasta trend deposu"""
+        self.conn
+        return self._trends
+
+    def _create_schema(self):
+        metric_columns = ", ".join(COLUMN_NAMES)
+        with self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS sessions ("
+                "id INTEGER PRIMARY KEY, "
+                "file_path TEXT UNIQUE NOT NULL, "
+                "file_mtime REAL, "
+                "file_size INTEGER, "
+                f"{metric_columns})"
+            )
+            # Her sıralanabilir sütun için indeks - sayfa sorguları tam sıralama yapmasın
+            for name in COLUMN_NAMES:
+                self._conn.execute(
+                    f"CREATE INDEX IF NOT EXISTS idx_sessions_{name} ON sessions ({name}, id)"
+                )
+
+            version = self._conn.execute("PRAGMA user_version").fetchone()[0]
+            if version < SCHEMA_VERSION:
+                self._conn.execute("DELETE FROM sessions")
+                self._conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+
+    def close(self):
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+            self._trends = None
+
+    def add(self, file_path, results):
+        """Tek bir sonuç dosyasını indekse ekle/güncelle"""
+        file_path = os.path.abspath(file_path)
+        stat = os.stat(file_path)
+        with self.conn:
+            self._upsert(file_path, stat.st_mtime, stat.st_size, results)
+
+    def _upsert(self, file_path, mtime, size, results, trend_batch=None):
+        """
+        Satırı ekle/güncelle. trend_batch verilirse trend güncellemesi
+        listeye eklenir (toplu eşitleme), yoksa hemen yapılır.
+        """
+        names = ["file_path", "file_mtime", "file_size"] + COLUMN_NAMES
+        placeholders = ", ".join("?" for _ in names)
+        updates = ", ".join(f"{name}=excluded.{name}" for name in names[1:])
+        row = extract_row(results)
+        self.conn.execute(
+            f"INSERT INTO sessions ({', '.join(names)}) VALUES ({placeholders}) "
+            f"ON CONFLICT(file_path) DO UPDATE SET {updates}",
+            [file_path, mtime, size] + row
+        )
+
+        values = dict(zip(COLUMN_NAMES, row))
+        session = (file_path, values['patient_id'], values['analysis_datetime'], values)
+        if trend_batch is None:
+            self.trends.add_session(*session)
+        else:
+            trend_batch.append(session)
+
+    def sync(self, should_stop=None):
+        """
+        Klasörü indeksle eşitler - sadece yeni/değişmiş dosyalar okunur,
+        silinmiş dosyaların satırları kaldırılır.
+
+        Args:
+            should_stop (callable): True dönerse eşitleme yarıda bırakılır
+
+        Returns:
+            dict: {'added': n, 'removed': n, 'total': n}
+        """
+        known = {
+            path: (mtime, size)
+            for path, mtime, size in self.conn.execute(
+                "SELECT file_path, file_mtime, file_size FROM sessions"
+            )
+        }
+
+        added = 0
+        seen = set()
+        trend_batch = []
+        if os.path.isdir(self.results_dir):
+            with self.conn:
+                for entry in os.scandir(self.results_dir):
+                    if should_stop and should_stop():
+                        break
+                    if not (entry.name.startswith(_RESULT_PREFIX) and entry.name.endswith(".json")):
+                        continue
+
+                    path = os.path.abspath(entry.path)
+                    seen.add(path)
+                    stat = entry.stat()
+                    if known.get(path) == (stat.st_mtime, stat.st_size):
+                        continue
+
+                    try:
+                        with open(path, 'r', encoding='utf-8') as f:
+                            results = json.load(f)
+                    except (OSError, ValueError) as e:
+                        print(f"Seans indeksi - dosya okunamadı ({entry.name}): {e}")
+                        continue
+
+                    self._upsert(path, stat.st_mtime, stat.st_size, results, trend_batch)
+                    added += 1
+
+                # Dosyalar tarih sırasıyla gelmeyebilir - seriler bir kez hesaplanır
+                self.trends.add_sessions(trend_batch)
+
+        removed = 0
+        if not (should_stop and should_stop()):
+            missing = [(path,) for path in known if path not in seen]
+            if missing:
+                with self.conn:
+                    self.conn.executemany("DELETE FROM sessions WHERE file_path = ?", missing)
+                    self.trends.remove_sessions([path for (path,) in missing])
+                removed = len(missing)
+
+        return {'added': added, 'removed': removed, 'total': self.count()}
+
+    @staticmethod
+    def _where(filter_text):
+        """
+        Hasta kimliği veya tarihi filtre metniyle başlayan seanslar.
+
+        Önek araması aralık sorgusuna çevrilir; böylece iki sütunun
+        indeksleri kullanılır ve tablo taranmaz (LIKE '%...%' taramak zorunda).
+        """
+        if not filter_text:
+            return "", []
+        upper = filter_text + "\uffff"
+        return (
+            "WHERE (patient_id >= ? AND patient_id < ?) "
+            "OR (analysis_datetime >= ? AND analysis_datetime < ?)",
+            [filter_text, upper, filter_text, upper]
+        )
+
+    def count(self, filter_text=""):
+        """Filtreye uyan seans sayısı"""
+        where, params = self._where(filter_text)
+        return self.conn.execute(f"SELECT COUNT(*) FROM sessions {where}", params).fetchone()[0]
+
+    def fetch(self, offset, limit, sort_column='analysis_datetime', descending=True, filter_text=""):
+        """
+        Bir sayfa seans döndürür.
+
+        Returns:
+            list: [(file_path, değer1, değer2, ...)] - değerler COLUMNS sırasıyla
+        """
+        if sort_column not in COLUMN_NAMES:
+            raise ValueError(f"Bilinmeyen sütun: {sort_column}")
+
+        where, params = self._where(filter_text)
+        order = "DESC" if descending else "ASC"
+        return self.conn.execute(
+            f"SELECT file_path, {', '.join(COLUMN_NAMES)} FROM sessions {where} "
+            f"ORDER BY {sort_column} {order}, id {order} LIMIT ? OFFSET ?",
+            params + [limit, offset]
+        ).fetchall()
+
+    def select(self, patient_ids=None, since=None, until=None):
+        """
+        Toplu işlemler için seans seçimi (en eski önce).
+
+        Args:
+            patient_ids (list): Sadece bu hastaların seansları (None = hepsi)
+            since (str): Bu tarihten itibaren ('YYYY-AA-GG', dahil)
+            until (str): Bu tarihe kadar ('YYYY-AA-GG', dahil)
+
+        Returns:
+            list: [(file_path, patient_id, analysis_datetime)]
+        """
+        clauses, params = [], []
+        if patient_ids:
+            clauses.append(f"patient_id IN ({', '.join('?' for _ in patient_ids)})")
+            params.extend(patient_ids)
+        if since:
+            clauses.append("analysis_datetime >= ?")
+            params.append(since)
+        if until:
+            # Gün dahil - o günün tüm saatleri önekten büyüktür
+            clauses.append("analysis_datetime < ?")
+            params.append(until + "\uffff")
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        return self.conn.execute(
+            f"SELECT file_path, patient_id, analysis_datetime FROM sessions {where} "
+            "ORDER BY analysis_datetime, id",
+            params
+        ).fetchall()
@@ -8,14 +8,209 @@ Bu modül 3 farklı sensörden gelen ham verileri işleyip klinik metriklere dö
 - Modül C: Koordinasyon Analizi (Reaksiyon zamanı ve yorgunluk endeksi)
 """
 
+import threading
+import time as _time
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+
 import pandas as pd
 import numpy as np
 from scipy.fft import fft, fftfreq
 from sklearn.linear_model import LinearRegression
+from resampler import resample_uniform
+from analysis_cache import memoize_analysis
+import config
 import warnings
 warnings.filterwarnings('ignore')
 
 
+# Algoritma sürümü - analiz çıktısını değiştiren her düzenlemede artırılmalı.
+# Önbellek anahtarının parçasıdır; değişince eski sonuçlar geçersiz olur.
+ALGORITHM_VERSION = "1.3"
+
+# Spektral öznitelik bantları (Hz)
+SPECTRAL_BANDS = {
+    'band_power_3_5_hz': (3.0, 5.0),    # Parkinson istirahat tremoru (alt)
+    'band_power_4_6_hz': (4.0, 6.0),    # Klasik Parkinson tremoru
+    'band_power_6_12_hz': (6.0, 12.0),  # Esansiyel / fizyolojik tremor
+}
+
+
+def empty_spectral_features():
+    """extract_spectral_features ile aynı anahtarlar, tüm değerler None"""
+    features = {'dominant_frequency_hz': None, 'signal_amplitude': None}
+    features.update(dict.fromkeys(SPECTRAL_BANDS))
+    features.update(dict.fromkeys([
+        'spectral_entropy', 'peak_to_total_ratio', 'harmonic_ratio',
+        'spectral_centroid_hz', 'sampling_rate_hz', 'gap_count'
+    ]))
+    return features
+
+
+def extract_spectral_features(time, values, search_band, fallback_band=None, max_harmonics=5):
+    """
+    Ortak spektral çekirdek - sinyal başına tek FFT
+    
+    Sinyali düzgün ızgaraya taşır, ortalamasını çıkarır, tek bir FFT alır ve
+    aynı spektrumdan tüm öznitelikleri hesaplar. Modül A ve B tarafından
+    kullanılır.
+    
+    Args:
+        time (array-like): Zaman damgaları (s)
+        values (array-like): Sinyal değerleri
+        search_band (tuple): Baskın frekansın aranacağı (alt, üst) Hz aralığı
+        fallback_band (tuple): search_band boşsa denenecek aralık
+        max_harmonics (int): Harmonik oranı için bakılacak en yüksek harmonik
+        
+    Returns:
+        dict: {
+            'dominant_frequency_hz': Baskın frekans (bulunamazsa None),
+            'signal_amplitude': Baskın frekanstaki FFT genliği,
+            'band_power_3_5_hz' / '..._4_6_hz' / '..._6_12_hz': Bant gücü (toplam güce oranı;
+                bant Nyquist frekansını aşıyorsa ölçülemez, None),
+            'spectral_entropy': Normalize spektral entropi (0-1),
+            'peak_to_total_ratio': Tepe gücü / toplam güç,
+            'harmonic_ratio': Harmonik güç / temel frekans gücü,
+            'spectral_centroid_hz': Spektral ağırlık merkezi,
+            'sampling_rate_hz': Kullanılan örnekleme hızı,
+            'gap_count': Tespit edilen veri kopukluğu sayısı
+        }
+    """
+    # Düzgün ızgaraya yeniden örnekle (zaman damgası jitter'ı)
+    resampled = resample_uniform(time, values)
+    sampling_rate = resampled['sampling_rate']  # Hz
+    
+    # Detrend - sinyalden ortalamayı çıkar
+    # Kopukluk noktaları (NaN) ortalamaya eşitlenir, sahte güç üretmez
+    signal_mean = np.nanmean(resampled['values'])
+    detrended_signal = np.nan_to_num(resampled['values'] - signal_mean)
+    
+    # Tek FFT
+    N = len(detrended_signal)
+    fft_values = fft(detrended_signal)
+    frequencies = fftfreq(N, d=1.0 / sampling_rate)
+    
+    # Sadece pozitif frekansları al
+    positive_freq_mask = frequencies > 0
+    frequencies = frequencies[positive_freq_mask]
+    fft_magnitude = np.abs(fft_values[positive_freq_mask])
+    power = fft_magnitude ** 2
+    total_power = np.sum(power)
+    
+    features = empty_spectral_features()
+    features['sampling_rate_hz'] = sampling_rate
+    features['gap_count'] = resampled['gap_count']
+    
+    if len(frequencies) == 0:
+        return features
+    
+    # Baskın frekans (en yüksek genlik) - arama aralığında
+    freq_range_mask = (frequencies >= search_band[0]) & (frequencies <= search_band[1])
+    if not np.any(freq_range_mask) and fallback_band is not None:
+        freq_range_mask = (frequencies >= fallback_band[0]) & (frequencies <= fallback_band[1])
+    
+    peak_index = None
+    if np.any(freq_range_mask):
+        candidate_index = np.flatnonzero(freq_range_mask)
+        peak_index = candidate_index[np.argmax(fft_magnitude[candidate_index])]
+        features['dominant_frequency_hz'] = frequencies[peak_index]
+        features['signal_amplitude'] = fft_magnitude[peak_index]
+    
+    if total_power <= 0:
+        return features
+    
+    # Bant güçleri - Nyquist'i aşan bant ölçülemez, 0 yerine None kalır
+    # (10 Hz cihazda Nyquist 5 Hz: 4-6 ve 6-12 Hz bantları None)
+    nyquist = sampling_rate / 2
+    for name, (low, high) in SPECTRAL_BANDS.items():
+        if high > nyquist:
+            continue
+        band_mask = (frequencies >= low) & (frequencies <= high)
+        features[name] = np.sum(power[band_mask]) / total_power
+    
+    # Spektral entropi (normalize Shannon)
+    power_distribution = power / total_power
+    nonzero = power_distribution[power_distribution > 0]
+    if len(power_distribution) > 1:
+        features['spectral_entropy'] = -np.sum(nonzero * np.log(nonzero)) / np.log(len(power_distribution))
+    else:
+        features['spectral_entropy'] = 0.0
+    
+    # Spektral ağırlık merkezi
+    features['spectral_centroid_hz'] = np.sum(frequencies * power) / total_power
+    
+    if peak_index is not None:
+        # Tepe / toplam güç
+        features['peak_to_total_ratio'] = power[peak_index] / total_power
+        
+        # Harmonik oranı: 2f, 3f, ... bileşenlerinin temel frekansa oranı
+        fundamental = frequencies[peak_index]
+        harmonics = fundamental * np.arange(2, max_harmonics + 1)
+        harmonics = harmonics[harmonics <= frequencies[-1]]
+        if len(harmonics) > 0 and power[peak_index] > 0:
+            harmonic_index = np.abs(frequencies[None, :] - harmonics[:, None]).argmin(axis=1)
+            features['harmonic_ratio'] = np.sum(power[harmonic_index]) / power[peak_index]
+        else:
+            features['harmonic_ratio'] = 0.0
+    
+    return features
+
+
+def _round_features(features, digits=4):
+    """Spektral öznitelikleri JSON için yuvarlar (None korunur)"""
+    return {
+        key: (round(float(value), digits) if value is not None and key != 'gap_count' else value)
+        for key, value in features.items()
+    }
+
+
+def compute_tremor_metrics(time, ldr_values):
+    """
+    Modül A çekirdeği - zaman/LDR dizilerinden tremor metrikleri
+    
+    analyze_tremor (CSV) ve sürekli izleme pencereleri tarafından kullanılır.
+    Yetersiz veri durumunda ValueError fırlatır.
+    
+    Args:
+        time (np.ndarray): Zaman damgaları (s)
+        ldr_values (np.ndarray): LDR değerleri
+        
+    Returns:
+        dict: analyze_tremor ile aynı alanlar
+    """
+    time = np.asarray(time, dtype=float)
+    ldr_values = np.asarray(ldr_values, dtype=float)
+    
+    # NaN değerleri temizle
+    valid_mask = ~np.isnan(ldr_values) & ~np.isnan(time)
+    time = time[valid_mask]
+    ldr_values = ldr_values[valid_mask]
+    
+    if len(ldr_values) < 10:
+        raise ValueError("NaN temizleme sonrası yeterli veri kalmadı")
+    
+    # ADIM 1-2: Yeniden örnekleme, detrend ve tek FFT (ortak çekirdek)
+    # ADIM 3: 1-15 Hz aralığında baskın frekansı bul (yoksa 0-15 Hz)
+    spectral = extract_spectral_features(
+        time, ldr_values,
+        search_band=(1.0, 15.0),
+        fallback_band=(0.0, 15.0)
+    )
+    
+    if spectral['dominant_frequency_hz'] is None:
+        raise ValueError("1-15 Hz aralığında frekans bulunamadı")
+    
+    dominant_frequency = spectral.pop('dominant_frequency_hz')
+    signal_amplitude = spectral.pop('signal_amplitude')
+    
+    return {
+        'dominant_frequency_hz': round(float(dominant_frequency), 2),
+        'signal_amplitude': round(float(signal_amplitude), 2),
+        **_round_features(spectral),
+        'status': 'success'
+    }
+
+
+@memoize_analysis('tremor', ALGORITHM_VERSION)
 def analyze_tremor(csv_path):
     """
     Modül A: Tremor Analizi - LDR Sensörü
@@ -28,7 +223,9 @@ def analyze_tremor(csv_path):
     Returns:
         dict: {
             'dominant_frequency_hz': Baskın frekans (1-15 Hz aralığı),
-            'signal_amplitude': Sinyal şiddeti (genlik)
+            'signal_amplitude': Sinyal şiddeti (genlik),
+            ... extract_spectral_features öznitelikleri (bant güçleri,
+            spektral entropi, tepe/toplam oranı, harmonik oranı, ağırlık merkezi)
         }
     """
     try:
@@ -47,58 +244,7 @@ def analyze_tremor(csv_path):
         time = df.iloc[:, 0].values  # İlk sütun: Zaman (s)
         ldr_values = df.iloc[:, 1].values  # İkinci sütun: LDR Değeri
         
-        # NaN değerleri temizle
-        valid_mask = ~np.isnan(ldr_values) & ~np.isnan(time)
-        time = time[valid_mask]
-        ldr_values = ldr_values[valid_mask]
-        
-        if len(ldr_values) < 10:
-            raise ValueError("NaN temizleme sonrası yeterli veri kalmadı")
-        
-        # ADIM 1: Detrend - sinyalden ortalamayı çıkar
-        signal_mean = np.mean(ldr_values)
-        detrended_signal = ldr_values - signal_mean
-        
-        # ADIM 2: FFT uygula
-        N = len(detrended_signal)
-        
-        # Örnekleme frekansını hesapla
-        time_diff = np.diff(time)
-        avg_time_diff = np.mean(time_diff)
-        sampling_rate = 1.0 / avg_time_diff  # Hz
-        
-        # FFT hesapla
-        fft_values = fft(detrended_signal)
-        frequencies = fftfreq(N, d=avg_time_diff)
-        
-        # Sadece pozitif frekansları al
-        positive_freq_mask = frequencies > 0
-        frequencies = frequencies[positive_freq_mask]
-        fft_magnitude = np.abs(fft_values[positive_freq_mask])
-        
-        # ADIM 3: 1-15 Hz aralığında baskın frekansı bul
-        freq_range_mask = (frequencies >= 1.0) & (frequencies <= 15.0)
-        
-        if not np.any(freq_range_mask):
-            # Eğer 1-15 Hz aralığında veri yoksa, 0-15 Hz'e genişlet
-            freq_range_mask = (frequencies >= 0.0) & (frequencies <= 15.0)
-        
-        filtered_frequencies = frequencies[freq_range_mask]
-        filtered_magnitudes = fft_magnitude[freq_range_mask]
-        
-        if len(filtered_magnitudes) == 0:
-            raise ValueError("1-15 Hz aralığında frekans bulunamadı")
-        
-        # En yüksek genliğe sahip frekansı bul
-        max_magnitude_index = np.argmax(filtered_magnitudes)
-        dominant_frequency = filtered_frequencies[max_magnitude_index]
-        signal_amplitude = filtered_magnitudes[max_magnitude_index]
-        
-        return {
-            'dominant_frequency_hz': round(float(dominant_frequency), 2),
-            'signal_amplitude': round(float(signal_amplitude), 2),
-            'status': 'success'
-        }
+        return compute_tremor_metrics(time, ldr_values)
         
     except FileNotFoundError:
         return {
@@ -116,6 +262,113 @@ def analyze_tremor(csv_path):
         }
 
 
+def compute_bradykinesia_metrics(time, distance):
+    """
+    Modül B çekirdeği - zaman/mesafe dizilerinden bradikinezi metrikleri
+    
+    analyze_bradykinesia (CSV) ve sürekli izleme pencereleri tarafından
+    kullanılır. Yetersiz veri durumunda ValueError fırlatır.
+    
+    Args:
+        time (np.ndarray): Zaman damgaları (s)
+        distance (np.ndarray): Mesafe değerleri (mm)
+        
+    Returns:
+        dict: analyze_bradykinesia ile aynı alanlar
+    """
+    time = np.asarray(time, dtype=float)
+    distance = np.asarray(distance, dtype=float)
+    
+    # NaN değerleri temizle
+    valid_mask = ~np.isnan(distance) & ~np.isnan(time)
+    time = time[valid_mask]
+    distance = distance[valid_mask]
+    
+    if len(distance) < 2:
+        raise ValueError("NaN temizleme sonrası yeterli veri kalmadı")
+    
+    # ADIM 1: Hız hesapla (v = Δd / Δt)
+    time_diff = np.diff(time)  # Δt
+    distance_diff = np.diff(distance)  # Δd
+    
+    # Sıfıra bölme kontrolü
+    time_diff[time_diff == 0] = 1e-6  # Çok küçük bir değer
+    
+    velocity = distance_diff / time_diff  # mm/s
+    
+    # Aşırı değerleri filtrele (outlier removal)
+    # Mesafe sensöründe ara sıra 0.0 veya çok yüksek değerler olabiliyor
+    velocity_abs = np.abs(velocity)
+    median_vel = np.median(velocity_abs)
+    mad = np.median(np.abs(velocity_abs - median_vel))
+    
+    # Modified Z-score ile outlier tespiti
+    if mad > 0:
+        modified_z_scores = 0.6745 * (velocity_abs - median_vel) / mad
+        outlier_mask = modified_z_scores < 3.5  # 3.5 sigma
+        velocity_filtered = velocity[outlier_mask]
+    else:
+        velocity_filtered = velocity
+    
+    if len(velocity_filtered) == 0:
+        velocity_filtered = velocity  # Fallback
+    
+    # ADIM 2: İstatistikler
+    avg_velocity = np.mean(np.abs(velocity_filtered))
+    max_velocity = np.max(np.abs(velocity_filtered))
+    
+    # ADIM 3: Linear Regression ile trend analizi
+    # Hızın zaman içinde nasıl değiştiğini bul
+    velocity_time = time[1:]  # Hız değerleri bir eleman kısa
+    
+    # Outlier filtrelenmiş indeksleri al
+    if mad > 0 and np.any(outlier_mask):
+        velocity_time_filtered = velocity_time[outlier_mask]
+    else:
+        velocity_time_filtered = velocity_time
+        
+    if len(velocity_time_filtered) < 2:
+        velocity_time_filtered = velocity_time
+        velocity_filtered = velocity
+    
+    # Reshape for sklearn
+    X = velocity_time_filtered.reshape(-1, 1)
+    y = velocity_filtered.reshape(-1, 1)
+    
+    # Linear regression
+    model = LinearRegression()
+    model.fit(X, y)
+    
+    velocity_slope = float(model.coef_[0][0])
+    
+    # ADIM 4: FFT ile frekans analizi (Modül A ile ortak çekirdek)
+    # Mesafe sinyalinin frekans içeriğini analiz et
+    if len(distance) >= 10:
+        # 0.1-10 Hz aralığında baskın frekansı bul (hareket frekansları)
+        spectral = extract_spectral_features(
+            time, distance,
+            search_band=(0.1, 10.0)
+        )
+        spectral.pop('signal_amplitude')
+        dominant_frequency = spectral.pop('dominant_frequency_hz') or 0.0
+    else:
+        # Aynı şema - eksik anahtar indeks/prompt tarafında sorun çıkarmasın
+        spectral = empty_spectral_features()
+        spectral.pop('signal_amplitude')
+        spectral.pop('dominant_frequency_hz')
+        dominant_frequency = 0.0
+    
+    return {
+        'avg_velocity_mm_s': round(float(avg_velocity), 2),
+        'max_velocity_mm_s': round(float(max_velocity), 2),
+        'velocity_slope': round(velocity_slope, 4),
+        'dominant_frequency_hz': round(float(dominant_frequency), 2),
+        **_round_features(spectral),
+        'status': 'success'
+    }
+
+
+@memoize_analysis('bradykinesia', ALGORITHM_VERSION)
 def analyze_bradykinesia(csv_path):
     """
     Modül B: Bradikinezi Analizi - Ultrasonik Sensör
@@ -129,7 +382,9 @@ def analyze_bradykinesia(csv_path):
         dict: {
             'avg_velocity_mm_s': Ortalama hız (mm/s),
             'max_velocity_mm_s': Maksimum hız (mm/s),
-            'velocity_slope': Hız değişim eğimi (negatif = yavaşlama)
+            'velocity_slope': Hız değişim eğimi (negatif = yavaşlama),
+            'dominant_frequency_hz': Baskın hareket frekansı (0.1-10 Hz),
+            ... extract_spectral_features öznitelikleri
         }
     """
     try:
@@ -148,112 +403,7 @@ def analyze_bradykinesia(csv_path):
         time = df.iloc[:, 0].values  # İlk sütun: Zaman (s)
         distance = df.iloc[:, 1].values  # İkinci sütun: Mesafe (mm)
         
-        # NaN değerleri temizle
-        valid_mask = ~np.isnan(distance) & ~np.isnan(time)
-        time = time[valid_mask]
-        distance = distance[valid_mask]
-        
-        if len(distance) < 2:
-            raise ValueError("NaN temizleme sonrası yeterli veri kalmadı")
-        
-        # ADIM 1: Hız hesapla (v = Δd / Δt)
-        time_diff = np.diff(time)  # Δt
-        distance_diff = np.diff(distance)  # Δd
-        
-        # Sıfıra bölme kontrolü
-        time_diff[time_diff == 0] = 1e-6  # Çok küçük bir değer
-        
-        velocity = distance_diff / time_diff  # mm/s
-        
-        # Aşırı değerleri filtrele (outlier removal)
-        # Mesafe sensöründe ara sıra 0.0 veya çok yüksek değerler olabiliyor
-        velocity_abs = np.abs(velocity)
-        median_vel = np.median(velocity_abs)
-        mad = np.median(np.abs(velocity_abs - median_vel))
-        
-        # Modified Z-score ile outlier tespiti
-        if mad > 0:
-            modified_z_scores = 0.6745 * (velocity_abs - median_vel) / mad
-            outlier_mask = modified_z_scores < 3.5  # 3.5 sigma
-            velocity_filtered = velocity[outlier_mask]
-        else:
-            velocity_filtered = velocity
-        
-        if len(velocity_filtered) == 0:
-            velocity_filtered = velocity  # Fallback
-        
-        # ADIM 2: İstatistikler
-        avg_velocity = np.mean(np.abs(velocity_filtered))
-        max_velocity = np.max(np.abs(velocity_filtered))
-        
-        # ADIM 3: Linear Regression ile trend analizi
-        # Hızın zaman içinde nasıl değiştiğini bul
-        velocity_time = time[1:]  # Hız değerleri bir eleman kısa
-        
-        # Outlier filtrelenmiş indeksleri al
-        if mad > 0 and np.any(outlier_mask):
-            velocity_time_filtered = velocity_time[outlier_mask]
-        else:
-            velocity_time_filtered = velocity_time
-            
-        if len(velocity_time_filtered) < 2:
-            velocity_time_filtered = velocity_time
-            velocity_filtered = velocity
-        
-        # Reshape for sklearn
-        X = velocity_time_filtered.reshape(-1, 1)
-        y = velocity_filtered.reshape(-1, 1)
-        
-        # Linear regression
-        model = LinearRegression()
-        model.fit(X, y)
-        
-        velocity_slope = float(model.coef_[0][0])
-        
-        # ADIM 4: FFT ile frekans analizi (Modül A'daki gibi)
-        # Mesafe sinyalinin frekans içeriğini analiz et
-        if len(distance) >= 10:
-            # Detrend - sinyalden ortalamayı çıkar
-            signal_mean = np.mean(distance)
-            detrended_signal = distance - signal_mean
-            
-            # FFT uygula
-            N = len(detrended_signal)
-            
-            # Örnekleme frekansını hesapla
-            time_diff_avg = np.mean(np.diff(time))
-            sampling_rate = 1.0 / time_diff_avg  # Hz
-            
-            # FFT hesapla
-            fft_values = fft(detrended_signal)
-            frequencies = fftfreq(N, d=time_diff_avg)
-            
-            # Sadece pozitif frekansları al
-            positive_freq_mask = frequencies > 0
-            frequencies = frequencies[positive_freq_mask]
-            fft_magnitude = np.abs(fft_values[positive_freq_mask])
-            
-            # 0.1-10 Hz aralığında baskın frekansı bul (hareket frekansları)
-            freq_range_mask = (frequencies >= 0.1) & (frequencies <= 10.0)
-            
-            if np.any(freq_range_mask):
-                filtered_frequencies = frequencies[freq_range_mask]
-                filtered_magnitudes = fft_magnitude[freq_range_mask]
-                
-                # En yüksek genliğe sahip frekansı bul
-                max_magnitude_index = np.argmax(filtered_magnitudes)
-                dominant_frequency = filtered_frequencies[max_magnitude_index]
-            else:
-                dominant_frequency = 0.0
-        else:
-            dominant_frequency = 0.0
-        
-        return {
-            'avg_velocity_mm_s': round(float(avg_velocity), 2),
-            'max_velocity_mm_s': round(float(max_velocity), 2),
-            'velocity_slope': round(velocity_slope, 4),
-            'status': 'success'
-        }
+        return compute_bradykinesia_metrics(time, distance)
         
     except FileNotFoundError:
         return {
@@ -273,6 +423,7 @@ def analyze_bradykinesia(csv_path):
         }
 
 
+@memoize_analysis('coordination', ALGORITHM_VERSION)
 def analyze_coordination(csv_path):
     """
     Modül C: Koordinasyon Analizi - Buton Paneli
@@ -369,31 +520,96 @@ def analyze_coordination(csv_path):
         }
 
 
-def process_all_modules(module_a_path, module_b_path, module_c_path):
+# Modül analizleri için paylaşılan havuz (tür -> executor)
+_executors = {}
+_executors_lock = threading.Lock()
+
+
+def get_analysis_executor(kind=None):
+    """
+    Modül analizleri için paylaşılan executor'ı döndürür (ilk çağrıda oluşturulur).
+    
+    Args:
+        kind (str): "thread" veya "process" (varsayılan: config.ANALYSIS_EXECUTOR)
+        
+    Returns:
+        Executor: Tüm process_all_modules çağrılarında yeniden kullanılan havuz
+    """
+    kind = kind or config.ANALYSIS_EXECUTOR
+    with _executors_lock:
+        executor = _executors.get(kind)
+        if executor is None:
+            if kind == 'process':
+                executor = ProcessPoolExecutor(max_workers=config.ANALYSIS_MAX_WORKERS)
+            elif kind == 'thread':
+                executor = ThreadPoolExecutor(
+                    max_workers=config.ANALYSIS_MAX_WORKERS,
+                    thread_name_prefix="module_analysis"
+                )
+            else:
+                raise ValueError(f"Bilinmeyen analiz executor türü: {kind}")
+            _executors[kind] = executor
+        return executor
+
+
+def _timed_analysis(func, csv_path):
+    """Analiz fonksiyonunu çalıştırır, (sonuç, süre_ms) döndürür"""
+    start = _time.perf_counter()
+    result = func(csv_path)
+    return result, round((_time.perf_counter() - start) * 1000, 1)
+
+
+def process_all_modules(module_a_path, module_b_path, module_c_path, executor=None):
     """
     Tüm modüllerin verilerini işler ve tek bir sonuç döndürür.
     
+    Üç modül birbirinden bağımsız olduğu için varsayılan olarak paylaşılan
+    havuzda eşzamanlı analiz edilir; toplam süre en yavaş modülün süresidir.
+    Her modülün süresi results['timings_ms'] altında kaydedilir.
+    
     Args:
         module_a_path (str): Modül A CSV dosya yolu
         module_b_path (str): Modül B CSV dosya yolu
         module_c_path (str): Modül C CSV dosya yolu
+        executor (str): "thread", "process" veya "serial" (varsayılan: config.ANALYSIS_EXECUTOR)
         
     Returns:
         dict: Tüm modüllerin analiz sonuçlarını içeren dictionary
     """
     results = {}
+    timings = {}
+    kind = executor or config.ANALYSIS_EXECUTOR
+    
+    jobs = [
+        ('module_a', "Modül A (Tremor)", analyze_tremor, module_a_path),
+        ('module_b', "Modül B (Bradikinezi)", analyze_bradykinesia, module_b_path),
+        ('module_c', "Modül C (Koordinasyon)", analyze_coordination, module_c_path),
+    ]
     
-    # Modül A - Tremor
-    print("Modül A (Tremor) analiz ediliyor...")
-    results['module_a'] = analyze_tremor(module_a_path)
+    total_start = _time.perf_counter()
     
-    # Modül B - Bradikinezi
-    print("Modül B (Bradikinezi) analiz ediliyor...")
-    results['module_b'] = analyze_bradykinesia(module_b_path)
+    if kind == 'serial':
+        for key, label, func, path in jobs:
+            print(f"{label} analiz ediliyor...")
+            results[key], timings[key] = _timed_analysis(func, path)
+    else:
+        pool = get_analysis_executor(kind)
+        futures = {}
+        for key, label, func, path in jobs:
+            print(f"{label} analiz ediliyor...")
+            futures[key] = pool.submit(_timed_analysis, func, path)
+        
+        for key, label, func, path in jobs:
+            try:
+                results[key], timings[key] = futures[key].result()
+            except Exception as e:
+                # Analizörler kendi hatalarını yakalar; buraya sadece havuz hataları düşer
+                results[key] = {'status': 'error', 'error_message': str(e)}
+                timings[key] = None
     
-    # Modül C - Koordinasyon
-    print("Modül C (Koordinasyon) analiz ediliyor...")
-    results['module_c'] = analyze_coordination(module_c_path)
+    timings['total'] = round((_time.perf_counter() - total_start) * 1000, 1)
+    results['timings_ms'] = timings
+    results['analysis_executor'] = kind
     
     # Genel durum kontrolü
     all_success = all(
@@ -484,6 +700,15 @@ def save_results_to_file(results, output_dir="analysis_results"):
     with open(filepath, 'w', encoding='utf-8') as f:
         json.dump(results, f, indent=2, ensure_ascii=False)
     
+    # Seans tarayıcısı indeksine ekle
+    try:
+        from session_index import SessionIndex
+        index = SessionIndex(output_dir)
+        index.add(filepath, results)
+        index.close()
+    except Exception as e:
+        print(f"Seans indeksi güncelleme hatası: {e}")
+    
     return filepath
 
 
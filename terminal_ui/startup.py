@@ -0,0 +1,137 @@
+"""
+Hızlı Açılış - Ertelenmiş Yükleme ve Açılış Süresi Raporu
+Ağır kütüphaneler pencere göründükten sonra arka planda yüklenir
+
+Pencere için gerekmeyen modüller (pandas/scipy/sklearn içeren
+signal_processor ve google.generativeai) ana modülde içe aktarılmaz. İlk
+boyamadan sonra PrewarmWorker bunları arka planda yükler; kullanıcı
+analiz/AI düğmesine önce basarsa modül ilk kullanımda yüklenir.
+
+--startup-report bayrağıyla açılışta her üst düzey import'un ve her
+aşamanın (QApplication, pencere, ilk boyama, ön yükleme) süresi ölçülüp
+terminale yazdırılır. Bayrak yoksa import kancası kurulmaz.
+"""
+
+import builtins
+import importlib
+import sys
+import time
+
+from PyQt6.QtCore import QThread, pyqtSignal
+
+import config
+
+
+STARTUP_REPORT_FLAG = "--startup-report"
+
+_t0 = time.perf_counter()
+_enabled = False
+_marks = []  # (aşama, başlangıçtan ms)
+_imports = []  # (modül, süre ms) - sadece üst düzey import'lar
+_depth = 0
+_original_import = builtins.__import__
+
+
+def _timed_import(name, globals=None, locals=None, fromlist=(), level=0):
+    """builtins.__import__ sarmalayıcısı - üst düzey yeni import'ların süresini ölçer"""
+    global _depth
+    if _depth > 0 or level != 0 or name in sys.modules:
+        return _original_import(name, globals, locals, fromlist, level)
+
+    _depth += 1
+    start = time.perf_counter()
+    try:
+        return _original_import(name, globals, locals, fromlist, level)
+    finally:
+        _depth -= 1
+        _imports.append((name, (time.perf_counter() - start) * 1000))
+
+
+def enable_from_argv(argv=None):
+    """
+    Komut satırında --startup-report varsa ölçümü başlatır.
+
+    Ana modülün en başında, diğer import'lardan önce çağrılmalıdır.
+
+    Returns:
+        bool: Rapor etkin mi
+    """
+    global _enabled
+    argv = sys.argv if argv is None else argv
+    if STARTUP_REPORT_FLAG in argv and not _enabled:
+        _enabled = True
+        builtins.__import__ = _timed_import
+        argv.remove(STARTUP_REPORT_FLAG)
+    return _enabled
+
+
+def is_enabled():
+    return _enabled
+
+
+def mark(stage):
+    """Açılış aşamasını işaretle (rapor kapalıysa hiçbir şey yapmaz)"""
+    if _enabled:
+        _marks.append((stage, (time.perf_counter() - _t0) * 1000))
+
+
+def stop_import_timing():
+    """Import kancasını kaldır (ilk boyamadan sonra ölçüm gereksiz)"""
+    if builtins.__import__ is _timed_import:
+        builtins.__import__ = _original_import
+    elif _enabled and "profiling" in sys.modules:
+        # builtins.__import__ profiling ile paylaşılır: --profile'ın ertelenmiş
+        # import kancası bizim üstümüze kurulmuş olabilir
+        sys.modules["profiling"].remove_import_hook(_timed_import, _original_import)
+
+
+def format_report(prewarm_timings=None, top=15):
+    """
+    Açılış süresi raporunu metin olarak döndürür.
+
+    Args:
+        prewarm_timings (dict): {modül: süre_ms} arka plan ön yükleme süreleri
+        top (int): Listelenecek en yavaş import sayısı
+    """
+    lines = ["=" * 60, "AÇILIŞ SÜRESİ RAPORU", "=" * 60]
+
+    lines.append("Aşamalar (başlangıçtan itibaren):")
+    for stage, at_ms in _marks:
+        lines.append(f"  {stage:<30} {at_ms:8.1f} ms")
+
+    if _imports:
+        lines.append(f"En yavaş {top} import (üst düzey, toplam süre):")
+        for name, duration in sorted(_imports, key=lambda item: item[1], reverse=True)[:top]:
+            lines.append(f"  {name:<30} {duration:8.1f} ms")
+
+    if prewarm_timings:
+        lines.append("Arka plan ön yükleme:")
+        for name, duration in prewarm_timings.items():
+            lines.append(f"  {name:<30} {duration:8.1f} ms")
+
+    lines.append("=" * 60)
+    return "\n".join(lines)
+
+
+class PrewarmWorker(QThread):
+    """Ağır modülleri arka planda içe aktaran worker thread"""
+
+    # Signaller
+    completed = pyqtSignal(dict)  # {modül: süre_ms}
+
+    def __init__(self, modules=None):
+        super().__init__()
+        self.modules = list(modules or config.PREWARM_MODULES)
+
+    def run(self):
+        """Thread ana fonksiyonu"""
+        timings = {}
+        for name in self.modules:
+            start = time.perf_counter()
+            try:
+                importlib.import_module(name)
+                timings[name] = round((time.perf_counter() - start) * 1000, 1)
+            except Exception as e:
+                # Eksik opsiyonel bağımlılık - ilk kullanımda hata olarak görünür
+                print(f"Ön yükleme hatası ({name}): {e}")
+        self.completed.emit(timings)
@@ -0,0 +1,132 @@
+"""
+Akış Metin Alıcısı - AI Yanıtı
+Gemini'den gelen parçaları biriktirip ekrana kare hızında yazar
+
+Her parça için QTextEdit'i güncellemek ve kaydırmak uzun raporlarda arayüzü
+takıltır. Bu sınıf parçaları bir listede biriktirir, QTimer ile saniyede
+birkaç kez tek seferde ekler. Markdown artımlı işlenir: tamamlanmış
+paragraflar (boş satırla biten, açık kod bloğu içinde olmayan) bir kez
+biçimlendirilip sabitlenir; yazılmakta olan son paragraf düz metin olarak
+gösterilir ve her karede sadece o kısım yenilenir. Kullanıcı yukarı
+kaydırmışsa görünüm yerinden oynatılmaz.
+"""
+
+from PyQt6.QtCore import QObject, QTimer
+from PyQt6.QtGui import QTextCursor, QTextBlockFormat, QTextCharFormat
+
+import config
+
+
+def split_complete_markdown(text):
+    """
+    Metnin biçimlendirilebilir (tamamlanmış) kısmının uzunluğunu döndürür.
+
+    Son paragraf sonu ("\\n\\n") açık bir ``` kod bloğunun içindeyse bir
+    öncekine bakılır.
+
+    Args:
+        text (str): Henüz sabitlenmemiş metin
+
+    Returns:
+        int: text[:n] sabitlenebilir, text[n:] hâlâ yazılıyor
+    """
+    cut = text.rfind("\n\n")
+    while cut != -1:
+        if text.count("```", 0, cut) % 2 == 0:
+            return cut + 2
+        cut = text.rfind("\n\n", 0, cut)
+    return 0
+
+
+class StreamingTextSink(QObject):
+    """Akış halindeki metni QTextEdit'e birleştirerek ve artımlı yazan alıcı"""
+
+    def __init__(self, text_edit, fps=None, parent=None):
+        """
+        Args:
+            text_edit (QTextEdit): Hedef metin alanı
+            fps (float): Saniyedeki en fazla ekran güncellemesi
+        """
+        super().__init__(parent)
+        self.text_edit = text_edit
+        self.fps = fps or config.AI_STREAM_FPS
+
+        self._parts = []  # Gelen tüm parçalar (tam yanıt)
+        self._pending = []  # Henüz ekrana yazılmamış parçalar
+        self._tail = ""  # Ekranda düz metin olarak duran, sabitlenmemiş kısım
+        self._stable_end = 0  # Sabitlenmiş içeriğin bittiği belge konumu
+        self.active = False
+
+        self._timer = QTimer(self)
+        self._timer.setInterval(max(1, int(1000 / self.fps)))
+        self._timer.timeout.connect(self.flush)
+
+    @property
+    def text(self):
+        """Şimdiye kadar gelen yanıtın tamamı"""
+        return "".join(self._parts)
+
+    def begin(self):
+        """Yeni akış başlat - metin alanındaki mevcut içeriğin sonuna yazılır"""
+        self._parts = []
+        self._pending = []
+        self._tail = ""
+        self._stable_end = self.text_edit.document().characterCount() - 1
+        self.active = True
+        self._timer.start()
+
+    def append(self, chunk):
+        """Parça ekle (ekrana bir sonraki karede yazılır)"""
+        self._parts.append(chunk)
+        self._pending.append(chunk)
+
+    def finish(self):
+        """Akışı bitir - kalan metni biçimlendirip sabitle"""
+        if not self.active:
+            return
+        self._timer.stop()
+        self.flush(final=True)
+        self.active = False
+
+    def flush(self, final=False):
+        """Bekleyen parçaları tek seferde ekrana yaz"""
+        if not self._pending and not final:
+            return
+
+        text = self._tail + "".join(self._pending)
+        self._pending = []
+
+        cut = len(text) if final else split_complete_markdown(text)
+        committed, self._tail = text[:cut], text[cut:]
+
+        scrollbar = self.text_edit.verticalScrollBar()
+        at_bottom = scrollbar.value() >= scrollbar.maximum() - 4
+
+        cursor = QTextCursor(self.text_edit.document())
+        cursor.beginEditBlock()
+
+        # Önceki karenin düz metin kuyruğunu kaldır
+        cursor.setPosition(self._stable_end)
+        cursor.movePosition(QTextCursor.MoveOperation.End, QTextCursor.MoveMode.KeepAnchor)
+        cursor.removeSelectedText()
+
+        if committed.strip():
+            self._new_block(cursor)
+            cursor.insertMarkdown(committed)
+            cursor.movePosition(QTextCursor.MoveOperation.End)
+            self._stable_end = cursor.position()
+
+        if self._tail:
+            self._new_block(cursor)
+            cursor.insertText(self._tail, QTextCharFormat())
+
+        cursor.endEditBlock()
+
+        if at_bottom:
+            scrollbar.setValue(scrollbar.maximum())
+
+    @staticmethod
+    def _new_block(cursor):
+        """Son blok doluysa biçimsiz yeni bir blok aç (liste/başlık devam etmesin)"""
+        if cursor.block().length() > 1:
+            cursor.insertBlock(QTextBlockFormat(), QTextCharFormat())
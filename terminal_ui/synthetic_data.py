@@ -0,0 +1,240 @@
+"""
+Sentetik Seans Verisi Üreteci
+Modül A, B ve C için bilinen parametrelerle gerçekçi ölçüm verisi üretir
+
+- Modül A: bilinen frekansta sinüzoidal tremor + gürültü, yavaş taban
+  kayması ve örnekleme zamanı jitter'ı (LDR, 0-1023 tamsayı)
+- Modül B: yaklaşma/uzaklaşma mesafe rampaları (üçgen dalga); hareket
+  seans boyunca yavaşlar ve genliği azalır (bradikinezi), sensör ara sıra
+  0.0 mm döner (pulseIn zaman aşımı)
+- Modül C: ex-Gauss dağılımlı reaksiyon süreleri, yorgunlukla doğrusal
+  artış ve seyrek dikkat kaymaları (çok yavaş yanıtlar)
+
+Tüm üreteçler vektörize numpy ile çalışır; 10 örnekten milyonlarca örneğe
+ölçeklenir. Çıktı DataLogger ile aynı CSV biçiminde yazılır (write_session)
+ya da firmware'in seri satırlarına çevrilir (serial_lines).
+
+Komut satırı:
+    python synthetic_data.py --samples 100000 --trials 20 --seed 1 --out test_data
+"""
+
+import argparse
+import os
+from datetime import datetime
+
+import numpy as np
+
+import config
+
+
+MAX_DISTANCE_MM = 300.0  # Firmware mesafe üst sınırı (MAX_DISTANCE_MM)
+MAX_TRIALS = 20  # Firmware oyun sonu (Presses: n/20)
+
+# DataLogger ile aynı başlıklar
+_HEADERS = {
+    'A': "Zaman (s),LDR Değeri",
+    'B': "Zaman (s),Mesafe (mm)",
+    'C': "Deneme #,Reaksiyon Zamanı (ms)",
+}
+_FORMATS = {
+    'A': ("%.3f", "%d"),
+    'B': ("%.3f", "%.1f"),
+    'C': ("%d", "%.1f"),
+}
+
+
+def sample_times(n, interval_ms=None, jitter_ms=2.0, start_s=1.0, rng=None):
+    """
+    Firmware örnekleme zamanları - millis() aralığı + jitter (ms çözünürlük).
+
+    Returns:
+        np.ndarray: Artan zaman damgaları (s)
+    """
+    rng = rng if rng is not None else np.random.default_rng()
+    interval = (interval_ms or config.SAMPLE_INTERVAL_MS) / 1000.0
+    steps = interval + rng.normal(0.0, jitter_ms / 1000.0, n)
+    # Jitter sırayı bozmasın
+    steps = np.maximum(steps, interval * 0.5)
+    steps[0] = 0.0
+    return np.round(start_s + np.cumsum(steps), 3)
+
+
+def tremor_signal(n, frequency_hz=4.0, amplitude=40.0, baseline=600.0, noise_std=6.0,
+                  wander=15.0, jitter_ms=2.0, interval_ms=None, seed=None):
+    """
+    Modül A - LDR üzerinden görülen tremor.
+
+    Args:
+        n (int): Örnek sayısı
+        frequency_hz (float): Tremor frekansı (örnekleme hızının yarısından küçük olmalı)
+        amplitude (float): Sinüs genliği (LDR birimi)
+        baseline (float): Ortalama LDR değeri
+        noise_std (float): Beyaz gürültü standart sapması
+        wander (float): Yavaş taban kayması genliği (ortam ışığı)
+        jitter_ms (float): Örnekleme zamanı jitter'ı
+        interval_ms (float): Örnekleme aralığı (varsayılan config.SAMPLE_INTERVAL_MS)
+        seed (int): Tekrarlanabilirlik için tohum
+
+    Returns:
+        tuple: (zaman_s, ldr) - ldr 0-1023 tamsayı
+    """
+    rng = np.random.default_rng(seed)
+    t = sample_times(n, interval_ms, jitter_ms, rng=rng)
+    phase = rng.uniform(0, 2 * np.pi)
+    ldr = (
+        baseline
+        + amplitude * np.sin(2 * np.pi * frequency_hz * t + phase)
+        + wander * np.sin(2 * np.pi * 0.05 * t)
+        + rng.normal(0.0, noise_std, n)
+    )
+    return t, np.clip(np.round(ldr), 0, 1023).astype(np.int64)
+
+
+def distance_signal(n, movement_hz=0.5, near_mm=40.0, far_mm=250.0, slowdown=0.3,
+                    amplitude_decay=0.2, noise_std=1.5, dropout_rate=0.02,
+                    jitter_ms=2.0, interval_ms=None, seed=None):
+    """
+    Modül B - el sensöre yaklaşıp uzaklaşır (doğrusal rampalar).
+
+    Args:
+        movement_hz (float): Başlangıçtaki yaklaşma/uzaklaşma döngü frekansı
+        near_mm, far_mm (float): Başlangıçtaki en yakın/en uzak mesafe
+        slowdown (float): Seans sonunda frekans kaybı oranı (0.3 = %30 yavaşlama)
+        amplitude_decay (float): Seans sonunda genlik kaybı oranı
+        dropout_rate (float): Sensörün 0.0 döndürdüğü örnek oranı
+
+    Returns:
+        tuple: (zaman_s, mesafe_mm) - 0.1 mm çözünürlük, 0-300 mm
+    """
+    rng = np.random.default_rng(seed)
+    t = sample_times(n, interval_ms, jitter_ms, rng=rng)
+    progress = (t - t[0]) / max(t[-1] - t[0], 1e-9)
+
+    # Anlık frekansın integrali - döngüler seans boyunca uzar
+    dt = np.diff(t, prepend=t[0])
+    phase = 2 * np.pi * np.cumsum(movement_hz * (1.0 - slowdown * progress) * dt)
+    triangle = (2 / np.pi) * np.arcsin(np.sin(phase))
+
+    middle = (near_mm + far_mm) / 2
+    half_range = (far_mm - near_mm) / 2 * (1.0 - amplitude_decay * progress)
+    distance = middle + half_range * triangle + rng.normal(0.0, noise_std, n)
+    distance = np.clip(distance, 0.0, MAX_DISTANCE_MM)
+
+    # Yankı gelmezse pulseIn 0 döner
+    distance[rng.random(n) < dropout_rate] = 0.0
+    return t, np.round(distance, 1)
+
+
+def reaction_times(n, base_ms=420.0, fatigue=0.25, noise_std=45.0, tail_ms=80.0,
+                   lapse_rate=0.03, min_ms=150.0, seed=None):
+    """
+    Modül C - deneme başına reaksiyon süresi.
+
+    Args:
+        n (int): Deneme sayısı
+        base_ms (float): İlk denemelerdeki tipik süre
+        fatigue (float): Son denemede ilk denemeye göre artış oranı (0.25 = %25)
+        noise_std (float): Gauss bileşeni standart sapması
+        tail_ms (float): Üstel kuyruk ortalaması (ex-Gauss)
+        lapse_rate (float): Dikkat kayması oranı (süre 1.8-3 katı)
+        min_ms (float): Fizyolojik alt sınır
+
+    Returns:
+        tuple: (deneme_no, süre_ms) - deneme 1'den başlar, süre tamsayı ms
+    """
+    rng = np.random.default_rng(seed)
+    trials = np.arange(1, n + 1)
+    drift = 1.0 + fatigue * (trials - 1) / max(n - 1, 1)
+    rt = base_ms * drift + rng.normal(0.0, noise_std, n) + rng.exponential(tail_ms, n)
+    lapses = rng.random(n) < lapse_rate
+    rt[lapses] *= rng.uniform(1.8, 3.0, lapses.sum())
+    return trials, np.round(np.maximum(rt, min_ms))
+
+
+def generate_session(samples, trials=MAX_TRIALS, tremor_hz=4.0, seed=None):
+    """
+    Üç modülün verisi (modül -> (x, y)).
+
+    Args:
+        samples (int): Modül A ve B örnek sayısı
+        trials (int): Modül C deneme sayısı
+        tremor_hz (float): Modül A tremor frekansı
+        seed (int): Tohum (modüller farklı alt tohumlar kullanır)
+    """
+    seeds = np.random.SeedSequence(seed).spawn(3)
+    return {
+        'A': tremor_signal(samples, frequency_hz=tremor_hz, seed=seeds[0]),
+        'B': distance_signal(samples, seed=seeds[1]),
+        'C': reaction_times(trials, seed=seeds[2]),
+    }
+
+
+def write_module_csv(path, module, x, y):
+    """Modül verisini DataLogger biçiminde CSV'ye yaz"""
+    data = np.column_stack((x, y))
+    np.savetxt(path, data, delimiter=',', fmt=_FORMATS[module],
+               header=_HEADERS[module], comments='', encoding='utf-8')
+
+
+def write_session(save_dir="test_data", samples=100, trials=MAX_TRIALS, tremor_hz=4.0,
+                  seed=None, session_id=None):
+    """
+    Sentetik seansı DataLogger ile aynı adlandırma ve biçimde yazar.
+
+    Returns:
+        dict: {'A': yol, 'B': yol, 'C': yol} (DataLogger.get_files ile aynı)
+    """
+    os.makedirs(save_dir, exist_ok=True)
+    session_id = session_id or datetime.now().strftime("%Y%m%d_%H%M%S")
+    files = {}
+    for module, (x, y) in generate_session(samples, trials, tremor_hz, seed).items():
+        files[module] = os.path.join(save_dir, f"module_{module}_{session_id}.csv")
+        write_module_csv(files[module], module, x, y)
+    return files
+
+
+def serial_lines(module, x, y):
+    """
+    Verileri firmware'in seri satırlarına çevirir (satır sonu olmadan).
+
+    Returns:
+        list: str satırlar - serial_protocol.parse_line ile geri okunur
+    """
+    if module == 'A':
+        # map(ldr, 0, 1023, 0, 255) - LED parlaklığı
+        return [
+            f"{ms} ms     | {ldr}      | {ldr * 255 // 1023}"
+            for ms, ldr in zip(np.round(np.asarray(x) * 1000).astype(np.int64).tolist(),
+                               np.asarray(y).astype(np.int64).tolist())
+        ]
+    if module == 'B':
+        return [
+            f"{ms} ms | {distance:.1f} mm"
+            for ms, distance in zip(np.round(np.asarray(x) * 1000).astype(np.int64).tolist(),
+                                    np.asarray(y).tolist())
+        ]
+    if module == 'C':
+        return [
+            f"Correct! Reaction Time: {int(rt)} ms | Presses: {trial}/{MAX_TRIALS}"
+            for trial, rt in zip(np.asarray(x).tolist(), np.asarray(y).tolist())
+        ]
+    raise ValueError(f"Bilinmeyen modül: {module}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Sentetik Modül A/B/C seansı üretir")
+    parser.add_argument("--samples", type=int, default=100,
+                        help="Modül A ve B örnek sayısı (varsayılan: 100 = 10 sn)")
+    parser.add_argument("--trials", type=int, default=MAX_TRIALS, help="Modül C deneme sayısı")
+    parser.add_argument("--tremor-hz", type=float, default=4.0, help="Modül A tremor frekansı")
+    parser.add_argument("--seed", type=int, help="Tekrarlanabilir çıktı için tohum")
+    parser.add_argument("--out", default="test_data", help="Kayıt klasörü")
+    args = parser.parse_args(argv)
+
+    files = write_session(args.out, args.samples, args.trials, args.tremor_hz, args.seed)
+    for module, path in files.items():
+        print(f"Modül {module}: {path}")
+
+
+if __name__ == "__main__":
+    main()
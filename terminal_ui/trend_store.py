@@ -0,0 +1,304 @@
+"""
+Trend Deposu - Hasta Bazlı Boylamsal Metrikler
+Seans indeksiyle aynı SQLite dosyasında artımlı tutulan zaman serileri
+
+Her kayıtta hastanın her metriği için bir nokta eklenir; noktanın hareketli
+ortalaması ve standart sapması (son N seans) ve hastanın metrik özeti
+(sayı, ortalama, Welford M2, min, max) o anda hesaplanıp saklanır.
+Kronolojik sırayla eklenen noktanın maliyeti pencere boyutuyla sınırlıdır;
+trend görünümü açılırken JSON okunmaz, tek bir indeksli sorgu yapılır.
+
+Geçmişe ait bir nokta sonradan gelirse ya da silinirse sadece o hastanın
+o metriğinin serisi yeniden hesaplanır.
+"""
+
+import math
+from datetime import datetime
+
+import config
+
+
+# (metrik, başlık) - metrik adları seans indeksi sütunlarıyla aynıdır
+TREND_METRICS = [
+    ('tremor_frequency_hz', 'Tremor Frekansı (Hz)'),
+    ('tremor_amplitude', 'Tremor Genliği'),
+    ('avg_velocity_mm_s', 'Ortalama Hız (mm/s)'),
+    ('velocity_slope', 'Hız Eğimi'),
+    ('avg_reaction_time_ms', 'Reaksiyon Zamanı (ms)'),
+    ('fatigue_index', 'Yorgunluk İndeksi'),
+]
+
+TREND_METRIC_NAMES = [name for name, _ in TREND_METRICS]
+
+
+def parse_timestamp(analysis_datetime):
+    """'YYYY-AA-GG SS:DD:ss' metnini epoch saniyesine çevirir (okunamazsa None)"""
+    try:
+        return datetime.strptime(analysis_datetime, "%Y-%m-%d %H:%M:%S").timestamp()
+    except (TypeError, ValueError):
+        return None
+
+
+def _is_number(value):
+    """Trende eklenebilir sonlu sayı mı (None, bool, NaN hariç)"""
+    return (
+        isinstance(value, (int, float)) and not isinstance(value, bool)
+        and math.isfinite(value)
+    )
+
+
+def _rolling(values):
+    """Pencere değerlerinin ortalaması ve örneklem standart sapması"""
+    n = len(values)
+    mean = sum(values) / n
+    if n < 2:
+        return mean, None
+    variance = sum((v - mean) ** 2 for v in values) / (n - 1)
+    return mean, math.sqrt(variance)
+
+
+class TrendStore:
+    """Hasta/metrik zaman serileri ve artımlı özetleri"""
+
+    def __init__(self, conn, window=None):
+        """
+        Args:
+            conn (sqlite3.Connection): Seans indeksinin bağlantısı
+            window (int): Hareketli istatistik penceresi (seans sayısı)
+        """
+        self.conn = conn
+        self.window = window or config.TREND_ROLLING_WINDOW
+        self._create_schema()
+
+    def _create_schema(self):
+        with self.conn:
+            self.conn.execute(
+                "CREATE TABLE IF NOT EXISTS trend_points ("
+                "patient_id TEXT NOT NULL, metric TEXT NOT NULL, ts REAL NOT NULL, "
+                "file_path TEXT NOT NULL, value REAL NOT NULL, "
+                "rolling_mean REAL, rolling_std REAL, "
+                "PRIMARY KEY (patient_id, metric, ts, file_path))"
+            )
+            self.conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_trend_points_file ON trend_points (file_path)"
+            )
+            self.conn.execute(
+                "CREATE TABLE IF NOT EXISTS patient_aggregates ("
+                "patient_id TEXT NOT NULL, metric TEXT NOT NULL, "
+                "count INTEGER NOT NULL, mean REAL NOT NULL, m2 REAL NOT NULL, "
+                "min REAL NOT NULL, max REAL NOT NULL, first_ts REAL, last_ts REAL, "
+                "PRIMARY KEY (patient_id, metric))"
+            )
+
+    # --- Yazma (çağıran işlem yönetir: with conn) ---
+
+    def add_session(self, file_path, patient_id, analysis_datetime, metrics):
+        """
+        Bir seansın metriklerini serilere ekle (aynı dosya varsa önce kaldırılır).
+
+        Args:
+            file_path (str): Sonuç dosyası (noktaların kimliği)
+            patient_id (str): Hasta kimliği ('' olabilir)
+            analysis_datetime (str): Seans zamanı
+            metrics (dict): {metrik: değer} - None/sayı olmayan değerler atlanır
+        """
+        ts = parse_timestamp(analysis_datetime)
+        if ts is None:
+            return
+
+        self.remove_session(file_path)
+        patient_id = patient_id or ""
+
+        for metric in TREND_METRIC_NAMES:
+            value = metrics.get(metric)
+            if not _is_number(value):
+                continue
+
+            last_ts = self.conn.execute(
+                "SELECT MAX(ts) FROM trend_points WHERE patient_id = ? AND metric = ?",
+                (patient_id, metric)
+            ).fetchone()[0]
+
+            if last_ts is not None and ts < last_ts:
+                # Geçmişe ait nokta - bu serinin hareketli değerleri kayar
+                self._insert_point(patient_id, metric, ts, file_path, value, None, None)
+                self._rebuild_series(patient_id, metric)
+            else:
+                self._append_point(patient_id, metric, ts, file_path, value)
+
+    def add_sessions(self, sessions):
+        """
+        Toplu ekleme (ör. klasör eşitlemesi) - noktalar sıradan bağımsız eklenir,
+        etkilenen her seri sonunda bir kez yeniden hesaplanır.
+
+        Args:
+            sessions (list): [(file_path, patient_id, analysis_datetime, metrics)]
+        """
+        affected = self._delete_points([file_path for file_path, _, _, _ in sessions])
+
+        for file_path, patient_id, analysis_datetime, metrics in sessions:
+            ts = parse_timestamp(analysis_datetime)
+            if ts is None:
+                continue
+            patient_id = patient_id or ""
+            for metric in TREND_METRIC_NAMES:
+                value = metrics.get(metric)
+                if _is_number(value):
+                    self._insert_point(patient_id, metric, ts, file_path, value, None, None)
+                    affected.add((patient_id, metric))
+
+        for patient_id, metric in affected:
+            self._rebuild_series(patient_id, metric)
+
+    def remove_session(self, file_path):
+        """Dosyanın noktalarını kaldır, etkilenen serileri yeniden hesapla"""
+        self.remove_sessions([file_path])
+
+    def remove_sessions(self, file_paths):
+        """Birden çok dosyanın noktalarını kaldır - her seri bir kez yeniden hesaplanır"""
+        for patient_id, metric in self._delete_points(file_paths):
+            self._rebuild_series(patient_id, metric)
+
+    def _delete_points(self, file_paths):
+        """Dosyaların noktalarını sil, etkilenen (hasta, metrik) kümesini döndür"""
+        affected = set()
+        for file_path in file_paths:
+            affected.update(self.conn.execute(
+                "SELECT DISTINCT patient_id, metric FROM trend_points WHERE file_path = ?",
+                (file_path,)
+            ).fetchall())
+            self.conn.execute("DELETE FROM trend_points WHERE file_path = ?", (file_path,))
+        return affected
+
+    def _insert_point(self, patient_id, metric, ts, file_path, value, mean, std):
+        self.conn.execute(
+            "INSERT OR REPLACE INTO trend_points "
+            "(patient_id, metric, ts, file_path, value, rolling_mean, rolling_std) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (patient_id, metric, ts, file_path, value, mean, std)
+        )
+
+    def _append_point(self, patient_id, metric, ts, file_path, value):
+        """Kronolojik ekleme - son N-1 nokta ve özet satırı okunur"""
+        previous = [
+            row[0] for row in self.conn.execute(
+                "SELECT value FROM trend_points WHERE patient_id = ? AND metric = ? "
+                "ORDER BY ts DESC LIMIT ?",
+                (patient_id, metric, self.window - 1)
+            )
+        ]
+        mean, std = _rolling(previous + [value])
+        self._insert_point(patient_id, metric, ts, file_path, value, mean, std)
+
+        # Welford güncellemesi
+        row = self.conn.execute(
+            "SELECT count, mean, m2, min, max, first_ts FROM patient_aggregates "
+            "WHERE patient_id = ? AND metric = ?",
+            (patient_id, metric)
+        ).fetchone()
+        if row is None:
+            count, agg_mean, m2, low, high, first_ts = 0, 0.0, 0.0, value, value, ts
+        else:
+            count, agg_mean, m2, low, high, first_ts = row
+
+        count += 1
+        delta = value - agg_mean
+        agg_mean += delta / count
+        m2 += delta * (value - agg_mean)
+        self._write_aggregate(
+            patient_id, metric, count, agg_mean, m2,
+            min(low, value), max(high, value), first_ts, ts
+        )
+
+    def _rebuild_series(self, patient_id, metric):
+        """Serinin hareketli değerlerini ve özetini baştan hesapla"""
+        points = self.conn.execute(
+            "SELECT ts, file_path, value FROM trend_points "
+            "WHERE patient_id = ? AND metric = ? ORDER BY ts",
+            (patient_id, metric)
+        ).fetchall()
+
+        if not points:
+            self.conn.execute(
+                "DELETE FROM patient_aggregates WHERE patient_id = ? AND metric = ?",
+                (patient_id, metric)
+            )
+            return
+
+        values = [value for _, _, value in points]
+        updates = []
+        for i, (ts, file_path, value) in enumerate(points):
+            mean, std = _rolling(values[max(0, i - self.window + 1):i + 1])
+            updates.append((mean, std, patient_id, metric, ts, file_path))
+        self.conn.executemany(
+            "UPDATE trend_points SET rolling_mean = ?, rolling_std = ? "
+            "WHERE patient_id = ? AND metric = ? AND ts = ? AND file_path = ?",
+            updates
+        )
+
+        count = len(values)
+        mean = sum(values) / count
+        m2 = sum((v - mean) ** 2 for v in values)
+        self._write_aggregate(
+            patient_id, metric, count, mean, m2,
+            min(values), max(values), points[0][0], points[-1][0]
+        )
+
+    def _write_aggregate(self, patient_id, metric, count, mean, m2, low, high, first_ts, last_ts):
+        self.conn.execute(
+            "INSERT OR REPLACE INTO patient_aggregates "
+            "(patient_id, metric, count, mean, m2, min, max, first_ts, last_ts) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (patient_id, metric, count, mean, m2, low, high, first_ts, last_ts)
+        )
+
+    # --- Okuma ---
+
+    def patients(self):
+        """Trend verisi olan hastalar (en son seansı en yeni olan önce)"""
+        return [
+            row[0] for row in self.conn.execute(
+                "SELECT patient_id FROM patient_aggregates "
+                "GROUP BY patient_id ORDER BY MAX(last_ts) DESC"
+            )
+        ]
+
+    def series(self, patient_id, metric):
+        """
+        Hastanın metrik serisi
+
+        Returns:
+            dict: {'ts': [...], 'value': [...], 'rolling_mean': [...], 'rolling_std': [...]}
+        """
+        rows = self.conn.execute(
+            "SELECT ts, value, rolling_mean, rolling_std FROM trend_points "
+            "WHERE patient_id = ? AND metric = ? ORDER BY ts",
+            (patient_id, metric)
+        ).fetchall()
+        keys = ('ts', 'value', 'rolling_mean', 'rolling_std')
+        return {key: [row[i] for row in rows] for i, key in enumerate(keys)}
+
+    def summary(self, patient_id, metric):
+        """
+        Hastanın metrik özeti
+
+        Returns:
+            dict: {'count', 'mean', 'std', 'min', 'max', 'first_ts', 'last_ts'} ya da None
+        """
+        row = self.conn.execute(
+            "SELECT count, mean, m2, min, max, first_ts, last_ts FROM patient_aggregates "
+            "WHERE patient_id = ? AND metric = ?",
+            (patient_id, metric)
+        ).fetchone()
+        if row is None:
+            return None
+        count, mean, m2, low, high, first_ts, last_ts = row
+        return {
+            'count': count,
+            'mean': mean,
+            'std': math.sqrt(m2 / (count - 1)) if count > 1 else None,
+            'min': low,
+            'max': high,
+            'first_ts': first_ts,
+            'last_ts': last_ts,
+        }